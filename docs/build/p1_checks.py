@@ -6,12 +6,15 @@ Runs, in order:
 1) Ruff (lint)
 2) Black (format check)
 3) Pytest (tests)
+4) Runtime benchmarks vs. baseline (optional: --bench or P1_BENCH=1)
 
 Resolves tools robustly across PATH / pipx / venv installs.
 """
 
 from __future__ import annotations
 
+import argparse
+import os
 import shutil
 import subprocess
 import sys
@@ -51,6 +54,15 @@ def _run(cmd: list[str], cwd: Path) -> int:
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Phase 1 canonical checks.")
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        default=os.environ.get("P1_BENCH") == "1",
+        help="Also run runtime benchmarks and fail on regression vs. baseline.",
+    )
+    args = parser.parse_args()
+
     repo_root = _repo_root_from_this_file()
 
     ruff = _resolve_tool("ruff") + ["check", "."]
@@ -59,6 +71,19 @@ def main() -> int:
 
     steps = [ruff, black, pytest]
 
+    # Optional: benchmarks are timing-sensitive, so they are opt-in rather than
+    # part of the default gate.
+    if args.bench:
+        steps.append(
+            [
+                sys.executable,
+                "docs/build/runtime_bench.py",
+                "--compare",
+                "--repeat",
+                "3",
+            ]
+        )
+
     for cmd in steps:
         rc = _run(cmd, cwd=repo_root)
 
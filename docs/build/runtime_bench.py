@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Runtime hot-path benchmarks with JSON regression baselines.
+
+Benchmarks:
+- heartbeat.ticks_per_sec            HeartbeatLoop with no-op hooks
+- logger.records_per_sec             RuntimeLogger._emit to a null stream
+- envelope.wrap_exception_us         wrap_exception with a deep traceback
+- ingress.terminal_commands_per_sec  TerminalIngressAdapter from piped stdin
+- settings.resolve_cold_ms           first resolve in a fresh interpreter
+- settings.resolve_warm_us           repeated resolve in-process
+
+Usage:
+  python3 docs/build/runtime_bench.py                   # run + print JSON
+  python3 docs/build/runtime_bench.py --save-baseline   # (re)write baseline
+  python3 docs/build/runtime_bench.py --compare         # fail on regression
+
+Each benchmark runs --repeat times and keeps the best value, which is the
+least noisy estimator for a micro-benchmark on a shared machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+DEFAULT_THRESHOLD = 0.30
+
+
+def _repo_root_from_this_file() -> Path:
+    # <repo_root>/docs/build/runtime_bench.py
+    return Path(__file__).resolve().parents[2]
+
+
+DEFAULT_BASELINE = (
+    _repo_root_from_this_file() / "docs/build/runtime_bench.baseline.json"
+)
+
+
+def _ensure_lillycore_importable(repo_root: Path) -> None:
+    """
+    Support both layouts (see run_phase1.sh): repo root IS the `lillycore`
+    package, or contains it. If neither resolves, register the repo root as
+    the `lillycore` package explicitly.
+    """
+    for candidate in (repo_root.parent, repo_root):
+        if str(candidate) not in sys.path:
+            sys.path.insert(0, str(candidate))
+    if importlib.util.find_spec("lillycore") is not None:
+        return
+
+    spec = importlib.util.spec_from_file_location(
+        "lillycore",
+        repo_root / "__init__.py",
+        submodule_search_locations=[str(repo_root)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["lillycore"] = module
+    spec.loader.exec_module(module)
+
+
+# ---- benchmarks ----------------------------------------------------------
+
+
+def bench_heartbeat_ticks(n: int = 100_000) -> float:
+    from lillycore.runtime.heartbeat import HeartbeatLoop
+
+    loop = None
+
+    def on_tick():
+        if loop.tick_id >= n:
+            loop.request_stop()
+
+    class _NoopLogger:
+        def tick(self, **fields):
+            pass
+
+    loop = HeartbeatLoop(on_tick=on_tick, logger=_NoopLogger())
+    started = time.perf_counter()
+    loop.run()
+    return n / (time.perf_counter() - started)
+
+
+class _NullStream(io.TextIOBase):
+    def write(self, s):
+        return len(s)
+
+    def flush(self):
+        pass
+
+
+def bench_logger_emit(n: int = 50_000) -> float:
+    from lillycore.runtime.runtime_logger import RuntimeLogger
+
+    logger = RuntimeLogger(stream=_NullStream())
+    fields = {"component": "bench", "tick_id": 1, "ratio": 0.5, "tags": ["a", "b"]}
+    started = time.perf_counter()
+    for _ in range(n):
+        logger._emit("INFO", "bench.event", fields)
+    return n / (time.perf_counter() - started)
+
+
+def bench_wrap_exception(n: int = 5_000, depth: int = 50) -> float:
+    from lillycore.runtime.error_envelopes import wrap_exception
+
+    def recurse(level):
+        if level == 0:
+            raise ValueError("bench")
+        recurse(level - 1)
+
+    try:
+        recurse(depth)
+    except ValueError as exc:
+        error = exc
+
+    started = time.perf_counter()
+    for _ in range(n):
+        wrap_exception(error, where="bench")
+    return (time.perf_counter() - started) / n * 1e6
+
+
+def bench_terminal_ingress(n: int = 50_000) -> float:
+    from lillycore.runtime.terminal_ingress import TerminalIngressAdapter
+
+    r, w = os.pipe()
+    payload = b"".join(b"cmd %d\n" % i for i in range(n))
+
+    def _writer():
+        with os.fdopen(w, "wb") as f:
+            f.write(payload)
+
+    received = 0
+    done = threading.Event()
+
+    def on_command(cmd):
+        nonlocal received
+        if cmd == "EOF":
+            done.set()
+            return
+        received += 1
+
+    old_stdin, old_stdout = sys.stdin, sys.stdout
+    sys.stdin = os.fdopen(r, "r")
+    sys.stdout = open(os.devnull, "w")
+    try:
+        adapter = TerminalIngressAdapter(on_command=on_command, prompt="> ")
+        started = time.perf_counter()
+        threading.Thread(target=_writer, daemon=True).start()
+        adapter.start()
+        while not done.is_set():
+            adapter.poll()
+            time.sleep(0.0005)
+        elapsed = time.perf_counter() - started
+    finally:
+        sys.stdin.close()
+        sys.stdout.close()
+        sys.stdin, sys.stdout = old_stdin, old_stdout
+
+    return received / elapsed
+
+
+def bench_settings_cold() -> float:
+    repo_root = _repo_root_from_this_file()
+    code = (
+        "import sys, time; sys.path[:0] = [sys.argv[1]];"
+        "t = time.perf_counter();"
+        "import runtime_bench as b; b._ensure_lillycore_importable(b._repo_root_from_this_file());"
+        "from lillycore.runtime.runtime_system_settings import resolve_runtime_system_settings;"
+        "resolve_runtime_system_settings();"
+        "print((time.perf_counter() - t) * 1000.0)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code, str(Path(__file__).resolve().parent)],
+        cwd=str(repo_root),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def bench_settings_warm(n: int = 2_000) -> float:
+    from lillycore.runtime.runtime_system_settings import (
+        resolve_runtime_system_settings,
+    )
+
+    resolve_runtime_system_settings()
+    started = time.perf_counter()
+    for _ in range(n):
+        resolve_runtime_system_settings()
+    return (time.perf_counter() - started) / n * 1e6
+
+
+# name -> (fn, unit, higher_is_better)
+BENCHMARKS: Dict[str, tuple] = {
+    "heartbeat.ticks_per_sec": (bench_heartbeat_ticks, "ticks/s", True),
+    "logger.records_per_sec": (bench_logger_emit, "records/s", True),
+    "envelope.wrap_exception_us": (bench_wrap_exception, "us/call", False),
+    "ingress.terminal_commands_per_sec": (bench_terminal_ingress, "cmds/s", True),
+    "settings.resolve_cold_ms": (bench_settings_cold, "ms", False),
+    "settings.resolve_warm_us": (bench_settings_warm, "us/call", False),
+}
+
+
+def run_benchmarks(repeat: int, only: list[str] | None = None) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name, (fn, unit, higher_is_better) in BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        values = [fn() for _ in range(max(1, repeat))]
+        best: Callable = max if higher_is_better else min
+        results[name] = {
+            "value": best(values),
+            "unit": unit,
+            "higher_is_better": higher_is_better,
+        }
+        print(f"{name}: {results[name]['value']:.3f} {unit}", flush=True)
+    return results
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    Returns the names of regressed metrics (empty list = PASS).
+    Metrics missing from either side are reported but never fail.
+    """
+    regressions = []
+    for name, base in baseline.get("metrics", {}).items():
+        cur = results.get(name)
+        if cur is None:
+            print(f"NOTE: {name} missing from current run", flush=True)
+            continue
+
+        b, c = float(base["value"]), float(cur["value"])
+        if b <= 0:
+            continue
+        if base.get("higher_is_better", True):
+            change = (b - c) / b
+        else:
+            change = (c - b) / b
+
+        status = "REGRESSION" if change > threshold else "ok"
+        print(f"{status:>10}  {name}: baseline={b:.3f} current={c:.3f}", flush=True)
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--only", action="append", help="Run only this benchmark name.")
+    p.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    p.add_argument("--save-baseline", action="store_true")
+    p.add_argument("--compare", action="store_true")
+    p.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative regression before failing (default 0.30 = 30%%).",
+    )
+    p.add_argument("--output", type=Path, help="Write current results JSON here.")
+    args = p.parse_args(argv)
+
+    _ensure_lillycore_importable(_repo_root_from_this_file())
+
+    results = run_benchmarks(args.repeat, args.only)
+    doc = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "metrics": results,
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written: {args.baseline}", flush=True)
+        return 0
+
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"ERROR: baseline not found: {args.baseline}", file=sys.stderr)
+            return 2
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"FAIL: {len(regressions)} metric(s) regressed", flush=True)
+            return 1
+        print("PASS: no regressions past threshold", flush=True)
+        return 0
+
+    print(json.dumps(doc, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
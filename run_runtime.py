@@ -1,11 +1,23 @@
 # run_runtime.py
 
 import argparse
+import functools
+import threading
 
+from lillycore.runtime.clock import VirtualClock
 from lillycore.runtime.interactive_runner import run_interactive
 from lillycore.runtime.terminal_ingress import TerminalIngressAdapter
 from lillycore.runtime.heartbeat import RuntimeStopRequested
 from lillycore.runtime.error_envelopes import wrap_exception
+from lillycore.runtime.envelope_ring import EnvelopeRingBuffer
+from lillycore.runtime.supervisor import RuntimeSupervisor
+from lillycore.runtime.command_router import CommandRouter, ParsedCommand
+from lillycore.runtime.fair_scheduler import FairShareScheduler
+from lillycore.runtime.handler_pool import HandlerPool, OffThreadIngress
+from lillycore.runtime.multiplex_ingress import MultiplexIngress
+from lillycore.runtime.replay_ingress import REPLAY_MODES, ReplayIngressAdapter
+from lillycore.runtime.socket_ingress import SocketIngressAdapter
+from lillycore.runtime.runtime_logger import LOG_LEVELS, evaluate_lazy
 
 from lillycore.runtime.runtime_system_settings import (
     resolve_runtime_system_settings,
@@ -26,13 +38,26 @@ class DummyLogger:
 
     # P1.1.5 can later formalise this:
     # Updated to accept optional metadata without breaking older callers.
+    # Envelope sinks run on dispatcher threads: one print per event, never
+    # interleaved.
+    _envelope_lock = threading.Lock()
+
     def envelope(self, env, **kwargs):
-        if kwargs:
-            print(
-                "ENVELOPE_EVENT:", {"envelope": env, "meta": kwargs}
-            )  # opaque object + meta
-        else:
-            print("ENVELOPE_EVENT:", env)  # opaque object
+        with self._envelope_lock:
+            if kwargs:
+                print(
+                    "ENVELOPE_EVENT:", {"envelope": env, "meta": kwargs}
+                )  # opaque object + meta
+            else:
+                print("ENVELOPE_EVENT:", env)  # opaque object
+
+
+def _lazy(args):
+    # Zero-argument callables (not classes) are evaluated only when emitted;
+    # a failing one is logged as an error marker, never raised.
+    return tuple(
+        evaluate_lazy(a) if callable(a) and not isinstance(a, type) else a for a in args
+    )
 
 
 class Phase1RuntimeLogger:
@@ -41,10 +66,13 @@ class Phase1RuntimeLogger:
     - Default sink is console/stdout via DummyLogger.
     - Adds lifecycle + bounded heartbeat + envelope event helpers.
     - Heartbeat is bounded and OFF by default to avoid spam.
+    - debug/info/warning honour the `log_level` setting; is_enabled(level)
+      is a precomputed check and callable args are evaluated lazily.
     """
 
     def __init__(self, base_logger: DummyLogger):
         self._base = base_logger
+        self._set_level("INFO")
 
         # Heartbeat logging must be bounded; avoid spam by default (P1.1.5).
         self._heartbeat_enabled = False
@@ -69,6 +97,8 @@ class Phase1RuntimeLogger:
                 self._heartbeat_every_n_ticks = int(
                     src.get("heartbeat_every_n_ticks", self._heartbeat_every_n_ticks)
                 )
+                if "log_level" in src:
+                    self._set_level(src["log_level"])
 
             else:
                 # Object-style: only apply if attributes exist.
@@ -80,6 +110,8 @@ class Phase1RuntimeLogger:
                     self._heartbeat_every_n_ticks = int(
                         getattr(settings, "heartbeat_every_n_ticks")
                     )
+                if hasattr(settings, "log_level"):
+                    self._set_level(getattr(settings, "log_level"))
         except Exception:
             # Settings must not break logging in Phase 1.
             pass
@@ -108,7 +140,7 @@ class Phase1RuntimeLogger:
             return
 
         # Keep output simple and Phase 1-friendly.
-        merged = dict(fields or {})
+        merged = {k: (v() if callable(v) else v) for k, v in (fields or {}).items()}
         merged["tick_id"] = tick_id
         merged["every_n_ticks"] = n
         self._base.info("HEARTBEAT %s", merged)
@@ -118,14 +150,48 @@ class Phase1RuntimeLogger:
         # Treat envelope as opaque; do not inspect schema.
         self._base.envelope(env, **(fields or {}))
 
+    def envelope_summary(self, **fields):
+        # Repeats of an envelope already logged in full (EnvelopeAggregator).
+        self._base.warning("ENVELOPE_SUMMARY %s", fields)
+
+    # ---- level gating ----
+    def _set_level(self, level):
+        # Resolved once per configuration, not per call.
+        self._threshold = LOG_LEVELS.get(str(level).upper(), 20)
+        self._enabled = {
+            name: rank >= self._threshold for name, rank in LOG_LEVELS.items()
+        }
+
+    def is_enabled(self, level):
+        enabled = self._enabled.get(level)
+        if enabled is None:
+            enabled = LOG_LEVELS.get(str(level).upper(), 20) >= self._threshold
+        return enabled
+
     # ---- pass-through for existing callsites ----
-    def info(self, msg, *args):
-        self._base.info(msg, *args)
+    def debug(self, msg, *args):
+        if self._enabled["DEBUG"]:
+            self._base.info("DEBUG: " + msg, *_lazy(args))
+
+    # Keyword fields (RuntimeLogger-style callers such as RuntimeSupervisor)
+    # are printed after the message.
+    def info(self, msg, *args, **fields):
+        if self._enabled["INFO"]:
+            if fields:
+                self._base.info("%s %s", msg % _lazy(args) if args else msg, fields)
+            else:
+                self._base.info(msg, *_lazy(args))
 
-    def warning(self, msg, *args):
-        self._base.warning(msg, *args)
+    def warning(self, msg, *args, **fields):
+        if self._enabled["WARNING"]:
+            if fields:
+                self._base.warning("%s %s", msg % _lazy(args) if args else msg, fields)
+            else:
+                self._base.warning(msg, *_lazy(args))
 
-    def error(self, msg, exc_info=None):
+    def error(self, msg, exc_info=None, **fields):
+        if fields:
+            msg = f"{msg} {fields}"
         self._base.error(msg, exc_info=exc_info)
 
     def finalize(self, **fields):
@@ -148,8 +214,9 @@ def load_settings(logger):
 
 
 # Use a Phase 1 unified logger wrapper (P1.1.5) so heartbeat.py hook calls work.
+# Module-level state is import-safe: spawned worker processes re-import this
+# module to resolve _noop_handler; everything else runs from main().
 logger = Phase1RuntimeLogger(DummyLogger())
-settings = load_settings(logger)
 
 
 def envelope_sink(env):
@@ -160,17 +227,67 @@ def envelope_sink(env):
         logger.error("Envelope event (no logger.envelope)", exc_info=None)
 
 
-def _noop_handler(cmd: str) -> None:
-    print(f"[ingress] {cmd}")
+# Recent envelopes, queryable at runtime with the "errors" command.
+envelopes = EnvelopeRingBuffer(capacity=1024)
+
+_ERRORS_FILTERS = {"where": "where", "severity": "severity", "type": "exc_type"}
+
+
+def _errors(cmd: ParsedCommand) -> None:
+    # errors [N] [where=...] [severity=...] [type=...]: last N matches.
+    limit = 10
+    filters = {}
+    for arg in cmd.args:
+        key, sep, value = arg.partition("=")
+        if not sep:
+            limit = int(arg)
+        elif key in _ERRORS_FILTERS:
+            filters[_ERRORS_FILTERS[key]] = value
+        else:
+            raise ValueError(f"Unknown errors filter: {key}")
+
+    found = envelopes.query(limit=limit, **filters)
+    print(f"[errors] {len(found)} shown, {len(envelopes)} recorded")
+    for env in found:
+        print(f"  {env.ts:.3f} {env.severity} {env.where} {env.exc_repr}")
+
 
+def _echo(cmd: ParsedCommand) -> None:
+    # Unrouted input is only echoed (Phase 1).
+    pass
+
+
+def _boom(cmd: ParsedCommand) -> None:
     # forced negative path for P1.1.4 proof:
-    if cmd.strip().lower() == "boom":
-        raise ValueError("forced error for envelope proof")
+    raise ValueError("forced error for envelope proof")
+
 
+def _eof(cmd: ParsedCommand) -> None:
     # EOF may be treated as stop (P1.1.6):
     # terminal_ingress passes the literal string "EOF" to the handler.
-    if cmd.strip().upper() == "EOF":
-        raise RuntimeStopRequested()
+    raise RuntimeStopRequested()
+
+
+# Exact verbs only: "b"/"e" must not trigger the proof commands by prefix.
+router = CommandRouter(default=_echo, prefix_matching=False)
+# Proof verbs take no arguments: "boom extra" is only echoed, as before.
+router.register(
+    "boom", _boom, help="raise a forced error (envelope proof)", takes_args=False
+)
+router.register("eof", _eof, help="stop the runtime (end of input)", takes_args=False)
+router.register("errors", _errors, help="errors [N] [where=..] [severity=..] [type=..]")
+
+
+def _noop_handler(cmd: str) -> None:
+    print(f"[ingress] {cmd}")
+    router(cmd)
+
+
+def _worker_envelopes():
+    # Runs in each worker process: its loop feeds that process's ring, which
+    # is the one the routed "errors" command queries there.
+    return envelopes
+
 
 def parse_args():
     p = argparse.ArgumentParser()
@@ -185,33 +302,211 @@ def parse_args():
         default=0,
         help="Number of ticks to run in deterministic mode (required if --deterministic).",
     )
+    p.add_argument(
+        "--fast-forward",
+        action="store_true",
+        help="Deterministic mode only: run on a virtual clock (no real sleeping; reproducible timestamps).",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Interactive mode only: route commands to N sharded runtime worker processes.",
+    )
+    p.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="Read commands from a recorded .jsonl/.txt file instead of the terminal.",
+    )
+    p.add_argument(
+        "--replay-mode",
+        choices=sorted(REPLAY_MODES),
+        default="asap",
+        help="Replay pacing: asap, recorded (honour 'ts' deltas) or scaled (--replay-speed).",
+    )
+    p.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Speed multiplier for --replay-mode scaled (2.0 = twice as fast).",
+    )
+    p.add_argument(
+        "--replay-mmap",
+        action="store_true",
+        help="Memory-map the replay file instead of buffered reads.",
+    )
+    p.add_argument(
+        "--handler-threads",
+        type=int,
+        default=0,
+        help="Run command handlers on N worker threads (results/errors return on the next tick).",
+    )
+    p.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Also accept commands on a Unix-domain socket (one per line, acked).",
+    )
+    p.add_argument(
+        "--ingress-budget",
+        type=int,
+        default=None,
+        help="With several ingress sources: max commands per poll, shared by weight.",
+    )
+    p.add_argument(
+        "--fair-share",
+        action="store_true",
+        help="Queue commands per session (one per socket connection); round-robin per tick.",
+    )
     return p.parse_args()
 
 
-args = parse_args()
+def _setting(settings, key, default):
+    if isinstance(settings, dict):
+        return settings.get(key, default)
+    return getattr(settings, key, default)
+
+
+def _make_ingress(args, handler, ingress_kwargs, scheduler=None):
+    # With a fair-share scheduler, each source submits to its own session
+    # (socket: one per connection) instead of calling the handler directly.
+    primary_handler = handler
+    if scheduler is not None:
+        primary_handler = scheduler.for_session("replay" if args.replay else "terminal")
+
+    if args.replay:
+        # Achieved cmds/s is reported with the ingress stats at finalize.
+        primary = ReplayIngressAdapter(
+            args.replay,
+            on_command=primary_handler,
+            mode=args.replay_mode,
+            speed=args.replay_speed,
+            use_mmap=args.replay_mmap,
+        )
+    else:
+        primary = TerminalIngressAdapter(on_command=primary_handler, **ingress_kwargs)
 
-if args.deterministic and args.ticks <= 0:
-    raise SystemExit("ERROR: --deterministic requires --ticks N (N > 0)")
+    if not args.socket:
+        return primary
 
-ingress = None if args.deterministic else TerminalIngressAdapter(on_command=_noop_handler, prompt="lilly> ")
+    # Several sources: the interactive terminal is the control source, so a
+    # typed stop is serviced ahead of bulk socket/replay input.
+    mux = MultiplexIngress(budget_per_poll=args.ingress_budget)
+    if args.replay:
+        mux.add_source("replay", primary)
+    else:
+        mux.add_source("terminal", primary, control=True)
+    socket_handler = handler
+    if scheduler is not None:
+        # "ok" then acknowledges queueing; handler errors become envelopes.
+        socket_handler = scheduler.tagged(lambda: socket_ingress.current_session)
+    socket_ingress = SocketIngressAdapter(socket_handler, path=args.socket)
+    mux.add_source("socket", socket_ingress)
+    return mux
+
+
+def _make_threaded_ingress(args, handler, ingress_kwargs):
+    if args.handler_threads <= 0:
+        return _make_ingress(args, handler, ingress_kwargs)
+    # Handlers run off the loop thread; the tick cadence no longer depends
+    # on handler latency.
+    pool = HandlerPool(handler, max_workers=args.handler_threads)
+    return OffThreadIngress(_make_ingress(args, pool, ingress_kwargs), pool)
+
+
+def main():
+    args = parse_args()
+
+    if args.deterministic and args.ticks <= 0:
+        raise SystemExit("ERROR: --deterministic requires --ticks N (N > 0)")
+
+    if args.fast_forward and not args.deterministic:
+        raise SystemExit("ERROR: --fast-forward requires --deterministic")
+
+    if args.workers and args.deterministic:
+        raise SystemExit("ERROR: --workers is not supported with --deterministic")
+
+    if args.replay and args.deterministic:
+        raise SystemExit("ERROR: --replay is not supported with --deterministic")
+
+    if args.fair_share and (args.workers or args.handler_threads or args.deterministic):
+        raise SystemExit(
+            "ERROR: --fair-share is not supported with --workers, --handler-threads "
+            "or --deterministic"
+        )
+
+    settings = load_settings(logger)
+
+    # Virtual clock: ticks advance time instantly; envelopes share the same clock.
+    clock = VirtualClock() if args.fast_forward else None
+
+    tick_interval_sec = _setting(settings, "tick_interval_ms", 500) / 1000.0
+
+    # Ingress backpressure knobs (runtime_system_settings).
+    ingress_kwargs = dict(
+        prompt="lilly> ",
+        queue_capacity=_setting(settings, "ingress_queue_capacity", 0),
+        overflow_policy=_setting(settings, "ingress_overflow_policy", "block"),
+    )
+
+    supervisor = None
+    scheduler = None
+    if args.workers > 0:
+        # Sharded mode: this process only reads the terminal and routes commands;
+        # each worker runs its own loop with _noop_handler. Worker events go
+        # through the same logger as the parent's own output.
+        supervisor = RuntimeSupervisor(
+            args.workers,
+            _noop_handler,
+            logger=logger,
+            settings_for=lambda shard: settings,
+            tick_interval_sec=tick_interval_sec,
+            envelope_buffer_factory=_worker_envelopes,
+        )
+
+        def _route_handler(cmd: str) -> None:
+            if cmd.strip().upper() == "EOF":
+                raise RuntimeStopRequested()
+            supervisor.route(cmd)
+
+        ingress = _make_ingress(args, _route_handler, ingress_kwargs)
+    elif args.deterministic:
+        ingress = None
+    elif args.fair_share:
+        # Per-session queues drained on the loop thread (see run_interactive).
+        scheduler = FairShareScheduler(_noop_handler)
+        ingress = _make_ingress(args, _noop_handler, ingress_kwargs, scheduler)
+    else:
+        ingress = _make_threaded_ingress(args, _noop_handler, ingress_kwargs)
+
+    loop = run_interactive(
+        settings_loader=lambda: settings,
+        logger=logger,
+        ingress_adapter=ingress,
+        envelope_factory=(
+            functools.partial(wrap_exception, clock=clock) if clock else wrap_exception
+        ),
+        envelope_sink=envelope_sink,
+        envelope_buffer=envelopes,
+        tick_interval_sec=tick_interval_sec,
+        max_ticks=(args.ticks if args.deterministic else None),
+        clock=clock,
+        session_scheduler=scheduler,
+    )
+
+    if supervisor is not None:
+        loop.register_task(supervisor.poll, phase="post_tick", name="supervisor")
+        supervisor.start()
+
+    try:
+        loop.run()
+    except KeyboardInterrupt:
+        loop.request_stop()
+    finally:
+        if supervisor is not None:
+            supervisor.stop()
+        elif ingress is not None:
+            logger.info("COMMAND_STATS %s", router.stats())
 
-loop = run_interactive(
-    settings_loader=lambda: settings,
-    logger=logger,
-    ingress_adapter=ingress,
-    envelope_factory=wrap_exception,
-    envelope_sink=envelope_sink,
-    tick_interval_sec=(
-        (settings.get("tick_interval_ms", 500) / 1000.0)
-        if isinstance(settings, dict)
-        else (getattr(settings, "tick_interval_ms", 500) / 1000.0)
-    ),
-    max_ticks=(
-        args.ticks if args.deterministic else None
-    ),
-)
 
-try:
-    loop.run()
-except KeyboardInterrupt:
-    loop.request_stop()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+# lillycore/runtime/async_heartbeat.py
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Optional, Set
+
+from lillycore.runtime.heartbeat import HeartbeatLoop, RuntimeStopRequested
+from lillycore.runtime.tick_pipeline import (
+    PHASE_POST_TICK,
+    PHASE_PRE_TICK,
+    PHASE_TICK,
+)
+from lillycore.runtime.tick_scheduler import TickScheduler
+
+
+async def _maybe_await(result: Any) -> Any:
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+class AsyncHeartbeatLoop(HeartbeatLoop):
+    """
+    Asyncio-native heartbeat loop.
+
+    Same lifecycle, stop, envelope and logger-hook semantics as HeartbeatLoop,
+    but every integration point may be sync or async:
+    - on_start / on_tick / on_stop may be coroutine functions
+    - ingress.poll() may return an awaitable
+    - envelope_sink may return an awaitable
+    - logger finalization hooks may return an awaitable
+    - registered tick tasks (register_task) and shutdown hooks
+      (register_shutdown) may be coroutine functions
+
+    Tick work that should overlap with later ticks can be handed to spawn();
+    its failures are enveloped like any other tick error.
+
+    run() stays a blocking call (asyncio.run) so call sites do not change;
+    callers already inside an event loop use `await run_async()`.
+    """
+
+    def __init__(self, *args, shutdown_grace_sec: float = 5.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._shutdown_grace_sec = shutdown_grace_sec
+        self._pending: Set[asyncio.Task] = set()
+
+        # Bound to the running event loop in run_async(); wake() may be called
+        # from ingress reader threads, so it goes through call_soon_threadsafe.
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._aio_wakeup: Optional[asyncio.Event] = None
+
+    # ---- control surface -------------------------------------------------
+
+    def spawn(self, aw: Awaitable[Any], *, where: str = "runtime.task") -> asyncio.Task:
+        """
+        Run an awaitable alongside the tick loop.
+
+        Must be called from the loop's event loop (e.g. inside on_tick).
+        """
+        task = asyncio.ensure_future(aw)
+        self._pending.add(task)
+        task.add_done_callback(lambda t: self._task_done(t, where))
+        return task
+
+    def wake(self) -> None:
+        super().wake()
+        aio_loop = self._aio_loop
+        if aio_loop is None or self._aio_wakeup is None:
+            return
+        try:
+            aio_loop.call_soon_threadsafe(self._aio_wakeup.set)
+        except RuntimeError:
+            # Event loop already closed; nothing left to wake.
+            pass
+
+    @property
+    def event_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """The event loop run_async() is running on (None when not running)."""
+        return self._aio_loop
+
+    # ---- lifecycle -------------------------------------------------------
+
+    def run(self):
+        return asyncio.run(self.run_async())
+
+    async def run_async(self):
+        self._aio_loop = asyncio.get_running_loop()
+        self._aio_wakeup = asyncio.Event()
+        try:
+            self._lifecycle_start()
+
+            if self._on_start:
+                await _maybe_await(self._on_start())
+
+            scheduler = self._scheduler
+            if scheduler is not None:
+                scheduler.start()
+
+            while not self._stop_requested:
+
+                if scheduler is not None:
+                    await self._idle_until_due_async(scheduler)
+                    if self._stop_requested:
+                        break
+                else:
+                    # Always yield so spawned tasks make progress between ticks.
+                    await asyncio.sleep(0)
+
+                await self._poll_ingress_async()
+                if self._stop_requested:
+                    continue
+
+                await self._tick_runner()
+
+        finally:
+            self._lifecycle_stop()
+
+            if self._on_stop:
+                try:
+                    self._check_forced_shutdown_error()
+                    await _maybe_await(self._on_stop())
+                except RuntimeStopRequested:
+                    # Control signal: MUST NOT be wrapped as an envelope.
+                    pass
+                except Exception as exc:
+                    # Shutdown-time errors MUST be enveloped and logged (P1.1.6).
+                    self._propagate_error(exc, where="runtime.shutdown.on_stop")
+
+            self._shutdown_offloader()
+            for name, hook in self._shutdown_hooks:
+                try:
+                    await _maybe_await(hook())
+                except Exception as exc:
+                    self._propagate_error(exc, where=f"runtime.shutdown.{name}")
+
+            # Spawned tasks and async envelope sinks must land before the
+            # logger is finalized, otherwise their records are lost.
+            await self._drain_pending()
+
+            try:
+                await _maybe_await(self._finalize_logger())
+            except Exception as exc:
+                self._propagate_error(exc, where="runtime.shutdown.logger")
+                await self._drain_pending()
+
+            self._aio_loop = None
+            self._aio_wakeup = None
+
+    # ---- internal --------------------------------------------------------
+
+    async def _run_tick(self) -> None:
+        self._tick_id += 1
+        scheduler = self._scheduler
+        if scheduler is not None:
+            scheduler.begin_tick()
+        if self._hooks.logger_tick is not None:
+            self._log_tick()
+
+        active = self._pipeline.active
+        run_phase = self._run_phase
+        try:
+            if active[PHASE_PRE_TICK]:
+                await run_phase(PHASE_PRE_TICK, self._propagate_error)
+
+            if self._on_tick:
+                try:
+                    await _maybe_await(self._on_tick())
+                except RuntimeStopRequested:
+                    raise
+                except Exception as exc:
+                    self._propagate_error(exc)
+
+            if active[PHASE_TICK]:
+                await run_phase(PHASE_TICK, self._propagate_error)
+            if active[PHASE_POST_TICK]:
+                await run_phase(PHASE_POST_TICK, self._propagate_error)
+        except RuntimeStopRequested:
+            # Stop requested; reason may already be set.
+            self._stop_requested = True
+        except Exception as exc:
+            self._propagate_error(exc)
+
+    def _phase_runner(self):
+        return self._pipeline.run_phase_async
+
+    async def _idle_until_due_async(self, scheduler: TickScheduler) -> None:
+        wakeup = self._aio_wakeup
+        clock = self._clock
+        while True:
+            remaining = scheduler.remaining()
+            if remaining <= 0:
+                # Still yield so spawned tasks make progress between ticks.
+                await asyncio.sleep(0)
+                return
+            if clock.virtual:
+                # Fast-forward: pending wakeups are serviced, otherwise virtual
+                # time jumps straight to the deadline.
+                await asyncio.sleep(0)
+                if not wakeup.is_set():
+                    clock.advance(remaining)
+                    return
+            else:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return
+            wakeup.clear()
+            if self._stop_requested:
+                return
+            await self._poll_ingress_async()
+            if self._stop_requested:
+                return
+
+    async def _poll_ingress_async(self) -> None:
+        poll = self._hooks.ingress_poll
+        if poll is not None:
+            try:
+                await _maybe_await(poll())
+            except RuntimeStopRequested:
+                # Control signal: not an envelope.
+                self.request_stop(reason="command:handler")
+            except Exception as exc:
+                # Ingress failure is a boundary error: envelope it.
+                self._propagate_error(exc, where="runtime.ingress")
+
+    def _task_done(self, task: asyncio.Task, where: str) -> None:
+        self._pending.discard(task)
+        if task.cancelled():
+            return
+
+        exc = task.exception()
+        if exc is None:
+            return
+        if isinstance(exc, RuntimeStopRequested):
+            self.request_stop(reason="task:handler")
+            return
+        self._propagate_error(exc, where=where)
+
+    async def _drain_pending(self) -> None:
+        if not self._pending:
+            return
+
+        _, still_pending = await asyncio.wait(
+            set(self._pending), timeout=self._shutdown_grace_sec
+        )
+        for task in still_pending:
+            task.cancel()
+        if still_pending:
+            await asyncio.wait(still_pending)
+
+    def _propagate_error(self, exc: BaseException, where: str = "runtime.tick"):
+        """
+        Same contract as HeartbeatLoop._propagate_error; awaitable sink results
+        are tracked as pending tasks and drained at shutdown.
+        """
+        if self._envelope_factory and self._envelope_sink:
+            env = self._envelope_factory(exc, where=where)
+            result = self._envelope_sink(env)
+            if inspect.isawaitable(result):
+                self._track_sink(result)
+            return
+
+        # existing fallback behaviour remains intact
+        if self._logger:
+            self._logger.error("Unhandled exception in heartbeat loop", exc_info=exc)
+        else:
+            raise exc
+
+    def _track_sink(self, aw: Awaitable[Any]) -> None:
+        task = asyncio.ensure_future(aw)
+        self._pending.add(task)
+
+        def _done(t: asyncio.Task) -> None:
+            self._pending.discard(t)
+            if not t.cancelled() and t.exception() is not None and self._logger:
+                # Never re-envelope a failing sink (would recurse).
+                try:
+                    self._logger.error("Envelope sink failed", exc_info=t.exception())
+                except Exception:
+                    pass
+
+        task.add_done_callback(_done)
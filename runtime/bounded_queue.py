@@ -0,0 +1,292 @@
+# lillycore/runtime/bounded_queue.py
+
+from __future__ import annotations
+
+import collections
+import queue
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+# Overflow policies (what put() does when the queue is at capacity).
+POLICY_BLOCK = "block"  # producer waits for room (backpressure)
+POLICY_DROP_NEWEST = "drop_newest"  # incoming item is discarded
+POLICY_DROP_OLDEST = "drop_oldest"  # oldest queued item is evicted
+POLICY_REJECT = "reject"  # put() raises queue.Full to the producer
+
+OVERFLOW_POLICIES = frozenset(
+    {POLICY_BLOCK, POLICY_DROP_NEWEST, POLICY_DROP_OLDEST, POLICY_REJECT}
+)
+
+# on_overflow(policy, item): item is the one discarded/rejected (for
+# drop_oldest, the evicted item; for block, the item that had to wait).
+OverflowCallback = Callable[[str, Any], None]
+
+
+class BoundedQueue(Generic[T]):
+    """
+    Thread-safe FIFO with a capacity and an explicit overflow policy.
+
+    - capacity <= 0 means unbounded (overflow never happens)
+    - producers use put()/put_many(); consumers get_nowait()/get()/drain()
+    - close() wakes blocked producers/consumers; later puts are refused
+    - stats() reports depth, high-water mark and per-policy counters, so
+      overload shows up in logs instead of as unbounded memory/latency
+    """
+
+    def __init__(
+        self,
+        capacity: int = 0,
+        policy: str = POLICY_BLOCK,
+        *,
+        on_overflow: Optional[OverflowCallback] = None,
+    ):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported overflow policy: {policy}")
+
+        self._capacity = max(0, int(capacity))
+        self._policy = policy
+        self._on_overflow = on_overflow
+
+        self._items: Deque[T] = collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+
+        self._enqueued = 0
+        self._dequeued = 0
+        self._dropped_newest = 0
+        self._dropped_oldest = 0
+        self._rejected = 0
+        self._blocked = 0
+        self._max_depth = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def dequeued(self) -> int:
+        """Items handed to consumers so far (updated with the removal)."""
+        return self._dequeued
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    # ---- producer side ---------------------------------------------------
+
+    def put(self, item: T, timeout: Optional[float] = None) -> bool:
+        """
+        Enqueue item; returns True if it was queued.
+
+        False means it was dropped (drop_newest, closed queue, or a block
+        timeout). reject raises queue.Full instead.
+        """
+        overflow = None
+        with self._lock:
+            if self._closed:
+                return False
+
+            if self._capacity and len(self._items) >= self._capacity:
+                policy = self._policy
+                if policy == POLICY_BLOCK:
+                    self._blocked += 1
+                    overflow = item
+                    if not self._wait_for_room(timeout):
+                        self._dropped_newest += 1
+                        accepted = False
+                    else:
+                        accepted = self._append(item)
+                elif policy == POLICY_DROP_OLDEST:
+                    overflow = self._items.popleft()
+                    self._dropped_oldest += 1
+                    accepted = self._append(item)
+                elif policy == POLICY_DROP_NEWEST:
+                    self._dropped_newest += 1
+                    overflow = item
+                    accepted = False
+                else:
+                    self._rejected += 1
+                    overflow = item
+                    accepted = None
+            else:
+                accepted = self._append(item)
+
+        if overflow is not None:
+            self._notify_overflow(overflow)
+        if accepted is None:
+            raise queue.Full()
+        return accepted
+
+    def put_many(self, items: Iterable[T]) -> int:
+        """
+        Enqueue items in order; returns how many were queued.
+
+        Uncontended fast path takes the lock once for the whole batch; items
+        that hit the capacity fall back to put() and its policy. With reject,
+        rejected items are counted and skipped (the return value is short)
+        rather than raising part-way through the batch.
+        """
+        accepted = 0
+        pending: List[T] = []
+        with self._lock:
+            if self._closed:
+                return 0
+            cap = self._capacity
+            for item in items:
+                if pending or (cap and len(self._items) >= cap):
+                    pending.append(item)
+                else:
+                    self._items.append(item)
+                    accepted += 1
+            if accepted:
+                self._enqueued += accepted
+                if len(self._items) > self._max_depth:
+                    self._max_depth = len(self._items)
+                self._not_empty.notify_all()
+
+        for item in pending:
+            try:
+                if self.put(item):
+                    accepted += 1
+            except queue.Full:
+                pass
+        return accepted
+
+    def requeue(self, items: List[T]) -> None:
+        """
+        Put items back at the head, in order (consumer gave them back
+        undelivered). They were already admitted, so capacity is not applied.
+        """
+        if not items:
+            return
+        with self._lock:
+            self._items.extendleft(reversed(items))
+            self._dequeued -= len(items)
+            self._not_empty.notify_all()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+
+    # ---- consumer side ---------------------------------------------------
+
+    def get_nowait(self) -> T:
+        with self._lock:
+            if not self._items:
+                raise queue.Empty()
+            return self._pop()
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        """
+        Blocking get; raises queue.Empty on timeout or when closed and empty.
+        """
+        with self._lock:
+            if not self._items:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while not self._items:
+                    if self._closed:
+                        raise queue.Empty()
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise queue.Empty()
+                    self._not_empty.wait(remaining)
+            return self._pop()
+
+    def drain(self, max_items: Optional[int] = None) -> List[T]:
+        """
+        Remove and return up to max_items (all if None) under one lock.
+        """
+        with self._lock:
+            items = self._items
+            if max_items is None or max_items >= len(items):
+                out = list(items)
+                items.clear()
+            else:
+                out = [items.popleft() for _ in range(max_items)]
+            if out:
+                self._dequeued += len(out)
+                self._not_full.notify_all()
+            return out
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self._capacity,
+            "policy": self._policy,
+            "depth": len(self._items),
+            "max_depth": self._max_depth,
+            "enqueued": self._enqueued,
+            "dequeued": self._dequeued,
+            "dropped_newest": self._dropped_newest,
+            "dropped_oldest": self._dropped_oldest,
+            "rejected": self._rejected,
+            "blocked": self._blocked,
+        }
+
+    # ---- internal (lock held) --------------------------------------------
+
+    def _append(self, item: T) -> bool:
+        items = self._items
+        items.append(item)
+        self._enqueued += 1
+        if len(items) > self._max_depth:
+            self._max_depth = len(items)
+        self._not_empty.notify()
+        return True
+
+    def _pop(self) -> T:
+        item = self._items.popleft()
+        self._dequeued += 1
+        self._not_full.notify()
+        return item
+
+    def _wait_for_room(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self._items) >= self._capacity:
+            if self._closed:
+                return False
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+            self._not_full.wait(remaining)
+        return True
+
+    def _notify_overflow(self, item: Any) -> None:
+        callback = self._on_overflow
+        if callback is None:
+            return
+        try:
+            callback(self._policy, item)
+        except Exception:
+            # Overflow reporting MUST NOT break the producer.
+            pass
@@ -0,0 +1,80 @@
+# lillycore/runtime/clock.py
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Protocol
+
+
+class Clock(Protocol):
+    """
+    Injectable time source shared by the loop, scheduler, logger and envelopes.
+
+    - monotonic(): seconds for intervals/deadlines
+    - time(): epoch seconds for timestamps
+    - wait(event, timeout): idle wait; True if the event was set
+    - virtual: True when time only moves because the runtime advances it
+    """
+
+    virtual: bool
+
+    def monotonic(self) -> float: ...
+
+    def time(self) -> float: ...
+
+    def wait(self, event: threading.Event, timeout: float) -> bool: ...
+
+
+class SystemClock:
+    """Real time (default)."""
+
+    virtual = False
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def time(self) -> float:
+        return time.time()
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        return event.wait(timeout)
+
+
+class VirtualClock:
+    """
+    Fast-forward clock for deterministic runs.
+
+    Time starts at start_epoch and only moves when the runtime waits (or
+    advance() is called): an idle wait advances virtual time by the full
+    timeout instantly. Identical runs therefore produce identical timestamps
+    and finish as fast as the tick work allows.
+    """
+
+    virtual = True
+
+    def __init__(self, start_epoch: float = 0.0):
+        self._epoch = float(start_epoch)
+        self._now = 0.0
+        self._lock = threading.Lock()
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def time(self) -> float:
+        return self._epoch + self._now
+
+    def advance(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._now += seconds
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        if event.is_set():
+            return True
+        self.advance(timeout)
+        return False
+
+
+SYSTEM_CLOCK = SystemClock()
@@ -2,11 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Callable, Protocol, TypeAlias
+import abc
+from typing import Callable, List, Optional, Protocol, TypeAlias
+
+from lillycore.runtime.bounded_queue import BoundedQueue
+from lillycore.runtime.heartbeat import RuntimeStopRequested
 
 Command: TypeAlias = str
 CommandHandler = Callable[[Command], None]
 
+# Batch form of CommandHandler: one call per poll with the commands in arrival order.
+CommandBatchHandler = Callable[[List[Command]], None]
+
+# Zero-argument, thread-safe callback an adapter invokes when it has input ready.
+WakeupCallback = Callable[[], None]
+
+# Phase 1 stop commands (P1.1.6): control signals, not errors.
+STOP_COMMANDS = frozenset({"stop", "quit", "exit"})
+
+
+def signal_wakeup(callback: Optional[WakeupCallback]) -> None:
+    """Call an adapter's wakeup callback, if set; never raises."""
+    if callback is not None:
+        try:
+            callback()
+        except Exception:
+            # A failing wakeup only costs latency; poll() still drains.
+            pass
+
 
 class CommandIngress(Protocol):
     """
@@ -15,6 +38,186 @@ class CommandIngress(Protocol):
     Phase 1 contract:
     - poll() must be non-blocking
     - any blocking IO must happen outside the tick path
+
+    Optional seam (see WakeableCommandIngress):
+    - set_wakeup(callback): the loop hands the adapter a wakeup callback so
+      commands are dispatched as soon as they arrive instead of waiting for
+      the next tick deadline. Adapters without it are still polled every tick.
+
+    Optional seams used by MultiplexIngress (see BoundedCommandIngress):
+    - pending(): cheap count of input waiting for poll() (0 = idle)
+    - poll_bounded(limit): poll() taking at most `limit` commands
     """
 
     def poll(self) -> None: ...
+
+
+class WakeableCommandIngress(CommandIngress, Protocol):
+    """
+    CommandIngress that can interrupt the loop's idle wait.
+
+    Contract:
+    - set_wakeup() is called once by the loop before run()
+    - the adapter calls the callback (from any thread) after making input
+      available to poll(); spurious calls are harmless
+    """
+
+    def set_wakeup(self, callback: WakeupCallback) -> None: ...
+
+
+class BoundedCommandIngress(CommandIngress, Protocol):
+    """
+    CommandIngress that can report and limit the work one poll() does.
+
+    Contract:
+    - pending() is non-blocking and cheap (no IO); it may be stale but must
+      not report 0 while input is waiting
+    - poll_bounded(limit) behaves like poll() but takes at most `limit`
+      commands (None = no limit) and returns how many it took
+    """
+
+    def pending(self) -> int: ...
+
+    def poll_bounded(self, limit: Optional[int]) -> int: ...
+
+
+class QueuedCommandIngress(CommandIngress, abc.ABC):
+    """
+    Shared poll() side of adapters whose reader thread fills a BoundedQueue
+    with command lines (terminal, replay).
+
+    - poll() drains up to max_batch_size lines and dispatches them to
+      on_command, or to on_commands as one list per poll
+    - stop commands take effect in order: commands before the stop are
+      dispatched, lines after it stay queued, then RuntimeStopRequested is
+      raised
+    - a failing handler call (on_command, or on_commands for a batch) counts
+      as delivered and puts the lines after it back at the queue head; a stop
+      after a failing batch stays queued too
+    - end of input (_mark_eof) is delivered once, as a final "EOF" command,
+      after every queued line
+
+    Subclasses implement start() (setting _started and starting the reader)
+    and may override _command_of(line) (falsy = skip) and _finish().
+    """
+
+    def __init__(
+        self,
+        on_command: Optional[CommandHandler],
+        on_commands: Optional[CommandBatchHandler],
+        q: BoundedQueue[str],
+        max_batch_size: Optional[int],
+    ):
+        if on_command is None and on_commands is None:
+            raise ValueError(f"{type(self).__name__} needs on_command or on_commands")
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+
+        self._on_command = on_command
+        self._on_commands = on_commands
+        self._max_batch_size = max_batch_size
+        self._q = q
+        self._wakeup: Optional[WakeupCallback] = None
+        self._started = False
+        self._eof = False
+        self._eof_delivered = False
+        self._delivered = 0
+
+    def set_wakeup(self, callback: WakeupCallback) -> None:
+        self._wakeup = callback
+
+    @abc.abstractmethod
+    def start(self) -> None: ...
+
+    def poll(self) -> None:
+        self.poll_bounded(self._max_batch_size)
+
+    def poll_bounded(self, limit: Optional[int]) -> int:
+        """
+        poll() draining at most `limit` lines; returns how many were taken.
+        """
+        # Ensure the reader exists, but keep tick path non-blocking.
+        if not self._started:
+            self.start()
+
+        lines = self._q.drain(limit)
+        batch: Optional[List[str]] = [] if self._on_commands is not None else None
+        command_of = self._command_of
+
+        for index, line in enumerate(lines):
+            cmd = command_of(line)
+            if not cmd:
+                continue
+
+            # Phase 1 stop commands (P1.1.6):
+            # These are control signals, not errors.
+            if cmd in STOP_COMMANDS:
+                if batch:
+                    self._deliver_batch(batch, lines[index:])
+                # Lines after the stop stay queued (e.g. for a restart).
+                self._q.requeue(lines[index + 1 :])
+                self._finish()
+                raise RuntimeStopRequested()
+
+            if batch is not None:
+                batch.append(cmd)
+                continue
+            try:
+                self._on_command(cmd)
+            except BaseException:
+                # Lines after a failing command stay queued for the next poll.
+                self._q.requeue(lines[index + 1 :])
+                raise
+            finally:
+                self._delivered += 1
+
+        if limit is not None and len(lines) == limit and not self._q.empty():
+            # Batch limit reached with input left: ask for another poll rather
+            # than leaving it for a whole tick interval.
+            self._signal_wakeup()
+        elif self._eof and not self._eof_delivered and self._q.empty():
+            # EOF goes after every queued line.
+            self._eof_delivered = True
+            self._finish()
+            if batch is not None:
+                try:
+                    self._on_commands(batch + ["EOF"])
+                finally:
+                    self._delivered += len(batch)
+            else:
+                self._on_command("EOF")
+            return len(lines) + 1
+
+        if batch:
+            self._deliver_batch(batch, [])
+        return len(lines)
+
+    def pending(self) -> int:
+        """Lines waiting for poll() (plus an undelivered EOF); cheap."""
+        return len(self._q) + (self._eof and not self._eof_delivered)
+
+    # ---- internal --------------------------------------------------------
+
+    def _command_of(self, line: str) -> str:
+        return line
+
+    def _finish(self) -> None:
+        pass
+
+    def _deliver_batch(self, batch: List[str], rest: List[str]) -> None:
+        # rest: drained lines after the batch, requeued if the handler raises
+        # (same as lines after a failing on_command).
+        try:
+            self._on_commands(batch)
+        except BaseException:
+            self._q.requeue(rest)
+            raise
+        finally:
+            self._delivered += len(batch)
+
+    def _mark_eof(self) -> None:
+        self._eof = True
+        self._signal_wakeup()
+
+    def _signal_wakeup(self) -> None:
+        signal_wakeup(self._wakeup)
@@ -0,0 +1,278 @@
+# lillycore/runtime/command_router.py
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from lillycore.runtime.command_ingress import Command
+from lillycore.runtime.tick_metrics import LatencyHistogram
+
+
+class UnknownCommand(ValueError):
+    """No registered verb matches the command (enveloped like any handler error)."""
+
+
+class AmbiguousCommand(UnknownCommand):
+    """A prefix matches more than one registered verb."""
+
+    def __init__(self, word: str, candidates: Iterable[str]):
+        self.candidates = sorted(candidates)
+        super().__init__(f"Ambiguous command {word!r}: {', '.join(self.candidates)}")
+
+
+def _split_command(text: str) -> Tuple[str, str]:
+    # First token and the rest; any whitespace (tabs too) separates them.
+    parts = text.split(None, 1)
+    if not parts:
+        return "", ""
+    return parts[0], parts[1] if len(parts) > 1 else ""
+
+
+class ParsedCommand:
+    """
+    A command split once at dispatch time.
+
+    - raw: the command as received
+    - verb: canonical registered verb (aliases/prefixes resolved)
+    - word: the first token as typed
+    - rest: everything after the first token (leading whitespace stripped)
+    - args: rest split on whitespace
+    """
+
+    __slots__ = ("raw", "verb", "word", "rest", "args")
+
+    def __init__(self, raw: str, verb: str, word: str, rest: str):
+        self.raw = raw
+        self.verb = verb
+        self.word = word
+        self.rest = rest
+        self.args: Tuple[str, ...] = tuple(rest.split()) if rest else ()
+
+    def __repr__(self) -> str:
+        return f"ParsedCommand(verb={self.verb!r}, args={self.args!r})"
+
+
+VerbHandler = Callable[[ParsedCommand], Any]
+
+
+class _TrieNode:
+    __slots__ = ("children", "verbs")
+
+    def __init__(self):
+        self.children: Dict[str, _TrieNode] = {}
+        # Canonical verbs reachable below this node (a unique prefix has one).
+        self.verbs: Set[str] = set()
+
+
+class _Route:
+    __slots__ = (
+        "verb",
+        "handler",
+        "help",
+        "takes_args",
+        "calls",
+        "errors",
+        "latency",
+    )
+
+    def __init__(
+        self, verb: str, handler: VerbHandler, help: Optional[str], takes_args: bool
+    ):
+        self.verb = verb
+        self.handler = handler
+        self.help = help
+        self.takes_args = takes_args
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+
+class CommandRouter:
+    """
+    Verb -> handler dispatch for command ingress.
+
+    - register(verb, handler, aliases=...) adds a route; handlers receive a
+      ParsedCommand (the command is split once, at dispatch). A route
+      registered with takes_args=False only matches the bare verb: "boom x"
+      is an unknown command, not "boom"
+    - lookup is a dict hit for verbs/aliases; with prefix_matching, a unique
+      prefix ("st" for "status") is resolved through a trie and cached
+    - verbs are case-insensitive
+    - unknown / ambiguous commands go to default(parsed) if set, otherwise raise
+      UnknownCommand / AmbiguousCommand (enveloped by the loop like any
+      handler error)
+    - every route records call count, error count and a latency histogram;
+      stats() returns them keyed by verb
+
+    A router instance is a CommandHandler (router(cmd)) and dispatch_many is a
+    CommandBatchHandler, so it plugs into any CommandIngress adapter.
+    """
+
+    def __init__(
+        self,
+        *,
+        default: Optional[VerbHandler] = None,
+        prefix_matching: bool = True,
+    ):
+        self._default = default
+        self._prefix_matching = prefix_matching
+        self._routes: Dict[str, _Route] = {}
+        # word (verb, alias, or resolved prefix) -> route
+        self._table: Dict[str, _Route] = {}
+        self._names: Dict[str, str] = {}  # verb/alias -> canonical verb
+        self._trie = _TrieNode()
+        self._unknown = 0
+
+    # ---- registration ----------------------------------------------------
+
+    def register(
+        self,
+        verb: str,
+        handler: VerbHandler,
+        *,
+        aliases: Iterable[str] = (),
+        help: Optional[str] = None,
+        takes_args: bool = True,
+    ) -> None:
+        verb = verb.lower()
+        names = [verb, *(a.lower() for a in aliases)]
+        for name in names:
+            owner = self._names.get(name)
+            if owner is not None and owner != verb:
+                raise ValueError(
+                    f"Command name {name!r} already registered by {owner!r}"
+                )
+            if not name or any(c.isspace() for c in name):
+                raise ValueError(f"Invalid command name: {name!r}")
+
+        if verb in self._routes:
+            self.unregister(verb)
+
+        self._routes[verb] = _Route(verb, handler, help, takes_args)
+        for name in names:
+            self._names[name] = verb
+            self._trie_insert(name, verb)
+        self._rebuild_table()
+
+    def unregister(self, verb: str) -> bool:
+        verb = verb.lower()
+        if self._routes.pop(verb, None) is None:
+            return False
+        for name in [n for n, v in self._names.items() if v == verb]:
+            del self._names[name]
+        self._trie = _TrieNode()
+        for name, owner in self._names.items():
+            self._trie_insert(name, owner)
+        self._rebuild_table()
+        return True
+
+    def verbs(self) -> List[str]:
+        return sorted(self._routes)
+
+    def help(self) -> Dict[str, Optional[str]]:
+        return {verb: route.help for verb, route in sorted(self._routes.items())}
+
+    # ---- dispatch --------------------------------------------------------
+
+    def resolve(self, word: str) -> Optional[str]:
+        """
+        Canonical verb for a typed word (verb, alias or unique prefix).
+        Raises AmbiguousCommand for a prefix of several verbs.
+        """
+        route = self._lookup(word.lower())
+        return route.verb if route is not None else None
+
+    def parse(self, cmd: Command) -> ParsedCommand:
+        text = cmd.strip()
+        word, rest = _split_command(text)
+        route = self._lookup(word.lower())
+        if route is not None and rest and not route.takes_args:
+            route = None
+        return ParsedCommand(cmd, route.verb if route else "", word, rest)
+
+    def __call__(self, cmd: Command) -> Any:
+        text = cmd.strip()
+        word, rest = _split_command(text)
+        try:
+            route = self._lookup(word.lower())
+        except AmbiguousCommand:
+            if self._default is None:
+                self._unknown += 1
+                raise
+            route = None
+        if route is not None and rest and not route.takes_args:
+            route = None
+
+        if route is None:
+            self._unknown += 1
+            parsed = ParsedCommand(cmd, "", word, rest)
+            if self._default is None:
+                raise UnknownCommand(f"Unknown command: {word!r}")
+            return self._default(parsed)
+
+        parsed = ParsedCommand(cmd, route.verb, word, rest)
+        route.calls += 1
+        started = time.perf_counter_ns()
+        try:
+            return route.handler(parsed)
+        except BaseException:
+            route.errors += 1
+            raise
+        finally:
+            route.latency.record(time.perf_counter_ns() - started)
+
+    dispatch = __call__
+
+    def dispatch_many(self, cmds: List[Command]) -> None:
+        """
+        Batch entry point (CommandBatchHandler); stops at the first error,
+        like a sequence of on_command calls would.
+        """
+        for cmd in cmds:
+            self(cmd)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "unknown": self._unknown,
+            "verbs": {
+                verb: {
+                    "calls": route.calls,
+                    "errors": route.errors,
+                    "latency": route.latency.snapshot(),
+                }
+                for verb, route in sorted(self._routes.items())
+            },
+        }
+
+    # ---- internal --------------------------------------------------------
+
+    def _lookup(self, word: str) -> Optional[_Route]:
+        route = self._table.get(word)
+        if route is not None or not self._prefix_matching or not word:
+            return route
+
+        node = self._trie
+        for ch in word:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        if len(node.verbs) > 1:
+            raise AmbiguousCommand(word, node.verbs)
+
+        (verb,) = node.verbs
+        route = self._routes[verb]
+        # Cache the resolved prefix: next time it is a plain dict hit.
+        self._table[word] = route
+        return route
+
+    def _trie_insert(self, name: str, verb: str) -> None:
+        node = self._trie
+        node.verbs.add(verb)
+        for ch in name:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.verbs.add(verb)
+
+    def _rebuild_table(self) -> None:
+        # Prefix cache entries may be stale after any registration change.
+        self._table = {name: self._routes[v] for name, v in self._names.items()}
@@ -0,0 +1,199 @@
+# lillycore/runtime/envelope_aggregator.py
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from lillycore.runtime.error_envelopes import ErrorEnvelope, fingerprint
+from lillycore.runtime.tick_pipeline import PHASE_POST_TICK
+
+EnvelopeSink = Callable[[Any], Any]
+
+# on_summary(summary): one dict per fingerprint with repeats since the last
+# summary (see EnvelopeAggregator.flush).
+SummaryCallback = Callable[[Dict[str, Any]], None]
+
+
+class _Entry:
+    __slots__ = (
+        "fingerprint",
+        "exc_type",
+        "where",
+        "count",
+        "reported",
+        "first_ts",
+        "last_ts",
+        "idle",
+    )
+
+    def __init__(self, fp: str, envelope: ErrorEnvelope):
+        self.fingerprint = fp
+        self.exc_type = envelope.exc_type.__qualname__
+        self.where = envelope.where
+        self.count = 1
+        self.reported = 1
+        self.first_ts = envelope.ts
+        self.last_ts = envelope.ts
+        self.idle = False
+
+
+class EnvelopeAggregator:
+    """
+    Deduplicating stage between envelope_factory and envelope_sink.
+
+    - the aggregator is itself an envelope sink: wrap the real sink with it
+    - envelopes are fingerprinted by exception type, where and the innermost
+      `frames` frames (error_envelopes.fingerprint)
+    - the first occurrence of a fingerprint goes to the sink in full; repeats
+      are only counted
+    - flush_due() (post_tick, see attach) emits one summary per fingerprint
+      with new repeats every summary_interval_sec: fingerprint, exc_type,
+      where, count (total), suppressed (since the last summary), first_ts,
+      last_ts
+    - a fingerprint with no repeats over a whole interval is forgotten, so a
+      later recurrence is emitted in full again
+    - at most max_fingerprints are tracked; the least recently seen is
+      summarized and forgotten first
+    - objects that are not ErrorEnvelopes (custom factories) pass through
+
+    A persistently failing tick therefore costs one full envelope plus one
+    summary per interval instead of one envelope per tick.
+    """
+
+    def __init__(
+        self,
+        sink: EnvelopeSink,
+        *,
+        summary_interval_sec: float = 10.0,
+        frames: int = 5,
+        max_fingerprints: int = 1024,
+        on_summary: Optional[SummaryCallback] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if summary_interval_sec <= 0:
+            raise ValueError("summary_interval_sec must be > 0")
+        if max_fingerprints < 1:
+            raise ValueError("max_fingerprints must be >= 1")
+
+        self._sink = sink
+        self._interval = summary_interval_sec
+        self._frames = frames
+        self._max = max_fingerprints
+        self._on_summary = on_summary
+        self._clock = clock
+
+        self._entries: collections.OrderedDict[str, _Entry] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._next_flush = clock() + summary_interval_sec
+
+        self._received = 0
+        self._emitted = 0
+        self._suppressed = 0
+        self._summaries = 0
+        self._evicted = 0
+
+    def __call__(self, envelope: Any) -> Any:
+        fp = fingerprint(envelope, frames=self._frames)
+        evicted: Optional[Dict[str, Any]] = None
+        with self._lock:
+            self._received += 1
+            if fp is not None:
+                entry = self._entries.get(fp)
+                if entry is not None:
+                    entry.count += 1
+                    entry.last_ts = envelope.ts
+                    entry.idle = False
+                    self._entries.move_to_end(fp)
+                    self._suppressed += 1
+                    return None
+
+                self._entries[fp] = _Entry(fp, envelope)
+                if len(self._entries) > self._max:
+                    _, oldest = self._entries.popitem(last=False)
+                    self._evicted += 1
+                    evicted = self._summarize(oldest)
+            self._emitted += 1
+
+        if evicted is not None:
+            self._emit_summary(evicted)
+        return self._sink(envelope)
+
+    def attach(self, loop: Any, *, name: str = "envelope_aggregator") -> Any:
+        """
+        Run flush_due as a post_tick task of `loop` and expose stats().
+        """
+        loop.register_stats("envelopes", self.stats)
+        return loop.register_task(self.flush_due, phase=PHASE_POST_TICK, name=name)
+
+    def flush_due(self) -> int:
+        """
+        flush() if summary_interval_sec has passed since the last one; cheap
+        otherwise. Returns the number of summaries emitted.
+        """
+        now = self._clock()
+        if now < self._next_flush:
+            return 0
+        self._next_flush = now + self._interval
+        return self.flush()
+
+    def flush(self) -> int:
+        """
+        Emit summaries for every fingerprint with unreported repeats and
+        forget fingerprints idle since the previous flush (call once more at
+        shutdown).
+        """
+        summaries: List[Dict[str, Any]] = []
+        with self._lock:
+            for fp, entry in list(self._entries.items()):
+                summary = self._summarize(entry)
+                if summary is not None:
+                    summaries.append(summary)
+                elif entry.idle:
+                    # Nothing new for a whole interval.
+                    del self._entries[fp]
+                else:
+                    entry.idle = True
+
+        for summary in summaries:
+            self._emit_summary(summary)
+        return len(summaries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "fingerprints": len(self._entries),
+            "received": self._received,
+            "emitted": self._emitted,
+            "suppressed": self._suppressed,
+            "summaries": self._summaries,
+            "evicted": self._evicted,
+        }
+
+    # ---- internal --------------------------------------------------------
+
+    def _summarize(self, entry: _Entry) -> Optional[Dict[str, Any]]:
+        suppressed = entry.count - entry.reported
+        if suppressed <= 0:
+            return None
+        entry.reported = entry.count
+        self._summaries += 1
+        return {
+            "fingerprint": entry.fingerprint,
+            "exc_type": entry.exc_type,
+            "where": entry.where,
+            "count": entry.count,
+            "suppressed": suppressed,
+            "first_ts": entry.first_ts,
+            "last_ts": entry.last_ts,
+        }
+
+    def _emit_summary(self, summary: Dict[str, Any]) -> None:
+        if self._on_summary is None:
+            return
+        try:
+            self._on_summary(summary)
+        except Exception:
+            # Logging MUST NOT break runtime control flow in Phase 1.
+            pass
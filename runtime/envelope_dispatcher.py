@@ -0,0 +1,313 @@
+# lillycore/runtime/envelope_dispatcher.py
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import inspect
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from lillycore.runtime.bounded_queue import POLICY_DROP_OLDEST, BoundedQueue
+
+EnvelopeSink = Callable[[Any], Any]
+
+# Returns the running event loop coroutine sinks belong to (or None).
+EventLoopGetter = Callable[[], Optional[asyncio.AbstractEventLoop]]
+
+
+async def _await_all(awaitables: List[Any]) -> None:
+    for aw in awaitables:
+        await aw
+
+
+class _Lane:
+    __slots__ = (
+        "name",
+        "sink",
+        "timeout",
+        "batch",
+        "queue",
+        "thread",
+        "busy_since",
+        "stalled",
+        "delivered",
+        "batches",
+        "errors",
+        "skipped",
+        "stalls",
+        "last_error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        sink: EnvelopeSink,
+        timeout: float,
+        batch: bool,
+        capacity: int,
+        policy: str,
+    ):
+        self.name = name
+        self.sink = sink
+        self.timeout = timeout
+        self.batch = batch
+        self.queue: BoundedQueue[Any] = BoundedQueue(capacity, policy)
+        self.thread: Optional[threading.Thread] = None
+        self.busy_since: Optional[float] = None
+        self.stalled = False
+        self.delivered = 0
+        self.batches = 0
+        self.errors = 0
+        self.skipped = 0
+        self.stalls = 0
+        self.last_error: Optional[str] = None
+
+
+class EnvelopeDispatcher:
+    """
+    Envelope sink that fans envelopes out to other sinks off the tick thread.
+
+    - the dispatcher is itself an envelope sink: calling it only queues the
+      envelope, so a slow sink (disk, socket) no longer stalls the heartbeat
+    - add_sink(name, sink) registers a sink with its own lane: a BoundedQueue
+      (capacity, overflow_policy; default drop_oldest, so a burst sheds old
+      envelopes instead of blocking the tick) and a daemon thread
+    - lanes micro-batch: each wakeup takes up to max_batch queued envelopes;
+      batch=True sinks get them as one list, others one call per envelope
+    - failure isolation: a sink's exceptions are counted in stats() and never
+      reach the loop or the other sinks
+    - timeout_sec: a sink busy on one batch for longer than this is treated as
+      stalled; envelopes for it are skipped (counted) until it returns, so a
+      hung sink cannot fill memory. Python cannot interrupt the call itself
+    - drain(timeout) waits for every lane to go idle; close(timeout) drains
+      and stops the lanes. After close() the dispatcher delivers synchronously
+      on the caller's thread, so late (shutdown) envelopes are not lost
+    - coroutine sinks: with event_loop (a getter for the owning loop, e.g.
+      AsyncHeartbeatLoop.event_loop) the coroutine is scheduled onto that loop
+      with run_coroutine_threadsafe and counted when it settles; wait_scheduled()
+      awaits the ones still outstanding. Without a running loop the lane runs
+      it to completion itself (asyncio.run). After close() awaitables are
+      returned to the caller instead
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int = 1024,
+        overflow_policy: str = POLICY_DROP_OLDEST,
+        max_batch: int = 64,
+        sink_timeout_sec: float = 1.0,
+        name: str = "envelope-dispatch",
+        clock: Callable[[], float] = time.monotonic,
+        event_loop: Optional[EventLoopGetter] = None,
+    ):
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+
+        self._capacity = capacity
+        self._policy = overflow_policy
+        self._max_batch = max_batch
+        self._sink_timeout = sink_timeout_sec
+        self._name = name
+        self._clock = clock
+        self._event_loop = event_loop
+
+        self._lanes: List[_Lane] = []
+        # Coroutine results scheduled onto the event loop, not yet settled.
+        self._scheduled: Set[concurrent.futures.Future] = set()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def add_sink(
+        self,
+        name: str,
+        sink: EnvelopeSink,
+        *,
+        timeout_sec: Optional[float] = None,
+        batch: bool = False,
+    ) -> None:
+        if any(lane.name == name for lane in self._lanes):
+            raise ValueError(f"Envelope sink already added: {name!r}")
+        lane = _Lane(
+            name,
+            sink,
+            self._sink_timeout if timeout_sec is None else timeout_sec,
+            batch,
+            self._capacity,
+            self._policy,
+        )
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("EnvelopeDispatcher is closed")
+            lane.thread = threading.Thread(
+                target=self._lane_thread,
+                args=(lane,),
+                name=f"{self._name}-{name}",
+                daemon=True,
+            )
+            self._lanes.append(lane)
+            lane.thread.start()
+
+    def __call__(self, envelope: Any) -> Any:
+        if self._closed:
+            return self._deliver_now(envelope)
+
+        now = self._clock()
+        for lane in self._lanes:
+            busy_since = lane.busy_since
+            if busy_since is not None and now - busy_since > lane.timeout:
+                if not lane.stalled:
+                    lane.stalled = True
+                    lane.stalls += 1
+                lane.skipped += 1
+                continue
+            try:
+                lane.queue.put(envelope)
+            except queue.Full:
+                # reject policy: counted by the queue; never raise into the loop.
+                pass
+        with self._cond:
+            self._cond.notify_all()
+        return None
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued envelope has been handed to its sink (or
+        timeout); True if all lanes are idle.
+        """
+        with self._cond:
+            return self._cond.wait_for(self._idle, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Drain within timeout, then stop accepting envelopes into the lanes;
+        returns drain()'s result. Lanes still busy at the deadline finish
+        their queue in the background (daemon threads) and then exit.
+        """
+        drained = self.drain(timeout)
+        with self._cond:
+            self._closed = True
+            for lane in self._lanes:
+                lane.queue.close()
+            self._cond.notify_all()
+        return drained
+
+    async def wait_scheduled(self, timeout: Optional[float] = None) -> bool:
+        """
+        Await coroutine sink results scheduled onto the event loop (call it on
+        that loop, e.g. from an async on_stop); True if all settled in time.
+        """
+        with self._cond:
+            scheduled = list(self._scheduled)
+        if not scheduled:
+            return True
+        _, pending = await asyncio.wait(
+            [asyncio.wrap_future(f) for f in scheduled], timeout=timeout
+        )
+        return not pending
+
+    def stats(self) -> Dict[str, Any]:
+        sinks = {}
+        for lane in self._lanes:
+            sinks[lane.name] = {
+                "delivered": lane.delivered,
+                "batches": lane.batches,
+                "errors": lane.errors,
+                "last_error": lane.last_error,
+                "skipped": lane.skipped,
+                "stalls": lane.stalls,
+                "queue": lane.queue.stats(),
+            }
+        return {
+            "closed": self._closed,
+            "scheduled": len(self._scheduled),
+            "sinks": sinks,
+        }
+
+    # ---- internal --------------------------------------------------------
+
+    def _idle(self) -> bool:
+        return all(
+            lane.busy_since is None and lane.queue.empty() for lane in self._lanes
+        )
+
+    def _lane_thread(self, lane: _Lane) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while True:
+                    items = lane.queue.drain(self._max_batch)
+                    if items:
+                        lane.busy_since = self._clock()
+                        lane.stalled = False
+                        break
+                    if lane.busy_since is not None:
+                        # Busy -> idle: wake drain().
+                        lane.busy_since = None
+                        cond.notify_all()
+                    if self._closed:
+                        return
+                    cond.wait()
+
+            lane.batches += 1
+            if lane.batch:
+                self._call(lane, items, len(items), run=True)
+            else:
+                for envelope in items:
+                    self._call(lane, envelope, 1, run=True)
+
+    def _call(self, lane: _Lane, arg: Any, n: int, *, run: bool) -> Any:
+        try:
+            result = lane.sink(arg)
+            if inspect.isawaitable(result):
+                if not run:
+                    lane.delivered += n
+                    return result
+                aio_loop = self._event_loop() if self._event_loop else None
+                if aio_loop is not None and aio_loop.is_running():
+                    self._schedule(lane, result, n, aio_loop)
+                    return None
+                asyncio.run(_await_all([result]))
+            lane.delivered += n
+        except Exception as exc:
+            # Never re-envelope a failing sink (would recurse).
+            self._failed(lane, exc)
+        return None
+
+    def _schedule(
+        self, lane: _Lane, aw: Any, n: int, aio_loop: asyncio.AbstractEventLoop
+    ) -> None:
+        future = asyncio.run_coroutine_threadsafe(_await_all([aw]), aio_loop)
+        with self._cond:
+            self._scheduled.add(future)
+
+        def _settled(f: concurrent.futures.Future) -> None:
+            with self._cond:
+                self._scheduled.discard(f)
+            if f.cancelled():
+                return
+            exc = f.exception()
+            if exc is not None:
+                self._failed(lane, exc)
+            else:
+                lane.delivered += n
+
+        future.add_done_callback(_settled)
+
+    @staticmethod
+    def _failed(lane: _Lane, exc: BaseException) -> None:
+        lane.errors += 1
+        lane.last_error = f"{type(exc).__name__}: {exc}"
+
+    def _deliver_now(self, envelope: Any) -> Any:
+        pending = []
+        for lane in self._lanes:
+            result = self._call(
+                lane, [envelope] if lane.batch else envelope, 1, run=False
+            )
+            if result is not None:
+                pending.append(result)
+        return _await_all(pending) if pending else None
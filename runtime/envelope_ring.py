@@ -0,0 +1,229 @@
+# lillycore/runtime/envelope_ring.py
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+# Secondary indexes, in slot-array order.
+_WHERE = 0
+_SEVERITY = 1
+_EXC_TYPE = 2
+_INDEXES = (_WHERE, _SEVERITY, _EXC_TYPE)
+
+
+def _keys_of(envelope: Any) -> tuple:
+    exc_type = getattr(envelope, "exc_type", None)
+    return (
+        getattr(envelope, "where", None),
+        getattr(envelope, "severity", None),
+        exc_type.__qualname__ if isinstance(exc_type, type) else exc_type,
+    )
+
+
+class EnvelopeRingBuffer:
+    """
+    Fixed-size in-memory history of recent envelopes, queryable while the
+    runtime is live.
+
+    - record(envelope) (or calling the buffer, so it is an envelope sink)
+      writes the next slot, overwriting the oldest once full
+    - slots are preallocated parallel arrays; each secondary index (where,
+      severity, exception type) is an intrusive list threaded through them,
+      newest first. Recording rewrites one slot and relinks it, so memory is
+      fixed by capacity (plus one dict entry per distinct key)
+    - query(where=, severity=, exc_type=, since=, until=, limit=) returns
+      matching envelopes newest first, walking only the list of one filtered
+      key
+    - between(since, until) returns envelopes in a time range, oldest first,
+      located by binary search (O(log n))
+
+    Timestamps are envelope.ts (time.time() for objects without one), clamped
+    to be non-decreasing in arrival order so the time search stays valid if
+    the wall clock steps back.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+
+        self._capacity = capacity
+        self._envelopes: List[Any] = [None] * capacity
+        self._ts: List[float] = [0.0] * capacity
+        self._keys: List[List[Any]] = [[None] * capacity for _ in _INDEXES]
+        self._older: List[List[int]] = [[-1] * capacity for _ in _INDEXES]
+        self._newer: List[List[int]] = [[-1] * capacity for _ in _INDEXES]
+        self._heads: List[Dict[Any, int]] = [{} for _ in _INDEXES]
+
+        self._lock = threading.Lock()
+        self._next = 0
+        self._size = 0
+        self._last_ts = float("-inf")
+        self._recorded = 0
+        self._overwritten = 0
+
+    def __call__(self, envelope: Any) -> None:
+        self.record(envelope)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def record(self, envelope: Any) -> None:
+        keys = _keys_of(envelope)
+        ts = getattr(envelope, "ts", None)
+        if not isinstance(ts, (int, float)):
+            ts = time.time()
+
+        with self._lock:
+            i = self._next
+            if self._size == self._capacity:
+                self._unlink(i)
+                self._overwritten += 1
+            else:
+                self._size += 1
+
+            if ts < self._last_ts:
+                ts = self._last_ts
+            self._last_ts = ts
+            self._envelopes[i] = envelope
+            self._ts[i] = ts
+
+            for k in _INDEXES:
+                key = keys[k]
+                heads = self._heads[k]
+                head = heads.get(key, -1)
+                self._keys[k][i] = key
+                self._older[k][i] = head
+                self._newer[k][i] = -1
+                if head >= 0:
+                    self._newer[k][head] = i
+                heads[key] = i
+
+            self._next = (i + 1) % self._capacity
+            self._recorded += 1
+
+    def query(
+        self,
+        *,
+        where: Optional[str] = None,
+        severity: Optional[str] = None,
+        exc_type: Union[type, str, None] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Most recent envelopes matching every given filter, newest first.
+
+        exc_type matches the exception class or its qualified name.
+        """
+        if isinstance(exc_type, type):
+            exc_type = exc_type.__qualname__
+        wanted = [
+            (k, key)
+            for k, key in (
+                (_WHERE, where),
+                (_SEVERITY, severity),
+                (_EXC_TYPE, exc_type),
+            )
+            if key is not None
+        ]
+
+        out: List[Any] = []
+        if limit is not None and limit <= 0:
+            return out
+
+        with self._lock:
+            if not self._size:
+                return out
+
+            if wanted:
+                # Walk one filtered key's list; the other filters are checked per slot.
+                k0, key0 = wanted[0]
+                i = self._heads[k0].get(key0, -1)
+                older = self._older[k0]
+                step = None
+            else:
+                # Unfiltered: start at the newest slot at or before `until`.
+                newest = self._size - 1
+                if until is not None:
+                    newest = self._bisect(until, right=True) - 1
+                i = self._slot(newest) if newest >= 0 else -1
+                older = None
+                step = newest
+
+            keys = self._keys
+            ts = self._ts
+            while i >= 0:
+                t = ts[i]
+                if since is not None and t < since:
+                    break
+                if (until is None or t <= until) and all(
+                    keys[k][i] == key for k, key in wanted
+                ):
+                    out.append(self._envelopes[i])
+                    if limit is not None and len(out) >= limit:
+                        break
+
+                if older is not None:
+                    i = older[i]
+                else:
+                    step -= 1
+                    i = self._slot(step) if step >= 0 else -1
+        return out
+
+    def between(self, since: float, until: float) -> List[Any]:
+        """
+        Envelopes with since <= ts <= until, oldest first.
+        """
+        with self._lock:
+            lo = self._bisect(since, right=False)
+            hi = self._bisect(until, right=True)
+            return [self._envelopes[self._slot(n)] for n in range(lo, hi)]
+
+    def latest(self, n: int) -> List[Any]:
+        """The n most recent envelopes, newest first."""
+        return self.query(limit=n)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self._capacity,
+            "size": self._size,
+            "recorded": self._recorded,
+            "overwritten": self._overwritten,
+            "where": len(self._heads[_WHERE]),
+            "exc_types": len(self._heads[_EXC_TYPE]),
+        }
+
+    # ---- internal --------------------------------------------------------
+
+    def _slot(self, n: int) -> int:
+        """Physical slot of the n-th oldest recorded envelope."""
+        oldest = (self._next - self._size) % self._capacity
+        return (oldest + n) % self._capacity
+
+    def _bisect(self, t: float, *, right: bool) -> int:
+        """
+        Logical position (0 = oldest) of the first envelope with ts > t
+        (right) or ts >= t (left).
+        """
+        ts = self._ts
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            v = ts[self._slot(mid)]
+            if v < t or (right and v == t):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _unlink(self, i: int) -> None:
+        # Slot i is the oldest overall, so it is the tail of each of its lists.
+        for k in _INDEXES:
+            newer = self._newer[k][i]
+            if newer >= 0:
+                self._older[k][newer] = -1
+            else:
+                del self._heads[k][self._keys[k][i]]
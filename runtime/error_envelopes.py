@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Mapping, Optional
+import hashlib
 import time
 import traceback
 
+from lillycore.runtime.clock import Clock
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ErrorEnvelope:
     """
     Opaque structured error container.
@@ -16,15 +19,66 @@ class ErrorEnvelope:
     NOTE:
     - Treat this as the envelope authority object.
     - Other modules (runtime/logging) should NOT rely on its internal shape.
+
+    The traceback is captured as a frame summary (no source lines, no
+    locals, no frame references) and only rendered to text when asked for
+    (the traceback property), so wrapping is cheap and the envelope does not
+    keep the failing frames alive. repr() is a one-line summary.
     """
 
-    _exc: BaseException
+    _exc_type: type
+    _exc_repr: str
     _where: Optional[str]
     _severity: str
     _context: Mapping[str, Any]
     _tags: Mapping[str, Any]
     _ts: float
-    _traceback: str
+    _tb: traceback.TracebackException = field(repr=False, compare=False)
+    _rendered: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def exc_type(self) -> type:
+        return self._exc_type
+
+    @property
+    def exc_repr(self) -> str:
+        return self._exc_repr
+
+    @property
+    def where(self) -> Optional[str]:
+        return self._where
+
+    @property
+    def severity(self) -> str:
+        return self._severity
+
+    @property
+    def ts(self) -> float:
+        return self._ts
+
+    @property
+    def frames(self) -> traceback.StackSummary:
+        """Captured frames (outermost first); source lines load on access."""
+        return self._tb.stack
+
+    @property
+    def traceback(self) -> str:
+        """Full traceback text, rendered on first access and cached."""
+        rendered = self._rendered
+        if rendered is None:
+            rendered = "".join(self._tb.format())
+            object.__setattr__(self, "_rendered", rendered)
+        return rendered
+
+    def __repr__(self) -> str:
+        # Short summary (type and message, where, severity): repr() ends up in
+        # log lines and debugger views, so it never renders the traceback.
+        return (
+            f"ErrorEnvelope(_exc={self._exc_repr}, _where={self._where!r}, "
+            f"_severity={self._severity!r})"
+        )
 
 
 def wrap_exception(
@@ -34,22 +88,59 @@ def wrap_exception(
     severity: str = "error",
     context: Mapping[str, Any] | None = None,
     tags: Mapping[str, Any] | None = None,
-    clock: float | None = None,
+    clock: float | Clock | None = None,
 ) -> ErrorEnvelope:
     """
     Envelope authority entrypoint for Phase 1.
 
     Returns an opaque ErrorEnvelope object. Callers must not assume fields.
+
+    clock: an explicit timestamp, or a Clock (e.g. the runtime's VirtualClock)
+    whose time() stamps the envelope.
     """
-    ts = clock if clock is not None else time.time()
-    tb = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+    if clock is None:
+        ts = time.time()
+    elif isinstance(clock, (int, float)):
+        ts = float(clock)
+    else:
+        ts = clock.time()
+    # Frame summary only: no linecache lookups, no locals, and no reference
+    # to the exception or its frames is kept past this call.
+    tb = traceback.TracebackException(
+        type(exc),
+        exc,
+        exc.__traceback__,
+        lookup_lines=False,
+        capture_locals=False,
+    )
 
     return ErrorEnvelope(
-        _exc=exc,
+        _exc_type=type(exc),
+        _exc_repr=repr(exc),
         _where=where,
         _severity=severity,
         _context=dict(context or {}),
         _tags=dict(tags or {}),
         _ts=ts,
-        _traceback=tb,
+        _tb=tb,
     )
+
+
+def fingerprint(envelope: Any, *, frames: int = 5) -> Optional[str]:
+    """
+    Stable identity of an error site: exception type, `where`, and the
+    innermost `frames` frames (file, function, line). Two envelopes with the
+    same fingerprint are "the same error" for deduplication.
+
+    Returns None for objects that are not ErrorEnvelopes (custom factories).
+    """
+    if not isinstance(envelope, ErrorEnvelope):
+        return None
+
+    exc_type = envelope._exc_type
+    parts = [f"{exc_type.__module__}.{exc_type.__qualname__}", envelope._where or ""]
+    stack = envelope._tb.stack
+    for fs in stack[len(stack) - frames :] if frames > 0 else ():
+        parts.append(f"{fs.filename}:{fs.name}:{fs.lineno}")
+    key = "\n".join(parts).encode("utf-8", errors="replace")
+    return hashlib.blake2b(key, digest_size=8).hexdigest()
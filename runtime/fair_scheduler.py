@@ -0,0 +1,273 @@
+# lillycore/runtime/fair_scheduler.py
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Mapping, Optional, Tuple
+
+from lillycore.runtime.bounded_queue import POLICY_REJECT, BoundedQueue
+from lillycore.runtime.command_ingress import Command, CommandHandler
+from lillycore.runtime.heartbeat import RuntimeStopRequested
+from lillycore.runtime.tick_metrics import LatencyHistogram
+from lillycore.runtime.tick_pipeline import PHASE_PRE_TICK
+
+# report(exc, where=...): the loop's envelope path (HeartbeatLoop.report_error).
+ErrorReporter = Callable[..., Any]
+
+SessionId = str
+
+
+class _Session:
+    __slots__ = (
+        "name",
+        "queue",
+        "weight",
+        "quota",
+        "deficit",
+        "active",
+        "tick_seen",
+        "tick_count",
+        "dispatched",
+        "errors",
+        "wait",
+    )
+
+    def __init__(
+        self,
+        name: SessionId,
+        capacity: int,
+        policy: str,
+        weight: int,
+        quota: Optional[int],
+    ):
+        self.name = name
+        self.queue: BoundedQueue[Tuple[Command, int]] = BoundedQueue(capacity, policy)
+        self.weight = weight
+        self.quota = quota
+        self.deficit = 0
+        self.active = False
+        self.tick_seen = -1
+        self.tick_count = 0
+        self.dispatched = 0
+        self.errors = 0
+        self.wait = LatencyHistogram()
+
+
+class FairShareScheduler:
+    """
+    Per-session command queues scheduled by deficit round-robin (DRR).
+
+    - submit(session, cmd) queues a command for a session (thread-safe);
+      for_session(id) / tagged(session_of) return plain CommandHandlers for
+      ingress adapters
+    - run_tick() dispatches queued commands to handler(cmd), on the loop
+      thread; attach(loop) registers it as a pre_tick pipeline task
+    - each visit adds quantum * weight to a session's deficit; one command
+      costs 1. Sessions with nothing queued drop out of the ring and lose
+      their deficit, so idle sessions cannot bank credit
+    - quota (per session, else default_quota) caps commands per tick for a
+      session; max_per_tick caps the whole tick. Leftovers wait for the next
+      tick, where the ring resumes at the session that was cut off
+    - current_session is set while a handler runs
+    - handler errors are enveloped per command (where=runtime.session.<id>)
+      and do not stop other sessions; RuntimeStopRequested propagates
+
+    stats() reports per-session depth, dispatch/drop counters and queue wait
+    time (histogram); attach() registers it with the loop's logger stats.
+    """
+
+    def __init__(
+        self,
+        handler: CommandHandler,
+        *,
+        quantum: int = 1,
+        default_quota: Optional[int] = None,
+        session_quotas: Optional[Mapping[SessionId, int]] = None,
+        weights: Optional[Mapping[SessionId, int]] = None,
+        max_per_tick: Optional[int] = None,
+        max_queue_per_session: int = 1024,
+        overflow_policy: str = POLICY_REJECT,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ):
+        if quantum < 1:
+            raise ValueError("quantum must be >= 1")
+
+        self._handler = handler
+        self._quantum = quantum
+        self._default_quota = default_quota
+        self._session_quotas = dict(session_quotas or {})
+        self._weights = dict(weights or {})
+        self._max_per_tick = max_per_tick
+        self._capacity = max_queue_per_session
+        self._policy = overflow_policy
+        self._clock = clock
+
+        self._sessions: Dict[SessionId, _Session] = {}
+        self._active: Deque[_Session] = collections.deque()
+        self._lock = threading.Lock()
+        self._tick = 0
+        self._report: Optional[ErrorReporter] = None
+        self.current_session: Optional[SessionId] = None
+
+    # ---- submission ------------------------------------------------------
+
+    def submit(self, session: SessionId, cmd: Command) -> bool:
+        """
+        Queue cmd for session; False if the session queue shed it
+        (drop policies). reject raises queue.Full.
+        """
+        s = self._sessions.get(session)
+        if s is None:
+            s = self._session(session)
+        if not s.queue.put((cmd, self._clock())):
+            return False
+        with self._lock:
+            if not s.active:
+                s.active = True
+                self._active.append(s)
+        return True
+
+    def for_session(self, session: SessionId) -> CommandHandler:
+        def handler(cmd: Command) -> None:
+            self.submit(session, cmd)
+
+        return handler
+
+    def tagged(self, session_of: Callable[[], SessionId]) -> CommandHandler:
+        """
+        Handler that asks session_of() for the session of each command
+        (e.g. lambda: f"client:{socket_ingress.current_client}").
+        """
+
+        def handler(cmd: Command) -> None:
+            self.submit(session_of(), cmd)
+
+        return handler
+
+    # ---- loop integration ------------------------------------------------
+
+    def set_error_reporter(self, reporter: ErrorReporter) -> None:
+        self._report = reporter
+
+    def attach(self, loop: Any, *, name: str = "fair_share") -> Any:
+        """
+        Run as a pre_tick task of `loop` and report errors/stats through it.
+        """
+        self.set_error_reporter(loop.report_error)
+        loop.register_stats(name, self.stats)
+        return loop.register_task(self.run_tick, phase=PHASE_PRE_TICK, name=name)
+
+    def run_tick(self) -> int:
+        """
+        One DRR pass for this tick; returns the number of commands dispatched.
+        """
+        self._tick += 1
+        budget = self._max_per_tick
+        active = self._active
+        dispatched = 0
+        progress = True
+
+        while progress and active and (budget is None or dispatched < budget):
+            progress = False
+            for _ in range(len(active)):
+                s = active[0]
+                if s.tick_seen != self._tick:
+                    s.tick_seen = self._tick
+                    s.tick_count = 0
+
+                allowance = (
+                    s.quota - s.tick_count if s.quota is not None else len(s.queue)
+                )
+                if budget is not None:
+                    allowance = min(allowance, budget - dispatched)
+                if allowance <= 0:
+                    with self._lock:
+                        active.rotate(-1)
+                    continue
+
+                s.deficit += self._quantum * s.weight
+                n = self._run_session(s, min(allowance, s.deficit))
+                s.deficit -= n
+                s.tick_count += n
+                dispatched += n
+                if n:
+                    progress = True
+
+                with self._lock:
+                    if s.queue.empty():
+                        s.deficit = 0
+                        s.active = False
+                        active.popleft()
+                    else:
+                        active.rotate(-1)
+
+                if budget is not None and dispatched >= budget:
+                    break
+
+        return dispatched
+
+    def stats(self) -> Dict[str, Any]:
+        sessions = {}
+        for name, s in list(self._sessions.items()):
+            q = s.queue.stats()
+            sessions[name] = {
+                "depth": q["depth"],
+                "max_depth": q["max_depth"],
+                "enqueued": q["enqueued"],
+                "dispatched": s.dispatched,
+                "errors": s.errors,
+                "shed": q["dropped_newest"] + q["dropped_oldest"] + q["rejected"],
+                "wait": s.wait.snapshot(),
+            }
+        return {"active": len(self._active), "sessions": sessions}
+
+    # ---- internal --------------------------------------------------------
+
+    def _session(self, session: SessionId) -> _Session:
+        with self._lock:
+            s = self._sessions.get(session)
+            if s is None:
+                quota = self._session_quotas.get(session, self._default_quota)
+                s = self._sessions[session] = _Session(
+                    session,
+                    self._capacity,
+                    self._policy,
+                    self._weights.get(session, 1),
+                    quota,
+                )
+            return s
+
+    def _run_session(self, s: _Session, limit: int) -> int:
+        items = s.queue.drain(limit)
+        if not items:
+            return 0
+
+        now = self._clock()
+        record = s.wait.record
+        handler = self._handler
+        self.current_session = s.name
+        try:
+            for index, (cmd, queued_at) in enumerate(items):
+                record(now - queued_at)
+                s.dispatched += 1
+                try:
+                    handler(cmd)
+                except RuntimeStopRequested:
+                    s.queue.requeue(items[index + 1 :])
+                    raise
+                except Exception as exc:
+                    s.errors += 1
+                    if self._report is None:
+                        s.queue.requeue(items[index + 1 :])
+                        raise
+                    try:
+                        self._report(exc, where=f"runtime.session.{s.name}")
+                    except BaseException:
+                        # A failing reporter must not lose the rest of the batch.
+                        s.queue.requeue(items[index + 1 :])
+                        raise
+        finally:
+            self.current_session = None
+        return len(items)
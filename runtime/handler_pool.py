@@ -0,0 +1,261 @@
+# lillycore/runtime/handler_pool.py
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from lillycore.runtime.bounded_queue import POLICY_REJECT, BoundedQueue
+from lillycore.runtime.command_ingress import (
+    Command,
+    CommandHandler,
+    CommandIngress,
+    WakeupCallback,
+)
+from lillycore.runtime.heartbeat import RuntimeStopRequested
+
+# error_reporter(exc, where=...): the loop's envelope path (factory -> sink).
+ErrorReporter = Callable[..., Any]
+
+# on_result(command, result): called on the loop thread for successful calls.
+ResultCallback = Callable[[Command, Any], None]
+
+
+class _Completion:
+    __slots__ = ("command", "result", "error")
+
+    def __init__(self, command: Command, result: Any, error: Optional[BaseException]):
+        self.command = command
+        self.result = result
+        self.error = error
+
+
+class HandlerPool:
+    """
+    Runs a CommandHandler on a bounded pool of worker threads.
+
+    - the pool is itself a CommandHandler: calling it queues the command and
+      returns immediately, so a slow handler never holds up ingress poll()
+    - pending commands wait in a BoundedQueue (capacity max_pending, overflow
+      policy as in bounded_queue; default reject, which raises queue.Full to
+      the adapter and is enveloped like any handler error)
+    - completions are handed back through collect(), on the loop thread, by
+      OffThreadIngress; workers call the wakeup seam after each completion
+    - with max_workers > 1 handlers run concurrently and may complete out of
+      order; max_workers=1 keeps arrival order
+    """
+
+    def __init__(
+        self,
+        handler: CommandHandler,
+        *,
+        max_workers: int = 4,
+        max_pending: int = 256,
+        overflow_policy: str = POLICY_REJECT,
+        name: str = "command-handler",
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self._handler = handler
+        self._max_workers = max_workers
+        self._name = name
+        self._pending: BoundedQueue[Command] = BoundedQueue(
+            max_pending, overflow_policy
+        )
+        self._done: queue.SimpleQueue[_Completion] = queue.SimpleQueue()
+        self._wakeup: Optional[WakeupCallback] = None
+
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+
+    def __call__(self, cmd: Command) -> None:
+        if not self._threads:
+            self.start()
+        self._pending.put(cmd)
+
+    def set_wakeup(self, callback: WakeupCallback) -> None:
+        self._wakeup = callback
+
+    def start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self._max_workers):
+                t = threading.Thread(
+                    target=self._worker, name=f"{self._name}-{i}", daemon=True
+                )
+                self._threads.append(t)
+                t.start()
+
+    def collect(self) -> List[_Completion]:
+        """Completions since the last call (loop thread; non-blocking)."""
+        out = []
+        get = self._done.get_nowait
+        while True:
+            try:
+                out.append(get())
+            except queue.Empty:
+                return out
+
+    def shutdown(self, timeout: float = 0.0) -> None:
+        """
+        Stop accepting work; queued commands are discarded. Running handlers
+        are not interrupted (workers are daemon threads); wait up to timeout.
+        """
+        self._pending.close()
+        self._pending.drain()
+        for t in self._threads:
+            t.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self._max_workers,
+            "running": self._running,
+            "completed": self._completed,
+            "failed": self._failed,
+            "pending": self._pending.stats(),
+        }
+
+    # ---- internal --------------------------------------------------------
+
+    def _worker(self) -> None:
+        get = self._pending.get
+        while True:
+            try:
+                cmd = get()
+            except queue.Empty:
+                # Closed and drained.
+                return
+
+            with self._lock:
+                self._running += 1
+            try:
+                completion = _Completion(cmd, self._handler(cmd), None)
+            except Exception as exc:
+                # Includes RuntimeStopRequested, which poll() turns into a stop.
+                completion = _Completion(cmd, None, exc)
+            with self._lock:
+                self._running -= 1
+                if completion.error is None:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+
+            self._done.put(completion)
+            wakeup = self._wakeup
+            if wakeup is not None:
+                try:
+                    wakeup()
+                except Exception:
+                    # A failing wakeup only costs latency; collect() still drains.
+                    pass
+
+
+class OffThreadIngress(CommandIngress):
+    """
+    CommandIngress wrapper that runs command handlers off the loop thread.
+
+    Construct the inner adapter with the pool as its handler, then wrap it:
+
+        pool = HandlerPool(handler, max_workers=4)
+        ingress = OffThreadIngress(TerminalIngressAdapter(on_command=pool), pool)
+
+    poll() first delivers completions from previous ticks, then polls the
+    inner adapter:
+    - handler exceptions go to the loop's error reporter (set_error_reporter,
+      wired by HeartbeatLoop) and become envelopes (where=runtime.ingress.handler)
+    - RuntimeStopRequested raised by a handler stops the loop; the worker's
+      wakeup makes that prompt rather than waiting out the tick interval
+    - on_result(command, result), if set, runs on the loop thread; its
+      failures are reported as runtime.ingress.on_result
+
+    The tick cadence is therefore independent of handler latency; stop words
+    are still handled by the inner adapter's poll().
+    """
+
+    def __init__(
+        self,
+        inner: CommandIngress,
+        pool: HandlerPool,
+        *,
+        on_result: Optional[ResultCallback] = None,
+    ):
+        self._inner = inner
+        self._pool = pool
+        self._on_result = on_result
+        self._report: Optional[ErrorReporter] = None
+
+    @property
+    def inner(self) -> CommandIngress:
+        return self._inner
+
+    def set_wakeup(self, callback: WakeupCallback) -> None:
+        self._pool.set_wakeup(callback)
+        set_wakeup = getattr(self._inner, "set_wakeup", None)
+        if callable(set_wakeup):
+            set_wakeup(callback)
+
+    def set_error_reporter(self, reporter: ErrorReporter) -> None:
+        self._report = reporter
+
+    def start(self) -> None:
+        self._pool.start()
+        start = getattr(self._inner, "start", None)
+        if callable(start):
+            start()
+
+    def stop(self) -> None:
+        stop = getattr(self._inner, "stop", None)
+        if callable(stop):
+            stop()
+        self._pool.shutdown()
+
+    def poll(self) -> None:
+        # Completions are already taken from the pool: each one is delivered
+        # in its own guard so a failing callback or reporter loses no others.
+        stop = False
+        unreported: Optional[BaseException] = None
+        for completion in self._pool.collect():
+            error = completion.error
+            where = "runtime.ingress.handler"
+            if error is None:
+                if self._on_result is None:
+                    continue
+                try:
+                    self._on_result(completion.command, completion.result)
+                    continue
+                except Exception as exc:
+                    error = exc
+                    where = "runtime.ingress.on_result"
+
+            if isinstance(error, RuntimeStopRequested):
+                stop = True
+                continue
+            if self._report is not None:
+                try:
+                    self._report(error, where=where)
+                    continue
+                except Exception as exc:
+                    error = exc
+            if unreported is None:
+                unreported = error
+        if stop:
+            raise RuntimeStopRequested()
+        if unreported is not None:
+            # No reporter wired (or it failed): surface through the loop's
+            # ingress boundary.
+            raise unreported
+
+        self._inner.poll()
+
+    def stats(self) -> Dict[str, Any]:
+        inner_stats = getattr(self._inner, "stats", None)
+        return {
+            "handler_pool": self._pool.stats(),
+            "inner": inner_stats() if callable(inner_stats) else None,
+        }
@@ -1,7 +1,21 @@
 # lillycore/runtime/heartbeat.py
 
-from typing import Callable, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Mapping, Tuple
+import inspect
 import os
+import threading
+
+from lillycore.runtime.tick_pipeline import (
+    PHASE_POST_TICK,
+    PHASE_PRE_TICK,
+    PHASE_TICK,
+    TickPipeline,
+    TickTask,
+)
+from lillycore.runtime.clock import SYSTEM_CLOCK, Clock
+from lillycore.runtime.tick_metrics import TickMetrics
+from lillycore.runtime.tick_offload import OffloadTask, TickOffloader
+from lillycore.runtime.tick_scheduler import OVERRUN_CATCH_UP, TickScheduler
 
 
 class RuntimeStopRequested(Exception):
@@ -13,6 +27,66 @@ class RuntimeStopRequested(Exception):
     pass
 
 
+def _bound(obj: Any, name: str) -> Optional[Callable[..., Any]]:
+    if not obj:
+        return None
+    fn = getattr(obj, name, None)
+    return fn if callable(fn) else None
+
+
+def _accepts_var_keyword(fn: Optional[Callable[..., Any]]) -> bool:
+    if fn is None:
+        return False
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        # No introspectable signature (some builtins): call it plainly.
+        return False
+    return any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params)
+
+
+class _LoopHooks:
+    """
+    Optional logger/ingress hooks, resolved once at construction.
+
+    The loop's hot path calls the bound methods (or skips None) instead of
+    re-running hasattr() on every tick.
+    """
+
+    __slots__ = (
+        "ingress_poll",
+        "ingress_stats",
+        "logger_tick",
+        "logger_lifecycle_start",
+        "logger_lifecycle_stop",
+        "logger_finalize",
+        "logger_finalize_name",
+        "logger_finalize_fields",
+    )
+
+    def __init__(self, logger: Any, ingress: Any):
+        self.ingress_poll = _bound(ingress, "poll")
+        self.ingress_stats = _bound(ingress, "stats")
+        self.logger_tick = _bound(logger, "tick")
+        self.logger_lifecycle_start = _bound(logger, "lifecycle_start")
+        self.logger_lifecycle_stop = _bound(logger, "lifecycle_stop")
+
+        # Phase 1 logging finalization (P1.1.6):
+        # Prefer a single finalization hook if present (avoid triple-calling aliases).
+        self.logger_finalize = None
+        self.logger_finalize_name = None
+        for candidate in ("finalize", "flush", "finish"):
+            fn = _bound(logger, candidate)
+            if fn is not None:
+                self.logger_finalize = fn
+                self.logger_finalize_name = candidate
+                break
+
+        # Stats fields are only passed to a hook that takes **kwargs; a plain
+        # finalize() keeps being called with no arguments.
+        self.logger_finalize_fields = _accepts_var_keyword(self.logger_finalize)
+
+
 class HeartbeatLoop:
     """
     Phase 1 interactive heartbeat loop.
@@ -21,6 +95,10 @@ class HeartbeatLoop:
     - lifecycle sequencing
     - stop flag
     - deterministic tick progression
+    - tick cadence (optional; monotonic deadlines via TickScheduler)
+    - phased per-tick task pipeline (pre_tick -> tick -> post_tick)
+    - optional process-pool offload of declared tick tasks (TickOffloader)
+    - optional per-phase timing histograms / tick profiling (TickMetrics)
 
     Does NOT own:
     - ingress implementation
@@ -41,6 +119,19 @@ class HeartbeatLoop:
         # - sink: emits the envelope to logging or other consumers
         envelope_factory: Optional[Callable[..., Any]] = None,
         envelope_sink: Optional[Callable[[Any], None]] = None,
+        # Tick cadence: None keeps the legacy "run ticks back-to-back" behaviour
+        # (callers pace themselves inside on_tick).
+        tick_interval_sec: Optional[float] = None,
+        overrun_policy: str = OVERRUN_CATCH_UP,
+        # Optional per-phase time budgets (seconds) for registered tick tasks.
+        phase_budgets: Optional[Mapping[str, float]] = None,
+        # Optional process-pool offload for CPU-heavy tick tasks.
+        offloader: Optional[TickOffloader] = None,
+        # Time source for cadence, budgets and idle waits (VirtualClock for
+        # fast-forward deterministic runs).
+        clock: Optional[Clock] = None,
+        # Opt-in per-phase latency histograms and cProfile sampling.
+        metrics: Optional[TickMetrics] = None,
     ):
         self._on_start = on_start
         self._on_tick = on_tick
@@ -51,9 +142,41 @@ class HeartbeatLoop:
         self._envelope_factory = envelope_factory
         self._envelope_sink = envelope_sink
 
+        self._clock = clock if clock is not None else SYSTEM_CLOCK
+
+        self._hooks = _LoopHooks(logger, ingress)
+        self._pipeline = TickPipeline(phase_budgets, clock=self._clock.monotonic)
+
+        self._offloader: Optional[TickOffloader] = None
+        if offloader is not None:
+            self._attach_offloader(offloader)
+
+        self._scheduler = (
+            TickScheduler(
+                tick_interval_sec,
+                policy=overrun_policy,
+                clock=self._clock.monotonic,
+            )
+            if tick_interval_sec is not None
+            else None
+        )
+
         self._stop_requested = False
         self._stop_reason = None
 
+        # Idle-wait wakeup: ingress adapters exposing set_wakeup() (and
+        # request_stop from other threads) interrupt the wait for the next tick
+        # deadline, so commands do not sit in a queue for a whole interval.
+        self._wakeup = threading.Event()
+        if self._ingress is not None and hasattr(self._ingress, "set_wakeup"):
+            self._ingress.set_wakeup(self.wake)
+
+        # Optional error-reporter seam: adapters that finish work off the loop
+        # thread (e.g. OffThreadIngress) report errors through the same
+        # factory -> sink path as loop-thread errors.
+        if self._ingress is not None and hasattr(self._ingress, "set_error_reporter"):
+            self._ingress.set_error_reporter(self._propagate_error)
+
         # This line made unneccesary in P1.1.6
         # Phase 1 stop command triggers (P1.1.6):
         # Keep this small and explicit; command routing beyond stop remains out of scope.
@@ -64,88 +187,177 @@ class HeartbeatLoop:
         # a stable tick_id without relying on wall-clock time.
         self._tick_id = 0
 
+        # Named stats providers forwarded to the logger (tick: lazily; finalize).
+        self._stats_providers: Dict[str, Callable[[], Any]] = {}
+        if self._hooks.ingress_stats is not None:
+            self._stats_providers["ingress"] = self._hooks.ingress_stats
+
+        # Shutdown hooks (register_shutdown), run after on_stop.
+        self._shutdown_hooks: List[Tuple[str, Callable[[], Any]]] = []
+
+        # Hot-path dispatch: bound once; instrumentation swaps in timed wrappers
+        # here so an uninstrumented loop pays nothing per tick.
+        self._run_phase = self._phase_runner()
+        self._tick_runner = self._run_tick
+        self._metrics = metrics
+        if metrics is not None:
+            self._instrument(metrics)
+
     # ---- control surface -------------------------------------------------
 
     def request_stop(self, reason: Optional[str] = None):
         self._stop_requested = True
         if reason is not None:
             self._stop_reason = reason
+        self.wake()
+
+    def wake(self) -> None:
+        """
+        Interrupt the idle wait (thread-safe). Used as the ingress wakeup callback.
+        """
+        self._wakeup.set()
+
+    def register_task(
+        self,
+        fn: Callable[[], Any],
+        *,
+        phase: str = PHASE_TICK,
+        priority: int = 0,
+        name: Optional[str] = None,
+    ) -> TickTask:
+        """
+        Hang per-tick work off the loop.
+
+        phase: "pre_tick" | "tick" | "post_tick" (tick tasks run after on_tick).
+        Higher priority runs first; failures are enveloped per task as
+        "runtime.<phase>.<name>" and do not stop the other tasks.
+        """
+        return self._pipeline.register(fn, phase=phase, priority=priority, name=name)
+
+    def unregister_task(self, task: TickTask) -> None:
+        self._pipeline.unregister(task)
+
+    def offload_task(
+        self,
+        fn: Callable[..., Any],
+        *,
+        args: tuple = (),
+        every_n_ticks: int = 1,
+        deadline_sec: Optional[float] = None,
+        on_result: Optional[Callable[..., None]] = None,
+        name: Optional[str] = None,
+    ) -> OffloadTask:
+        """
+        Declare a tick task that runs in a worker process.
+
+        Submitted on every Nth tick; the result is handed to
+        on_result(result, tick_id=<submitting tick>) on a later tick, in
+        submission order. Failures and missed deadlines are enveloped as
+        "runtime.offload.<name>". A default TickOffloader is created on first
+        use if none was passed to the constructor.
+        """
+        if self._offloader is None:
+            self._attach_offloader(TickOffloader(clock=self._clock.monotonic))
+        return self._offloader.declare(
+            fn,
+            args=args,
+            every_n_ticks=every_n_ticks,
+            deadline_sec=deadline_sec,
+            on_result=on_result,
+            name=name,
+        )
+
+    def register_stats(self, name: str, provider: Callable[[], Any]) -> None:
+        """
+        Expose a component's stats() to the logger under `name`: passed
+        lazily with logger.tick() fields and evaluated at finalize.
+        """
+        self._stats_providers[name] = provider
+
+    def register_shutdown(self, fn: Callable[[], Any], *, name: str) -> None:
+        """
+        Run fn() during shutdown, in registration order: after on_stop (also
+        when on_stop or the forced shutdown error raised) and the offloader,
+        before the logger is finalized. Failures are enveloped as
+        "runtime.shutdown.<name>".
+        """
+        self._shutdown_hooks.append((name, fn))
+
+    def report_error(self, exc: Exception, *, where: str) -> Any:
+        """
+        Envelope an error caught by a component (factory -> sink), the same
+        path the loop uses for its own hooks.
+        """
+        return self._propagate_error(exc, where=where)
+
+    def metrics_snapshot(self) -> Optional[dict]:
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot()
+
+    def offload_stats(self) -> Optional[dict]:
+        if self._offloader is None:
+            return None
+        return self._offloader.stats()
+
+    def pipeline_stats(self) -> dict:
+        return self._pipeline.stats()
+
+    @property
+    def clock(self) -> Clock:
+        return self._clock
+
+    @property
+    def tick_id(self) -> int:
+        return self._tick_id
+
+    def timing_stats(self) -> Optional[dict]:
+        """
+        Per-tick lag/jitter numbers from the scheduler (None when unpaced).
+        """
+        if self._scheduler is None:
+            return None
+        return self._scheduler.stats()
 
     # ---- lifecycle -------------------------------------------------------
 
     def run(self):
         try:
-            # Phase 1 logging hook: lifecycle start
-            # - Do not assume a logging backend.
-            # - If a unified runtime logger exists (P1.1.5), it can expose
-            #   lifecycle_start(). If not, this becomes a no-op.
-            if self._logger and hasattr(self._logger, "lifecycle_start"):
-                try:
-                    self._logger.lifecycle_start(component="core_runtime")
-                except Exception:
-                    # Logging MUST NOT break runtime control flow in Phase 1.
-                    pass
+            self._lifecycle_start()
 
             if self._on_start:
                 self._on_start()
 
+            scheduler = self._scheduler
+            if scheduler is not None:
+                scheduler.start()
+
+            # Hooks are final once constructed (instrumentation included).
+            poll_ingress = self._hooks.ingress_poll is not None
+            run_tick = self._tick_runner
+
             while not self._stop_requested:
 
-                # Phase 1 stop/shutdown semantics (P1.1.6):
-                # Ingress is a seam. Adapters may implement command handling via
-                # a handler callback (raising RuntimeStopRequested as control flow).
-                if self._ingress and hasattr(self._ingress, "poll"):
-                    try:
-                        self._ingress.poll()
-                    except RuntimeStopRequested:
-                        # Control signal: not an envelope.
-                        self.request_stop(reason="command:handler")
+                # Tick cadence: wait for the next absolute deadline so tick work
+                # time does not stretch the period.
+                if scheduler is not None:
+                    self._idle_until_due(scheduler)
+                    if self._stop_requested:
+                        break
+
+                if poll_ingress:
+                    self._poll_ingress()
+                    if self._stop_requested:
                         continue
-                    except Exception as exc:
-                        # Ingress failure is a boundary error: envelope it.
-                        self._propagate_error(exc, where="runtime.ingress")
 
-                try:
-                    # Deterministic tick progression (owned by the loop).
-                    self._tick_id += 1
-
-                    # Phase 1 logging hook: bounded heartbeat/tick
-                    # Heartbeat "spam control" is handled by the logger/settings,
-                    # not by the runtime loop. The loop only provides tick_id.
-                    if self._logger and hasattr(self._logger, "tick"):
-                        try:
-                            self._logger.tick(tick_id=self._tick_id)
-                        except Exception:
-                            # Logging MUST NOT break runtime control flow in Phase 1.
-                            pass
-
-                    if self._on_tick:
-                        self._on_tick()
-                except RuntimeStopRequested:
-                    # Stop requested; reason may already be set.
-                    self._stop_requested = True
-                except Exception as exc:
-                    self._propagate_error(exc)
+                run_tick()
 
         finally:
-            # Phase 1 logging hook: lifecycle stop
-            if self._logger and hasattr(self._logger, "lifecycle_stop"):
-                try:
-                    self._logger.lifecycle_stop(component="core_runtime")
-                except Exception as exc:
-                    # Shutdown-time errors MUST be enveloped and logged (P1.1.6).
-                    self._propagate_error(exc, where="runtime.shutdown.lifecycle_stop")
+            self._lifecycle_stop()
 
             if self._on_stop:
                 try:
-                    # Negative-path shutdown proof hook (P1.1.6):
-                    # FORCE_SHUTDOWN_ERROR=1 forces an exception during shutdown (on_stop)
-                    # which MUST be enveloped and logged.
-                    if os.getenv("FORCE_SHUTDOWN_ERROR") == "1":
-                        raise RuntimeError(
-                            "Forced shutdown error (FORCE_SHUTDOWN_ERROR=1)"
-                        )
-
+                    self._check_forced_shutdown_error()
                     self._on_stop()
                 except RuntimeStopRequested:
                     # Control signal: MUST NOT be wrapped as an envelope.
@@ -155,22 +367,223 @@ class HeartbeatLoop:
                     # Shutdown-time errors MUST be enveloped and logged (P1.1.6).
                     self._propagate_error(exc, where="runtime.shutdown.on_stop")
 
-            # Phase 1 logging finalization (P1.1.6):
-            # Prefer a single finalization hook if present (avoid triple-calling aliases).
-            if self._logger:
-                hook_name = None
-                for candidate in ("finalize", "flush", "finish"):
-                    if hasattr(self._logger, candidate):
-                        hook_name = candidate
-                        break
+            self._shutdown_offloader()
+            for name, hook in self._shutdown_hooks:
+                try:
+                    hook()
+                except Exception as exc:
+                    self._propagate_error(exc, where=f"runtime.shutdown.{name}")
+            self._finalize_logger()
+
+    def _run_tick(self) -> None:
+        # Hot path: tick bookkeeping is inlined and empty phases are skipped
+        # (pipeline.active is maintained at registration).
+        self._tick_id += 1
+        scheduler = self._scheduler
+        if scheduler is not None:
+            scheduler.begin_tick()
+        if self._hooks.logger_tick is not None:
+            self._log_tick()
+
+        active = self._pipeline.active
+        run_phase = self._run_phase
+        try:
+            if active[PHASE_PRE_TICK]:
+                run_phase(PHASE_PRE_TICK, self._propagate_error)
+
+            if self._on_tick:
+                try:
+                    self._on_tick()
+                except RuntimeStopRequested:
+                    raise
+                except Exception as exc:
+                    self._propagate_error(exc)
+
+            if active[PHASE_TICK]:
+                run_phase(PHASE_TICK, self._propagate_error)
+            if active[PHASE_POST_TICK]:
+                run_phase(PHASE_POST_TICK, self._propagate_error)
+        except RuntimeStopRequested:
+            # Stop requested; reason may already be set.
+            self._stop_requested = True
+        except Exception as exc:
+            self._propagate_error(exc)
+
+    def _phase_runner(self) -> Callable[..., Any]:
+        return self._pipeline.run_phase
+
+    def _instrument(self, metrics: TickMetrics) -> None:
+        hooks = self._hooks
+        if hooks.ingress_poll is not None:
+            hooks.ingress_poll = metrics.timed("ingress.poll", hooks.ingress_poll)
+        if hooks.logger_tick is not None:
+            hooks.logger_tick = metrics.timed("logger.tick", hooks.logger_tick)
+        if self._on_tick is not None:
+            self._on_tick = metrics.timed("on_tick", self._on_tick)
+        if self._envelope_sink is not None:
+            self._envelope_sink = metrics.timed("envelope", self._envelope_sink)
+
+        self._run_phase = metrics.timed_phase(
+            {
+                PHASE_PRE_TICK: "pre_tick",
+                PHASE_TICK: "tick_tasks",
+                PHASE_POST_TICK: "post_tick",
+            },
+            self._run_phase,
+        )
+        self._tick_runner = metrics.timed_tick(self._tick_runner, lambda: self._tick_id)
+
+    def _attach_offloader(self, offloader: TickOffloader) -> None:
+        # Results are collected before tick work (so on_result sees a consistent
+        # tick) and new work is submitted after it; both ride the pipeline.
+        self._offloader = offloader
+        self._pipeline.register(
+            lambda: offloader.collect(self._propagate_error),
+            phase=PHASE_PRE_TICK,
+            priority=1_000_000,
+            name="offload.collect",
+        )
+        self._pipeline.register(
+            lambda: offloader.submit_due(self._tick_id, self._propagate_error),
+            phase=PHASE_POST_TICK,
+            priority=-1_000_000,
+            name="offload.submit",
+        )
+
+    def _shutdown_offloader(self) -> None:
+        if self._offloader is None:
+            return
+        try:
+            self._offloader.shutdown()
+        except Exception as exc:
+            self._propagate_error(exc, where="runtime.shutdown.offload")
+
+    def _idle_until_due(self, scheduler: TickScheduler) -> None:
+        # Wait for the tick deadline, servicing ingress whenever it signals
+        # input. Ticks keep their cadence; commands are dispatched on arrival.
+        wakeup = self._wakeup
+        clock = self._clock
+        while True:
+            remaining = scheduler.remaining()
+            if remaining <= 0:
+                return
+            if not clock.wait(wakeup, remaining):
+                return
+            wakeup.clear()
+            if self._stop_requested:
+                return
+            self._poll_ingress()
+            if self._stop_requested:
+                return
+
+    def _poll_ingress(self) -> None:
+        # Phase 1 stop/shutdown semantics (P1.1.6):
+        # Ingress is a seam. Adapters may implement command handling via
+        # a handler callback (raising RuntimeStopRequested as control flow).
+        poll = self._hooks.ingress_poll
+        if poll is not None:
+            try:
+                poll()
+            except RuntimeStopRequested:
+                # Control signal: not an envelope.
+                self.request_stop(reason="command:handler")
+            except Exception as exc:
+                # Ingress failure is a boundary error: envelope it.
+                self._propagate_error(exc, where="runtime.ingress")
+
+    # ---- lifecycle steps (shared with AsyncHeartbeatLoop) -----------------
+
+    def _lifecycle_start(self) -> None:
+        # Phase 1 logging hook: lifecycle start
+        # - Do not assume a logging backend.
+        # - If a unified runtime logger exists (P1.1.5), it can expose
+        #   lifecycle_start(). If not, this becomes a no-op.
+        lifecycle_start = self._hooks.logger_lifecycle_start
+        if lifecycle_start is not None:
+            try:
+                lifecycle_start(component="core_runtime")
+            except Exception:
+                # Logging MUST NOT break runtime control flow in Phase 1.
+                pass
+
+    def _log_tick(self) -> None:
+        # Phase 1 logging hook: bounded heartbeat/tick
+        # Heartbeat "spam control" is handled by the logger/settings,
+        # not by the runtime loop. The loop only provides tick_id.
+        # Stats providers (register_stats; ingress.stats) are passed as
+        # callables, not results, so the logger only builds the dicts on
+        # ticks it actually emits.
+        logger_tick = self._hooks.logger_tick
+        scheduler = self._scheduler
+        try:
+            if self._stats_providers:
+                fields = dict(self._stats_providers)
+                if scheduler is not None:
+                    fields["lag_ms"] = scheduler.lag_sec * 1000.0
+                    fields["jitter_ms"] = scheduler.jitter_sec * 1000.0
+                logger_tick(tick_id=self._tick_id, **fields)
+            elif scheduler is not None:
+                logger_tick(
+                    tick_id=self._tick_id,
+                    lag_ms=scheduler.lag_sec * 1000.0,
+                    jitter_ms=scheduler.jitter_sec * 1000.0,
+                )
+            else:
+                logger_tick(tick_id=self._tick_id)
+        except Exception:
+            # Logging MUST NOT break runtime control flow in Phase 1.
+            pass
+
+    def _lifecycle_stop(self) -> None:
+        # Phase 1 logging hook: lifecycle stop
+        lifecycle_stop = self._hooks.logger_lifecycle_stop
+        if lifecycle_stop is not None:
+            try:
+                lifecycle_stop(component="core_runtime")
+            except Exception as exc:
+                # Shutdown-time errors MUST be enveloped and logged (P1.1.6).
+                self._propagate_error(exc, where="runtime.shutdown.lifecycle_stop")
+
+    def _check_forced_shutdown_error(self) -> None:
+        # Negative-path shutdown proof hook (P1.1.6):
+        # FORCE_SHUTDOWN_ERROR=1 forces an exception during shutdown (on_stop)
+        # which MUST be enveloped and logged.
+        if os.getenv("FORCE_SHUTDOWN_ERROR") == "1":
+            raise RuntimeError("Forced shutdown error (FORCE_SHUTDOWN_ERROR=1)")
+
+    def _finalize_logger(self) -> Any:
+        # Phase 1 logging finalization (P1.1.6): single hook, resolved once.
+        finalize = self._hooks.logger_finalize
+        if finalize is None:
+            return None
+
+        # Each field is built in its own guard: a failing stats provider
+        # becomes an error marker and never skips finalization.
+        fields = {}
+        for name, provider in self._stats_providers.items():
+            fields[name] = self._final_field(provider)
+        if self._metrics is not None:
+            # Shutdown dump: the finalize hook receives the metrics snapshot
+            # as a structured field (and TickMetrics may also write a file).
+            fields["tick_metrics"] = self._final_field(self._metrics.dump)
 
-                if hook_name is not None:
-                    try:
-                        getattr(self._logger, hook_name)()
-                    except Exception as exc:
-                        self._propagate_error(
-                            exc, where=f"runtime.shutdown.logger.{hook_name}"
-                        )
+        try:
+            if self._hooks.logger_finalize_fields:
+                return finalize(**fields)
+            # Plain hook: stats are still collected (metrics dump side effects).
+            return finalize()
+        except Exception as exc:
+            self._propagate_error(
+                exc, where=f"runtime.shutdown.logger.{self._hooks.logger_finalize_name}"
+            )
+            return None
+
+    @staticmethod
+    def _final_field(provider: Callable[[], Any]) -> Any:
+        try:
+            return provider()
+        except Exception as exc:
+            return {"__error__": f"{type(exc).__name__}: {exc}"}
 
     # ---- error handling --------------------------------------------------
 
@@ -194,4 +607,4 @@ class HeartbeatLoop:
         if self._logger:
             self._logger.error("Unhandled exception in heartbeat loop", exc_info=exc)
         else:
-            raise
+            raise exc
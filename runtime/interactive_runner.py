@@ -1,7 +1,23 @@
 # lillycore/runtime/interactive_runner.py
 
-import time
+from lillycore.runtime.async_heartbeat import AsyncHeartbeatLoop
+from lillycore.runtime.clock import SYSTEM_CLOCK
+from lillycore.runtime.envelope_aggregator import EnvelopeAggregator
+from lillycore.runtime.envelope_dispatcher import EnvelopeDispatcher
 from lillycore.runtime.heartbeat import HeartbeatLoop
+from lillycore.runtime.runtime_system_settings import (
+    DEFAULT_ASYNC_ENABLED,
+    DEFAULT_ENVELOPE_DISPATCH_ASYNC,
+    DEFAULT_ENVELOPE_SUMMARY_INTERVAL_MS,
+)
+from lillycore.runtime.tick_scheduler import OVERRUN_CATCH_UP
+
+
+def _setting(settings, key, default=None):
+    # Settings may be a dict or a RuntimeSystemSettings-style object.
+    if isinstance(settings, dict):
+        return settings.get(key, default)
+    return getattr(settings, key, default)
 
 
 def run_interactive(
@@ -14,12 +30,45 @@ def run_interactive(
     envelope_sink,
     tick_interval_sec: float = 0.5,
     max_ticks: int | None = None,
+    overrun_policy: str | None = None,
+    async_mode: bool | None = None,
+    clock=None,
+    envelope_summary_interval_sec: float | None = None,
+    envelope_buffer=None,
+    envelope_dispatch: bool | None = None,
+    envelope_drain_timeout_sec: float = 2.0,
+    session_scheduler=None,
 ):
 
     """
     Phase 1 interactive runtime runner.
 
     All integrations are passed in.
+
+    async_mode=None follows the `async_enabled` runtime setting (default off):
+    when enabled the returned loop is an AsyncHeartbeatLoop (run() still
+    blocks, so call sites do not change).
+
+    clock: shared time source (see lillycore.runtime.clock); pass a VirtualClock
+    for fast-forward deterministic runs.
+
+    envelope_summary_interval_sec=None follows `envelope_summary_interval_ms`
+    (default 0 = off, every envelope in full): when > 0, repeats of an
+    envelope are collapsed into one summary per interval by an
+    EnvelopeAggregator in front of the sink.
+
+    envelope_buffer: optional EnvelopeRingBuffer (or any callable) that sees
+    every envelope, before deduplication, e.g. for an "errors" command.
+
+    envelope_dispatch=None follows `envelope_dispatch_async` (default off:
+    the logger and envelope_sink run synchronously on the tick thread). When
+    on they run on EnvelopeDispatcher lanes, which shed the oldest envelopes
+    under load, and are drained at shutdown within envelope_drain_timeout_sec.
+
+    session_scheduler: optional FairShareScheduler the ingress handlers submit
+    to (for_session / tagged). It is attached to the loop: one fair-share pass
+    per tick (pre_tick), handler errors enveloped per session and per-session
+    stats passed to the logger (tick and finalize fields, "fair_share").
     """
 
     # ---- settings -------------------------------------------------------
@@ -39,6 +88,32 @@ def run_interactive(
             # Settings must not break the runtime in Phase 1; keep the default.
             pass
 
+    # Tick cadence is owned by the heartbeat loop (monotonic deadlines), so
+    # tick work time no longer stretches the period. Explicit argument wins
+    # over settings.
+    if overrun_policy is None:
+        overrun_policy = str(
+            _setting(settings, "tick_overrun_policy", OVERRUN_CATCH_UP)
+        )
+
+    if async_mode is None:
+        async_mode = bool(_setting(settings, "async_enabled", DEFAULT_ASYNC_ENABLED))
+
+    if envelope_dispatch is None:
+        envelope_dispatch = bool(
+            _setting(
+                settings, "envelope_dispatch_async", DEFAULT_ENVELOPE_DISPATCH_ASYNC
+            )
+        )
+
+    if envelope_summary_interval_sec is None:
+        envelope_summary_interval_ms = _setting(
+            settings,
+            "envelope_summary_interval_ms",
+            DEFAULT_ENVELOPE_SUMMARY_INTERVAL_MS,
+        )
+        envelope_summary_interval_sec = int(envelope_summary_interval_ms) / 1000.0
+
     # If the logger supports being configured from settings, allow it.
     # This keeps logging verbosity/heartbeat emission controlled by settings (P1.1.5)
     # without assuming a specific logging backend implementation.
@@ -59,20 +134,68 @@ def run_interactive(
     # Phase 1 envelope integration boundary (P1.1.4):
     # - treat envelope as opaque (do not inspect schema)
     # - ensure envelope propagation reaches unified logging (P1.1.5)
-    def _envelope_sink_wrapped(envelope_obj):
+    log_envelopes = bool(logger and hasattr(logger, "envelope"))
+
+    def _log_envelope(envelope_obj):
         # If the logger supports a first-class envelope event, emit it.
-        if logger and hasattr(logger, "envelope"):
-            try:
-                logger.envelope(envelope_obj, source="runtime_boundary")
-            except Exception:
-                # Logging MUST NOT break runtime control flow in Phase 1.
-                pass
+        try:
+            logger.envelope(envelope_obj, source="runtime_boundary")
+        except Exception:
+            # Logging MUST NOT break runtime control flow in Phase 1.
+            pass
 
-        # Preserve existing sink behaviour if provided.
+    # Slow sinks (disk, socket) run on dispatcher lanes, so an error burst
+    # does not become tick latency; each sink fails and stalls on its own.
+    dispatcher = None
+    if envelope_dispatch:
+        # Coroutine sinks are scheduled onto the async loop's event loop.
+        dispatcher = EnvelopeDispatcher(
+            event_loop=(lambda: loop.event_loop) if async_mode else None
+        )
+        if log_envelopes:
+            dispatcher.add_sink("logger", _log_envelope)
         if envelope_sink:
-            return envelope_sink(envelope_obj)
+            dispatcher.add_sink("sink", envelope_sink)
+        deliver = dispatcher
+    else:
 
-        return None
+        def deliver(envelope_obj):
+            if log_envelopes:
+                _log_envelope(envelope_obj)
+
+            # Preserve existing sink behaviour if provided.
+            if envelope_sink:
+                return envelope_sink(envelope_obj)
+
+            return None
+
+    # Error storms (e.g. a persistently failing tick): first occurrence in
+    # full, repeats as periodic summaries.
+    def _envelope_summary(summary):
+        if logger and hasattr(logger, "envelope_summary"):
+            logger.envelope_summary(**summary, source="runtime_boundary")
+
+    aggregator = None
+    loop_envelope_sink = deliver
+    if envelope_summary_interval_sec > 0:
+        aggregator = EnvelopeAggregator(
+            deliver,
+            summary_interval_sec=envelope_summary_interval_sec,
+            on_summary=_envelope_summary,
+            clock=(clock or SYSTEM_CLOCK).monotonic,
+        )
+        loop_envelope_sink = aggregator
+
+    if envelope_buffer is not None:
+        _dedup_sink = loop_envelope_sink
+
+        def loop_envelope_sink(envelope_obj):
+            try:
+                envelope_buffer(envelope_obj)
+            except Exception:
+                # Diagnostics MUST NOT break runtime control flow in Phase 1.
+                pass
+            return _dedup_sink(envelope_obj)
 
     # ---- lifecycle hooks ------------------------------------------------
 
@@ -96,19 +219,59 @@ def run_interactive(
                     loop.request_stop()
                 return
 
-        time.sleep(tick_interval_sec)
-
     def on_stop():
         logger.info("Runtime stopping (Phase 1 interactive)")
+        if ingress_adapter and hasattr(ingress_adapter, "stop"):
+            ingress_adapter.stop()
 
-    loop = HeartbeatLoop(
+    def close_envelopes():
+        # Loop shutdown hook: runs after on_stop even when it (or the forced
+        # shutdown error) raised, so shutdown envelopes reach the sinks before
+        # the logger is finalized.
+        if dispatcher is not None:
+            # Queued envelopes first; later ones are delivered synchronously.
+            dispatcher.close(envelope_drain_timeout_sec)
+        if aggregator is not None:
+            aggregator.flush()
+        if dispatcher is not None and async_mode:
+            # Awaited by AsyncHeartbeatLoop: coroutine sinks scheduled onto its
+            # event loop finish before the logger is finalized.
+            return dispatcher.wait_scheduled(envelope_drain_timeout_sec)
+        return None
+
+    loop_cls = AsyncHeartbeatLoop if async_mode else HeartbeatLoop
+    loop = loop_cls(
         on_start=on_start,
         on_tick=on_tick,
         on_stop=on_stop,
         logger=logger,
         ingress=ingress_adapter,
         envelope_factory=envelope_factory,
-        envelope_sink=_envelope_sink_wrapped,
+        envelope_sink=loop_envelope_sink,
+        tick_interval_sec=tick_interval_sec,
+        overrun_policy=overrun_policy,
+        clock=clock,
     )
+    if aggregator is not None:
+        aggregator.attach(loop)
+    if session_scheduler is not None:
+        session_scheduler.attach(loop)
+    if dispatcher is not None or aggregator is not None:
+        loop.register_shutdown(close_envelopes, name="envelopes")
+    if dispatcher is not None:
+        loop.register_stats("envelope_dispatch", dispatcher.stats)
+    if envelope_buffer is not None and hasattr(envelope_buffer, "stats"):
+        loop.register_stats("envelope_buffer", envelope_buffer.stats)
 
     return loop
+
+
+def run_interactive_async(**kwargs) -> AsyncHeartbeatLoop:
+    """
+    Same contract as run_interactive, but always returns an AsyncHeartbeatLoop.
+
+    ingress.poll() and envelope sinks may be coroutines.
+    Use `await loop.run_async()` from inside an existing event loop.
+    """
+    kwargs["async_mode"] = True
+    return run_interactive(**kwargs)
@@ -0,0 +1,153 @@
+# lillycore/runtime/log_encoder.py
+
+from __future__ import annotations
+
+import json
+import math
+from datetime import datetime, timezone
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+# Static fragment caches are cleared past this size (event names are
+# expected to be a small fixed set; this only guards against unbounded ones).
+_CACHE_LIMIT = 4096
+
+_Encode = Callable[[Any], str]
+
+
+def _repr_wrapper(obj: Any) -> Dict[str, str]:
+    """
+    Phase 1 rule: do not invent schema for envelopes or other opaque objects;
+    what JSON cannot encode is logged as a repr wrapper.
+    """
+    return {"__repr__": repr(obj), "__type__": type(obj).__name__}
+
+
+def _encode_float(value: float) -> str:
+    # Same spelling as json.dumps (allow_nan=True).
+    if value != value:
+        return "NaN"
+    if value in (math.inf, -math.inf):
+        return "Infinity" if value > 0 else "-Infinity"
+    return float.__repr__(value)
+
+
+def _encode_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _encode_none(value: None) -> str:
+    return "null"
+
+
+class RecordEncoder:
+    """
+    Single-pass JSON Lines encoder for RuntimeLogger records.
+
+    Output is what json.dumps(record, ensure_ascii=False) gives for
+    {"ts", "level", "event", "fields"}, except that values JSON cannot encode
+    become a repr wrapper at the leaf instead of for the whole field.
+
+    - field values go through a per-type dispatch table (exact type ->
+      encoder, filled on first sight); str/int/float/bool/None are encoded
+      directly, containers by the C encoder with the repr wrapper as default
+    - a field the C encoder still rejects (non-string dict keys, cycles) is
+      wrapped as a whole, so encoding never raises
+    - the '", "level": ..., "fields": {' fragment is precomputed per
+      (level, event); field keys are encoded once
+    - the timestamp text up to the millisecond is reused while records fall
+      in the same millisecond
+    """
+
+    def __init__(self):
+        self._container = json.JSONEncoder(
+            ensure_ascii=False, default=_repr_wrapper
+        ).encode
+        self._dispatch: Dict[type, _Encode] = {
+            str: encode_basestring,
+            int: int.__repr__,
+            float: _encode_float,
+            bool: _encode_bool,
+            type(None): _encode_none,
+        }
+        self._heads: Dict[Tuple[str, str], str] = {}
+        self._keys: Dict[str, str] = {}
+        # (sec, ms) -> text up to the millisecond; swapped as one tuple so
+        # concurrent encoders never pair a key with another prefix.
+        self._ts_cache: Tuple[Optional[Tuple[int, int]], str] = (None, "")
+
+    def encode(
+        self, level: str, event: str, fields: Mapping[str, Any], ts: float
+    ) -> str:
+        """One record as a JSON line (with the trailing newline)."""
+        head = self._heads.get((level, event))
+        if head is None:
+            head = self._head(level, event)
+
+        if not fields:
+            return '{"ts": "' + self.timestamp(ts) + head + "}}\n"
+
+        dispatch = self._dispatch
+        keys = self._keys
+        parts = []
+        for key, value in fields.items():
+            k = keys.get(key)
+            if k is None:
+                k = self._key(key)
+            enc = dispatch.get(type(value))
+            if enc is None:
+                enc = dispatch[type(value)] = self._container
+            try:
+                v = enc(value)
+            except (TypeError, ValueError):
+                v = self._container(_repr_wrapper(value))
+            parts.append(k + v)
+        return '{"ts": "' + self.timestamp(ts) + head + ", ".join(parts) + "}}\n"
+
+    def timestamp(self, ts: float) -> str:
+        """
+        datetime.fromtimestamp(ts, timezone.utc).isoformat(), reusing the
+        text up to the millisecond.
+        """
+        frac, whole = math.modf(ts)
+        sec = int(whole)
+        us = round(frac * 1e6)
+        if us >= 1000000:
+            sec += 1
+            us -= 1000000
+        elif us < 0:
+            sec -= 1
+            us += 1000000
+        if us == 0:
+            # isoformat() drops a zero fraction entirely.
+            return datetime.fromtimestamp(sec, timezone.utc).isoformat()
+
+        ms, rest = divmod(us, 1000)
+        key = (sec, ms)
+        cached_key, prefix = self._ts_cache
+        if key != cached_key:
+            base = datetime.fromtimestamp(sec, timezone.utc).isoformat()
+            prefix = f"{base[:-6]}.{ms:03d}"
+            self._ts_cache = (key, prefix)
+        return f"{prefix}{rest:03d}+00:00"
+
+    # ---- internal --------------------------------------------------------
+
+    def _head(self, level: str, event: str) -> str:
+        if len(self._heads) >= _CACHE_LIMIT:
+            self._heads.clear()
+        head = (
+            '", "level": '
+            + encode_basestring(level.upper())
+            + ', "event": '
+            + encode_basestring(event)
+            + ', "fields": {'
+        )
+        self._heads[(level, event)] = head
+        return head
+
+    def _key(self, key: str) -> str:
+        if len(self._keys) >= _CACHE_LIMIT:
+            self._keys.clear()
+        k = self._keys[key] = encode_basestring(key) + ": "
+        return k
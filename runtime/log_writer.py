@@ -0,0 +1,170 @@
+# lillycore/runtime/log_writer.py
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional, TextIO
+
+from lillycore.runtime.bounded_queue import POLICY_BLOCK, BoundedQueue
+
+
+class BufferedLogWriter:
+    """
+    Writes log lines to a stream from a background thread.
+
+    - write(line) only queues the line (BoundedQueue: capacity and overflow
+      policy as in bounded_queue; default block, so nothing is lost and a
+      producer that outruns the stream is slowed down instead)
+    - the writer thread takes everything queued per wakeup and hands it to
+      the stream as one write() call
+    - stream.flush() happens once flush_bytes (counted in characters) have
+      been written since the last flush, or flush_interval_sec after the
+      first unflushed write
+    - drain(timeout) waits until every queued line has been written, then
+      flushes; close(timeout) drains and stops the thread. After close(),
+      write() goes straight to the stream
+    - stream errors are counted in stats(), never raised to the producer
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        *,
+        capacity: int = 8192,
+        overflow_policy: str = POLICY_BLOCK,
+        flush_bytes: int = 1 << 16,
+        flush_interval_sec: float = 0.05,
+        name: str = "log-writer",
+    ):
+        self._stream = stream
+        self._flush_bytes = flush_bytes
+        self._flush_interval = flush_interval_sec
+        self._q: BoundedQueue[str] = BoundedQueue(capacity, overflow_policy)
+
+        # Serializes stream access between the writer thread and drain().
+        self._stream_lock = threading.Lock()
+        self._done = threading.Condition()
+        self._written = 0
+        self._unflushed = 0
+        self._closed = False
+
+        self._writes = 0
+        self._flushes = 0
+        self._bytes = 0
+        self._errors = 0
+        self._last_error: Optional[str] = None
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        if self._closed:
+            self._write_now(line)
+            return
+        try:
+            self._q.put(line)
+        except queue.Full:
+            # reject policy: counted by the queue; never raise into the caller.
+            pass
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every line queued so far is written, then flush the
+        stream; False if the timeout expired first.
+        """
+        with self._done:
+            done = self._done.wait_for(self._idle, timeout)
+        with self._stream_lock:
+            self._flush()
+        return done
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """drain(timeout), then stop the writer thread."""
+        done = self.drain(timeout)
+        self._closed = True
+        self._q.close()
+        return done
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "writes": self._writes,
+            "flushes": self._flushes,
+            "bytes": self._bytes,
+            "errors": self._errors,
+            "last_error": self._last_error,
+            "queue": self._q.stats(),
+        }
+
+    # ---- internal --------------------------------------------------------
+
+    def _idle(self) -> bool:
+        # The writer is the only consumer: every line it took is written.
+        return self._q.empty() and self._written == self._q.dequeued
+
+    def _run(self) -> None:
+        get = self._q.get
+        drain = self._q.drain
+        flush_due: Optional[float] = None
+        while True:
+            timeout = None
+            if flush_due is not None:
+                timeout = max(0.0, flush_due - time.monotonic())
+            try:
+                first = get(timeout)
+            except queue.Empty:
+                with self._stream_lock:
+                    self._flush()
+                flush_due = None
+                if self._q.closed and self._q.empty():
+                    return
+                continue
+
+            lines = drain()
+            lines.insert(0, first)
+            with self._stream_lock:
+                self._write_chunk("".join(lines))
+                if self._unflushed >= self._flush_bytes or (
+                    flush_due is not None and time.monotonic() >= flush_due
+                ):
+                    self._flush()
+            if self._unflushed == 0:
+                flush_due = None
+            elif flush_due is None:
+                flush_due = time.monotonic() + self._flush_interval
+
+            with self._done:
+                self._written += len(lines)
+                self._done.notify_all()
+
+    def _write_now(self, line: str) -> None:
+        with self._stream_lock:
+            self._write_chunk(line)
+            self._flush()
+
+    def _write_chunk(self, data: str) -> None:
+        try:
+            self._stream.write(data)
+        except Exception as exc:
+            # Logging MUST NOT break runtime control flow in Phase 1.
+            self._record_error(exc)
+            return
+        self._writes += 1
+        self._bytes += len(data)
+        self._unflushed += len(data)
+
+    def _flush(self) -> None:
+        if not self._unflushed:
+            return
+        self._unflushed = 0
+        try:
+            self._stream.flush()
+        except Exception as exc:
+            self._record_error(exc)
+            return
+        self._flushes += 1
+
+    def _record_error(self, exc: Exception) -> None:
+        self._errors += 1
+        self._last_error = f"{type(exc).__name__}: {exc}"
@@ -0,0 +1,242 @@
+# lillycore/runtime/multiplex_ingress.py
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional
+
+from lillycore.runtime.command_ingress import CommandIngress, WakeupCallback
+from lillycore.runtime.heartbeat import RuntimeStopRequested
+
+# report(exc, where=...): the loop's envelope path (factory -> sink).
+ErrorReporter = Callable[..., Any]
+
+
+def _bound(obj: Any, name: str) -> Optional[Callable[..., Any]]:
+    fn = getattr(obj, name, None)
+    return fn if callable(fn) else None
+
+
+class _Source:
+    __slots__ = (
+        "name",
+        "adapter",
+        "weight",
+        "control",
+        "poll",
+        "poll_bounded",
+        "pending",
+        "polls",
+        "commands",
+        "idle_skips",
+        "errors",
+    )
+
+    def __init__(self, name: str, adapter: Any, weight: int, control: bool):
+        self.name = name
+        self.adapter = adapter
+        self.weight = weight
+        self.control = control
+        # Optional seams, resolved once (see BoundedCommandIngress).
+        self.poll = adapter.poll
+        self.poll_bounded = _bound(adapter, "poll_bounded")
+        self.pending = _bound(adapter, "pending")
+        self.polls = 0
+        self.commands = 0
+        self.idle_skips = 0
+        self.errors = 0
+
+
+class MultiplexIngress(CommandIngress):
+    """
+    One CommandIngress composed of several named sources.
+
+    - add_source(name, adapter, weight=1, control=False)
+    - control sources are polled first, without a budget, so stop/quit stays
+      responsive under bulk input
+    - other sources share budget_per_poll commands per poll() in proportion
+      to their weight; budget a source leaves unused goes to the others
+      (None = no budget: every source is drained). The source that gets first
+      claim rotates between polls, so a budget smaller than the number of
+      busy sources still reaches each of them in turn
+    - sources with pending() == 0 are skipped without calling poll()
+    - sources without poll_bounded() are polled unbounded (counted as 1)
+    - current_source names the source being polled, so handlers can tag
+      where a command came from
+    - a source's errors are enveloped via the loop's error reporter
+      (where=runtime.ingress.<name>) and do not stop the other sources;
+      RuntimeStopRequested from any source stops the loop
+    - start/stop/set_wakeup fan out to every source that supports them
+    """
+
+    def __init__(self, *, budget_per_poll: Optional[int] = None):
+        if budget_per_poll is not None and budget_per_poll < 1:
+            raise ValueError("budget_per_poll must be >= 1")
+        self._budget = budget_per_poll
+        self._control: List[_Source] = []
+        self._bulk: List[_Source] = []
+        self._names: Dict[str, _Source] = {}
+        self._wakeup: Optional[WakeupCallback] = None
+        self._report: Optional[ErrorReporter] = None
+        self._started = False
+        # Rotation offset into the busy bulk sources (see poll()).
+        self._turn = 0
+        self.current_source: Optional[str] = None
+
+    def add_source(
+        self,
+        name: str,
+        adapter: CommandIngress,
+        *,
+        weight: int = 1,
+        control: bool = False,
+    ) -> None:
+        if name in self._names:
+            raise ValueError(f"Ingress source already added: {name!r}")
+        if weight < 1:
+            raise ValueError("weight must be >= 1")
+
+        source = _Source(name, adapter, weight, control)
+        self._names[name] = source
+        if control:
+            self._control.append(source)
+        else:
+            self._bulk.append(source)
+            # Stable base order for the rotation in poll(): heavier first.
+            self._bulk.sort(key=lambda s: -s.weight)
+
+        if self._wakeup is not None:
+            set_wakeup = _bound(adapter, "set_wakeup")
+            if set_wakeup is not None:
+                set_wakeup(self._wakeup)
+        if self._started:
+            start = _bound(adapter, "start")
+            if start is not None:
+                start()
+
+    # ---- CommandIngress seams --------------------------------------------
+
+    def set_wakeup(self, callback: WakeupCallback) -> None:
+        self._wakeup = callback
+        self._fan_out("set_wakeup", callback)
+
+    def set_error_reporter(self, reporter: ErrorReporter) -> None:
+        self._report = reporter
+        self._fan_out("set_error_reporter", reporter)
+
+    def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        self._fan_out("start")
+
+    def stop(self) -> None:
+        self._fan_out("stop")
+
+    def pending(self) -> int:
+        total = 0
+        for source in self._names.values():
+            if source.pending is None:
+                return 1
+            total += source.pending()
+        return total
+
+    def poll(self) -> None:
+        if not self._started:
+            self.start()
+
+        for source in self._control:
+            self._poll_source(source, None)
+
+        budget = self._budget
+        if budget is None:
+            for source in self._bulk:
+                self._poll_source(source, None)
+            return
+
+        busy = [s for s in self._bulk if s.pending is None or s.pending() > 0]
+        for source in self._bulk:
+            if source not in busy:
+                source.idle_skips += 1
+        if not busy:
+            return
+        start = self._turn % len(busy)
+        self._turn = start + 1
+        if start:
+            busy = busy[start:] + busy[:start]
+
+        # Pass 1: weighted shares, starting at this poll's turn. Pass 2:
+        # leftovers to sources that filled their share, in the same order.
+        total_weight = sum(s.weight for s in busy)
+        remaining = budget
+        hungry = []
+        for source in busy:
+            share = max(1, budget * source.weight // total_weight)
+            share = min(share, remaining)
+            if share <= 0:
+                break
+            taken = self._poll_source(source, share)
+            remaining -= taken
+            if taken >= share:
+                hungry.append(source)
+
+        for source in hungry:
+            if remaining <= 0:
+                break
+            remaining -= self._poll_source(source, remaining)
+
+        if remaining <= 0 and self._wakeup is not None:
+            # Budget spent: ask for another poll soon rather than a full tick.
+            if any(s.pending is None or s.pending() > 0 for s in busy):
+                self._wakeup()
+
+    def stats(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for name, source in self._names.items():
+            entry: Dict[str, Any] = {
+                "weight": source.weight,
+                "control": source.control,
+                "polls": source.polls,
+                "commands": source.commands,
+                "idle_skips": source.idle_skips,
+                "errors": source.errors,
+            }
+            stats = _bound(source.adapter, "stats")
+            if stats is not None:
+                entry["adapter"] = stats()
+            out[name] = entry
+        return {"budget_per_poll": self._budget, "sources": out}
+
+    # ---- internal --------------------------------------------------------
+
+    def _poll_source(self, source: _Source, limit: Optional[int]) -> int:
+        if limit is None and source.pending is not None and source.pending() == 0:
+            source.idle_skips += 1
+            return 0
+
+        source.polls += 1
+        self.current_source = source.name
+        try:
+            if source.poll_bounded is not None:
+                taken = source.poll_bounded(limit)
+            else:
+                source.poll()
+                taken = 1
+        except RuntimeStopRequested:
+            raise
+        except Exception as exc:
+            source.errors += 1
+            if self._report is None:
+                raise
+            self._report(exc, where=f"runtime.ingress.{source.name}")
+            taken = 1
+        finally:
+            self.current_source = None
+
+        source.commands += taken
+        return taken
+
+    def _fan_out(self, method: str, *args: Any) -> None:
+        for source in self._names.values():
+            fn = _bound(source.adapter, method)
+            if fn is not None:
+                fn(*args)
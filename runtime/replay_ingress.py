@@ -0,0 +1,227 @@
+# lillycore/runtime/replay_ingress.py
+
+from __future__ import annotations
+
+import json
+import mmap
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from lillycore.runtime.bounded_queue import POLICY_BLOCK, BoundedQueue
+from lillycore.runtime.command_ingress import (
+    CommandBatchHandler,
+    CommandHandler,
+    QueuedCommandIngress,
+)
+
+REPLAY_ASAP = "asap"  # as fast as the loop drains
+REPLAY_RECORDED = "recorded"  # honour recorded inter-arrival times
+REPLAY_SCALED = "scaled"  # recorded inter-arrival times divided by speed
+REPLAY_MODES = frozenset({REPLAY_ASAP, REPLAY_RECORDED, REPLAY_SCALED})
+
+# Lines handed to the queue per put_many() in asap mode.
+_CHUNK = 512
+
+# Line numbers of malformed records kept for stats() (all are counted).
+_MAX_BAD_LINES = 100
+
+
+class ReplayIngressAdapter(QueuedCommandIngress):
+    """
+    Phase 1 ingress adapter: replay recorded commands from a file.
+
+    Input (format "jsonl", "text", or None = by suffix: .jsonl/.ndjson -> jsonl):
+    - text: one command per line
+    - jsonl: one JSON value per line; a string is the command, an object
+      carries it under command_field (default "command") and, optionally, a
+      timestamp in seconds under time_field (default "ts"); a line that is
+      not valid JSON, or has no command, is skipped and its line number
+      reported in stats() (bad_lines)
+
+    Design:
+    - a reader thread streams the file (buffered reads, or mmap with
+      use_mmap=True), so captures of any size are never loaded whole
+    - lines pass through a BoundedQueue (block policy): the reader is held
+      back when the loop falls behind, keeping memory bounded
+    - mode: asap, recorded (ts deltas), or scaled (ts deltas / speed); lines
+      without a timestamp are released right after the previous one
+    - poll() is non-blocking and dispatches like TerminalIngressAdapter
+      (QueuedCommandIngress: on_command or on_commands batches, stop
+      commands, final "EOF")
+    - stats() reports delivered commands and achieved commands/second; the
+      heartbeat loop forwards it to the logger at finalize
+    """
+
+    def __init__(
+        self,
+        path: str,
+        on_command: Optional[CommandHandler] = None,
+        *,
+        on_commands: Optional[CommandBatchHandler] = None,
+        mode: str = REPLAY_ASAP,
+        speed: float = 1.0,
+        format: Optional[str] = None,
+        command_field: str = "command",
+        time_field: str = "ts",
+        use_mmap: bool = False,
+        queue_capacity: int = 8192,
+        max_batch_size: Optional[int] = None,
+    ):
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"Unsupported replay mode: {mode}")
+        if speed <= 0:
+            raise ValueError("speed must be > 0")
+        if format is None:
+            format = "jsonl" if path.endswith((".jsonl", ".ndjson")) else "text"
+        if format not in {"jsonl", "text"}:
+            raise ValueError(f"Unsupported replay format: {format}")
+
+        super().__init__(
+            on_command,
+            on_commands,
+            BoundedQueue(queue_capacity, POLICY_BLOCK),
+            max_batch_size,
+        )
+        self._path = path
+        self._mode = mode
+        self._speed = speed if mode == REPLAY_SCALED else 1.0
+        self._format = format
+        self._command_field = command_field
+        self._time_field = time_field
+        self._use_mmap = use_mmap
+
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+        self._skipped = 0
+        self._bad_lines: List[int] = []
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._error: Optional[str] = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            self._started_at = time.monotonic()
+            threading.Thread(
+                target=self._reader_thread, name="replay-ingress", daemon=True
+            ).start()
+
+    def stop(self) -> None:
+        """Stop reading (unblocks the reader thread) and freeze the rate."""
+        self._stopping.set()
+        self._q.close()
+        self._finish()
+
+    def stats(self) -> Dict[str, Any]:
+        started = self._started_at
+        end = self._finished_at if self._finished_at is not None else time.monotonic()
+        elapsed = (end - started) if started is not None else 0.0
+        return {
+            "path": self._path,
+            "mode": self._mode,
+            "delivered": self._delivered,
+            "skipped": self._skipped,
+            "bad_lines": list(self._bad_lines),
+            "elapsed_sec": elapsed,
+            "cmds_per_sec": self._delivered / elapsed if elapsed > 0 else 0.0,
+            "complete": self._eof_delivered,
+            "error": self._error,
+            "queue": self._q.stats(),
+        }
+
+    # ---- internal --------------------------------------------------------
+
+    def _finish(self) -> None:
+        if self._finished_at is None and self._started_at is not None:
+            self._finished_at = time.monotonic()
+
+    def _reader_thread(self) -> None:
+        try:
+            if self._mode == REPLAY_ASAP:
+                self._feed_asap()
+            else:
+                self._feed_paced()
+        except Exception as exc:
+            # Treat a read/parse failure as end of input; it is reported in stats().
+            self._error = f"{type(exc).__name__}: {exc}"
+        self._mark_eof()
+
+    def _feed_asap(self) -> None:
+        chunk: List[str] = []
+        put_many = self._q.put_many
+        for cmd, _ in self._records():
+            chunk.append(cmd)
+            if len(chunk) >= _CHUNK:
+                put_many(chunk)
+                chunk = []
+                self._signal_wakeup()
+                if self._stopping.is_set():
+                    return
+        if chunk:
+            put_many(chunk)
+
+    def _feed_paced(self) -> None:
+        speed = self._speed
+        wait = self._stopping.wait
+        first_ts: Optional[float] = None
+        origin = time.monotonic()
+        for cmd, ts in self._records():
+            if ts is not None:
+                if first_ts is None:
+                    first_ts = ts
+                delay = origin + (ts - first_ts) / speed - time.monotonic()
+                if delay > 0 and wait(delay):
+                    return
+            if not self._q.put(cmd):
+                return
+            self._signal_wakeup()
+
+    def _records(self) -> Iterator[Tuple[str, Optional[float]]]:
+        jsonl = self._format == "jsonl"
+        for lineno, raw in enumerate(self._lines(), 1):
+            line = raw.strip()
+            if not line:
+                continue
+            if not jsonl:
+                yield line.decode("utf-8", errors="replace"), None
+                continue
+
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Malformed line (bad JSON or encoding): skip it, keep going.
+                record = None
+            if isinstance(record, str):
+                cmd, ts = record, None
+            elif isinstance(record, dict) and isinstance(
+                record.get(self._command_field), str
+            ):
+                cmd = record[self._command_field]
+                ts = record.get(self._time_field)
+                ts = float(ts) if isinstance(ts, (int, float)) else None
+            else:
+                self._skipped += 1
+                if len(self._bad_lines) < _MAX_BAD_LINES:
+                    self._bad_lines.append(lineno)
+                continue
+
+            cmd = cmd.strip()
+            if cmd:
+                yield cmd, ts
+
+    def _lines(self) -> Iterator[bytes]:
+        with open(self._path, "rb", buffering=1 << 20) as f:
+            if not self._use_mmap:
+                yield from f
+                return
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file: nothing to map.
+                return
+            with mm:
+                yield from iter(mm.readline, b"")
@@ -1,27 +1,35 @@
 from __future__ import annotations
 
-import json
 import sys
-import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+from lillycore.runtime.clock import SYSTEM_CLOCK, Clock
+from lillycore.runtime.log_encoder import RecordEncoder
+from lillycore.runtime.log_writer import BufferedLogWriter
 
-def _utc_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+# Level ranks shared by the runtime's loggers (RuntimeLogger, run_runtime's
+# Phase 1 adapter). WARN and WARNING are aliases; unknown names rank as INFO.
+LOG_LEVELS = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARN": 30,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
 
 
-def _safe(obj: Any) -> Any:
+def evaluate_lazy(value: Any) -> Any:
     """
-    Phase 1 rule: do not invent schema for envelopes or other opaque objects.
-    We try to JSON-encode; if not possible, fall back to a repr wrapper.
+    Resolve a lazy (zero-argument callable) log value; a failure becomes
+    {"__error__": "Type: message"} instead of raising.
     """
     try:
-        json.dumps(obj)
-        return obj
-    except TypeError:
-        return {"__repr__": repr(obj), "__type__": type(obj).__name__}
+        return value()
+    except Exception as exc:
+        # Logging MUST NOT break runtime control flow in Phase 1.
+        return {"__error__": f"{type(exc).__name__}: {exc}"}
 
 
 @dataclass(frozen=True)
@@ -35,6 +43,17 @@ class LoggingConfig:
     # Optional: allow explicit runtime loop tick interval logging
     include_tick_timing: bool = False
 
+    # Asynchronous writer (see BufferedLogWriter): records are queued and
+    # written in batches by a background thread instead of write+flush per
+    # record. Overflow policy: block|drop_newest|drop_oldest|reject.
+    async_writer: bool = False
+    writer_queue_capacity: int = 8192
+    writer_overflow_policy: str = "block"
+    writer_flush_bytes: int = 65536
+    writer_flush_interval_sec: float = 0.05
+    # finalize/flush/finish wait at most this long for queued records.
+    writer_drain_timeout_sec: float = 5.0
+
 
 class RuntimeLogger:
     """
@@ -42,49 +61,107 @@ class RuntimeLogger:
     - Emits JSON Lines to stdout/stderr
     - Minimal levels
     - First-class events: lifecycle, heartbeat, envelope
+    - config.async_writer moves stream writes to a background thread;
+      finalize() then drains it (bounded by writer_drain_timeout_sec)
+    - field values may be zero-argument callables (not classes): they are
+      only called for records that pass the level gate; is_enabled(level)
+      lets callers skip building fields altogether
     """
 
-    def __init__(self, config: Optional[LoggingConfig] = None, stream=None):
+    def __init__(
+        self,
+        config: Optional[LoggingConfig] = None,
+        stream=None,
+        *,
+        clock: Optional[Clock] = None,
+    ):
         self.config = config or LoggingConfig()
         self.stream = stream or sys.stdout
+        # Shared runtime clock: a VirtualClock makes record timestamps reproducible.
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
         self._tick_counter = 0
         self._last_tick_ts = None  # type: Optional[float]
-
-    def _level_allows(self, level: str) -> bool:
-        order = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
-        cfg = order.get(self.config.level.upper(), 20)
-        lvl = order.get(level.upper(), 20)
-        return lvl >= cfg
+        self._encoder = RecordEncoder()
+        self._writer: Optional[BufferedLogWriter] = None
+        self._apply_writer_config()
+
+    @property
+    def config(self) -> LoggingConfig:
+        return self._config
+
+    @config.setter
+    def config(self, config: LoggingConfig) -> None:
+        # The level threshold is resolved here, once, not per record.
+        self._config = config
+        self._threshold = LOG_LEVELS.get(config.level.upper(), 20)
+        self._enabled: Dict[str, bool] = {}
+
+    def is_enabled(self, level: str) -> bool:
+        """Would a record at `level` be emitted? (dict hit after first use)"""
+        enabled = self._enabled.get(level)
+        if enabled is None:
+            enabled = LOG_LEVELS.get(level.upper(), 20) >= self._threshold
+            self._enabled[level] = enabled
+        return enabled
 
     def _emit(self, level: str, event: str, fields: Dict[str, Any]) -> None:
-        if not self._level_allows(level):
+        if not self.is_enabled(level):
             return
 
-        record = {
-            "ts": _utc_iso(),
-            "level": level.upper(),
-            "event": event,
-            "fields": {k: _safe(v) for k, v in fields.items()},
-        }
-        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        for key, value in fields.items():
+            if callable(value) and not isinstance(value, type):
+                fields[key] = evaluate_lazy(value)
+
+        line = self._encoder.encode(level, event, fields, self.clock.time())
+        writer = self._writer
+        if writer is not None:
+            writer.write(line)
+            return
+        self.stream.write(line)
         self.stream.flush()
 
+    def _apply_writer_config(self) -> None:
+        # Writer options take effect when the writer starts; switching
+        # async_writer off drains and stops it.
+        cfg = self.config
+        if cfg.async_writer and self._writer is None:
+            self._writer = BufferedLogWriter(
+                self.stream,
+                capacity=cfg.writer_queue_capacity,
+                overflow_policy=cfg.writer_overflow_policy,
+                flush_bytes=cfg.writer_flush_bytes,
+                flush_interval_sec=cfg.writer_flush_interval_sec,
+            )
+        elif not cfg.async_writer and self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.close(cfg.writer_drain_timeout_sec)
+
     # ---- public event helpers ----
 
     def finalize(self, **fields: Any) -> None:
         """
         Phase 1 shutdown finalization hook (P1.1.6).
 
-        Even though we flush per line, the runtime loop should have an explicit
-        place to ask logging to finish/flush any buffered work.
+        The runtime loop's explicit place to ask logging to finish/flush any
+        buffered work: with the async writer, every queued record is written
+        before this returns (or writer_drain_timeout_sec passes).
         """
         self._emit("INFO", "runtime.logging.finalize", fields)
+        writer = self._writer
+        if writer is not None:
+            writer.drain(self.config.writer_drain_timeout_sec)
+            return
         try:
             self.stream.flush()
         except Exception:
             # Logging MUST NOT break runtime control flow in Phase 1.
             pass
 
+    def writer_stats(self) -> Optional[Dict[str, Any]]:
+        """BufferedLogWriter.stats() when the async writer is on."""
+        writer = self._writer
+        return writer.stats() if writer is not None else None
+
     def flush(self, **fields: Any) -> None:
         """
         Phase 1 shutdown finalization alias (P1.1.6).
@@ -113,6 +190,7 @@ class RuntimeLogger:
         """
         try:
             self.config = logging_config_from_settings(settings)
+            self._apply_writer_config()
         except Exception:
             pass
 
@@ -130,11 +208,13 @@ class RuntimeLogger:
             return
 
         if self.config.include_tick_timing:
-            now = time.time()
+            now = self.clock.monotonic()
             if self._last_tick_ts is not None:
                 fields["tick_dt_seconds"] = now - self._last_tick_ts
             self._last_tick_ts = now
 
+        # Providers (e.g. ingress stats) are passed as callables; _emit only
+        # evaluates them for ticks that are actually emitted.
         fields["tick_id"] = tick_id
         fields["heartbeat_every_n_ticks"] = n
         self._emit("INFO", "runtime.heartbeat.tick", fields)
@@ -147,6 +227,16 @@ class RuntimeLogger:
         fields["envelope"] = envelope_obj
         self._emit("ERROR", "runtime.envelope.received", fields)
 
+    def envelope_summary(self, **fields: Any) -> None:
+        """
+        Repeats of an already logged envelope (see EnvelopeAggregator):
+        fingerprint, exc_type, where, count, suppressed, first_ts, last_ts.
+        """
+        self._emit("WARN", "runtime.envelope.summary", fields)
+
+    def debug(self, event: str, **fields: Any) -> None:
+        self._emit("DEBUG", event, fields)
+
     def info(self, event: str, **fields: Any) -> None:
         self._emit("INFO", event, fields)
 
@@ -172,4 +262,10 @@ def logging_config_from_settings(settings: Dict[str, Any]) -> LoggingConfig:
         heartbeat_enabled=bool(cfg.get("heartbeat_enabled", False)),
         heartbeat_every_n_ticks=int(cfg.get("heartbeat_every_n_ticks", 10)),
         include_tick_timing=bool(cfg.get("include_tick_timing", False)),
+        async_writer=bool(cfg.get("async_writer", False)),
+        writer_queue_capacity=int(cfg.get("writer_queue_capacity", 8192)),
+        writer_overflow_policy=str(cfg.get("writer_overflow_policy", "block")).lower(),
+        writer_flush_bytes=int(cfg.get("writer_flush_bytes", 65536)),
+        writer_flush_interval_sec=float(cfg.get("writer_flush_interval_sec", 0.05)),
+        writer_drain_timeout_sec=float(cfg.get("writer_drain_timeout_sec", 5.0)),
     )
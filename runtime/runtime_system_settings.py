@@ -11,6 +11,12 @@ from typing import Any, Dict, Optional, Tuple, List
 # lillycore/runtime/config/runtime.system.json
 CANONICAL_SYSTEM_SETTINGS_PATH = "runtime/config/runtime.system.json"
 
+# Defaults for opt-in runtime backends; also the fallback used by
+# run_interactive when a settings object lacks the key.
+DEFAULT_ASYNC_ENABLED = False
+DEFAULT_ENVELOPE_SUMMARY_INTERVAL_MS = 0
+DEFAULT_ENVELOPE_DISPATCH_ASYNC = False
+
 
 @dataclass(frozen=True)
 class RuntimeSystemSettings:
@@ -32,17 +38,38 @@ class RuntimeSystemSettings:
     heartbeat_enabled: bool
     heartbeat_every_n_ticks: int
 
+    # Tick cadence overrun policy: catch_up|skip|coalesce
+    tick_overrun_policy: str = "catch_up"
+
+    # Ingress backpressure: queue capacity (0 = unbounded) and overflow policy
+    # block|drop_newest|drop_oldest|reject
+    ingress_queue_capacity: int = 0
+    ingress_overflow_policy: str = "block"
+
+    # Envelope deduplication: repeats of an error are summarized every
+    # interval instead of logged in full (0 = off: log every envelope)
+    envelope_summary_interval_ms: int = DEFAULT_ENVELOPE_SUMMARY_INTERVAL_MS
+
+    # Envelope sinks run on background lanes instead of the tick thread
+    # (drop_oldest under load); off: sinks run synchronously on the tick
+    envelope_dispatch_async: bool = DEFAULT_ENVELOPE_DISPATCH_ASYNC
+
 
 def default_runtime_system_settings() -> RuntimeSystemSettings:
     # Internal defaults (lowest precedence)
     return RuntimeSystemSettings(
-        async_enabled=True,
+        async_enabled=DEFAULT_ASYNC_ENABLED,
         tick_interval_ms=100,
         log_level="INFO",
         log_format="text",
         # Heartbeat defaults: OFF + bounded (avoid spam by default).
         heartbeat_enabled=False,
         heartbeat_every_n_ticks=10,
+        tick_overrun_policy="catch_up",
+        ingress_queue_capacity=0,
+        ingress_overflow_policy="block",
+        envelope_summary_interval_ms=DEFAULT_ENVELOPE_SUMMARY_INTERVAL_MS,
+        envelope_dispatch_async=DEFAULT_ENVELOPE_DISPATCH_ASYNC,
     )
 
 
@@ -75,6 +102,11 @@ def _coerce_and_validate(settings: Dict[str, Any]) -> RuntimeSystemSettings:
         # P1.1.5 heartbeat controls
         "heartbeat_enabled",
         "heartbeat_every_n_ticks",
+        "tick_overrun_policy",
+        "ingress_queue_capacity",
+        "ingress_overflow_policy",
+        "envelope_summary_interval_ms",
+        "envelope_dispatch_async",
     }
     unknown = set(settings.keys()) - allowed_keys
     if unknown:
@@ -90,6 +122,11 @@ def _coerce_and_validate(settings: Dict[str, Any]) -> RuntimeSystemSettings:
 
     heartbeat_enabled = bool(merged["heartbeat_enabled"])
     heartbeat_every_n_ticks = int(merged["heartbeat_every_n_ticks"])
+    tick_overrun_policy = str(merged["tick_overrun_policy"]).lower()
+    ingress_queue_capacity = int(merged["ingress_queue_capacity"])
+    ingress_overflow_policy = str(merged["ingress_overflow_policy"]).lower()
+    envelope_summary_interval_ms = int(merged["envelope_summary_interval_ms"])
+    envelope_dispatch_async = bool(merged["envelope_dispatch_async"])
 
     if tick_interval_ms <= 0:
         raise ValueError("tick_interval_ms must be > 0")
@@ -101,6 +138,21 @@ def _coerce_and_validate(settings: Dict[str, Any]) -> RuntimeSystemSettings:
     # Heartbeat bounding safety (P1.1.5)
     if heartbeat_every_n_ticks <= 0:
         raise ValueError("heartbeat_every_n_ticks must be > 0")
+    if tick_overrun_policy not in {"catch_up", "skip", "coalesce"}:
+        raise ValueError(f"Unsupported tick_overrun_policy: {tick_overrun_policy}")
+    if ingress_queue_capacity < 0:
+        raise ValueError("ingress_queue_capacity must be >= 0")
+    if ingress_overflow_policy not in {
+        "block",
+        "drop_newest",
+        "drop_oldest",
+        "reject",
+    }:
+        raise ValueError(
+            f"Unsupported ingress_overflow_policy: {ingress_overflow_policy}"
+        )
+    if envelope_summary_interval_ms < 0:
+        raise ValueError("envelope_summary_interval_ms must be >= 0")
 
     return RuntimeSystemSettings(
         async_enabled=async_enabled,
@@ -109,6 +161,11 @@ def _coerce_and_validate(settings: Dict[str, Any]) -> RuntimeSystemSettings:
         log_format=log_format,
         heartbeat_enabled=heartbeat_enabled,
         heartbeat_every_n_ticks=heartbeat_every_n_ticks,
+        tick_overrun_policy=tick_overrun_policy,
+        ingress_queue_capacity=ingress_queue_capacity,
+        ingress_overflow_policy=ingress_overflow_policy,
+        envelope_summary_interval_ms=envelope_summary_interval_ms,
+        envelope_dispatch_async=envelope_dispatch_async,
     )
 
 
@@ -0,0 +1,402 @@
+# lillycore/runtime/socket_ingress.py
+
+from __future__ import annotations
+
+import os
+import queue
+import selectors
+import socket
+import stat
+import threading
+from typing import Dict, Optional, Tuple, Union
+
+from lillycore.runtime.command_ingress import (
+    STOP_COMMANDS,
+    CommandHandler,
+    CommandIngress,
+    WakeupCallback,
+    signal_wakeup,
+)
+from lillycore.runtime.heartbeat import RuntimeStopRequested
+
+# Queued in place of a command whose line exceeded max_line_bytes, so the
+# error reply keeps its place in the client's reply order.
+_LINE_TOO_LONG = None
+
+
+class _Client:
+    __slots__ = ("client_id", "sock", "inbuf", "outbuf", "pending", "eof", "events")
+
+    def __init__(self, client_id: int, sock: socket.socket):
+        self.client_id = client_id
+        self.sock = sock
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        # Commands queued for the loop thread and not yet acknowledged.
+        self.pending = 0
+        # Peer half-closed (or sent an unterminated over-long line): no more
+        # reads; the connection closes once pending replies are written.
+        self.eof = False
+        # Events currently registered with the selector (0 = unregistered).
+        self.events = 0
+
+
+class SocketIngressAdapter(CommandIngress):
+    """
+    Phase 1 ingress adapter: local socket (Unix domain or TCP localhost).
+
+    Design:
+    - One background thread runs a selectors event loop serving any number of
+      clients: accept, read, split lines, write acknowledgements.
+    - poll() drains the received-command queue (non-blocking) and calls the
+      handler on the loop thread; each command is acknowledged to its client
+      with "ok" or "error <Type>: <message>".
+    - Stop commands ("stop", "quit", "exit") are acknowledged with
+      "ok stopping" and raise RuntimeStopRequested, as with terminal ingress.
+    - current_client is the id of the client whose command is being handled,
+      so handlers can tag per-client state; current_session names it as a
+      session ("socket:<id>"), e.g. for FairShareScheduler.tagged().
+
+    Wire format: UTF-8, one command per line ("\\n"); one reply line per command.
+    - A line longer than max_line_bytes is answered "error LineTooLong" in
+      its place; an unterminated one also ends reading from that client.
+    - A client that half-closes (shutdown(SHUT_WR)) still receives the replies
+      for everything it sent (a final unterminated line counts as a command);
+      the connection is closed after the last reply is written.
+    - With path=, an existing file is only replaced if it is a socket.
+    """
+
+    def __init__(
+        self,
+        on_command: CommandHandler,
+        *,
+        path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_line_bytes: int = 65536,
+        backlog: int = 128,
+    ):
+        self._on_command = on_command
+        self._path = path
+        self._host = host
+        self._port = port
+        self._max_line_bytes = max_line_bytes
+        self._backlog = backlog
+
+        self._commands: queue.SimpleQueue[Tuple[int, Optional[str]]] = (
+            queue.SimpleQueue()
+        )
+        self._acks: queue.SimpleQueue[Tuple[int, bytes]] = queue.SimpleQueue()
+        self._wakeup: Optional[WakeupCallback] = None
+
+        self._lock = threading.Lock()
+        self._started = False
+        self._closing = False
+        self._listener: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # Self-pipe: poll() (loop thread) nudges the selector thread to flush acks.
+        self._notify_r, self._notify_w = socket.socketpair()
+        self._notify_r.setblocking(False)
+        self._notify_w.setblocking(False)
+
+        self._clients: Dict[int, _Client] = {}
+        self._next_client_id = 0
+        self.current_client: Optional[int] = None
+
+    # ---- CommandIngress --------------------------------------------------
+
+    def set_wakeup(self, callback: WakeupCallback) -> None:
+        self._wakeup = callback
+
+    def start(self) -> None:
+        with self._lock:
+            if self._started or self._closing:
+                return
+            self._started = True
+            self._listener = self._bind()
+            self._thread = threading.Thread(
+                target=self._serve, name="socket-ingress", daemon=True
+            )
+            self._thread.start()
+
+    @property
+    def current_session(self) -> Optional[str]:
+        """Session of the command being handled: one per connection."""
+        client_id = self.current_client
+        return None if client_id is None else f"socket:{client_id}"
+
+    @property
+    def address(self) -> Union[str, Tuple[str, int], None]:
+        """Bound address (path, or (host, port) with the real ephemeral port)."""
+        if self._listener is None:
+            return None
+        return self._listener.getsockname()
+
+    def poll(self) -> None:
+        self.poll_bounded(None)
+
+    def poll_bounded(self, limit: Optional[int]) -> int:
+        """
+        poll() handling at most `limit` commands; returns how many were taken.
+        """
+        # Ensure the server exists, but keep tick path non-blocking.
+        if not self._started:
+            self.start()
+
+        taken = 0
+        try:
+            while limit is None or taken < limit:
+                try:
+                    client_id, cmd = self._commands.get_nowait()
+                except queue.Empty:
+                    break
+
+                taken += 1
+                if cmd is _LINE_TOO_LONG:
+                    self._ack(client_id, b"error LineTooLong\n")
+                    continue
+                if cmd in STOP_COMMANDS:
+                    self._ack(client_id, b"ok stopping\n")
+                    raise RuntimeStopRequested()
+
+                self.current_client = client_id
+                try:
+                    self._on_command(cmd)
+                except RuntimeStopRequested:
+                    self._ack(client_id, b"ok stopping\n")
+                    raise
+                except Exception as exc:
+                    reply = f"error {type(exc).__name__}: {exc}".replace("\n", " ")
+                    self._ack(client_id, reply.encode("utf-8") + b"\n")
+                    raise
+                finally:
+                    self.current_client = None
+                self._ack(client_id, b"ok\n")
+        finally:
+            if taken:
+                self._notify()
+        return taken
+
+    def pending(self) -> int:
+        """Commands received but not yet handled; cheap."""
+        return self._commands.qsize()
+
+    def stop(self) -> None:
+        """Close the listener and all clients (pending acks are flushed first)."""
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+        if self._thread is not None:
+            self._notify()
+            self._thread.join(2.0)
+            if self._thread.is_alive():
+                # The selector thread still owns the self-pipe.
+                return
+        self._notify_r.close()
+        self._notify_w.close()
+
+    # ---- internal --------------------------------------------------------
+
+    def _bind(self) -> socket.socket:
+        if self._path is not None:
+            if _is_socket_file(self._path):
+                # Stale socket from an earlier run.
+                os.unlink(self._path)
+            elif os.path.lexists(self._path):
+                raise FileExistsError(f"{self._path} exists and is not a socket")
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(self._path)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((self._host, self._port))
+        sock.listen(self._backlog)
+        sock.setblocking(False)
+        return sock
+
+    def _ack(self, client_id: int, data: bytes) -> None:
+        self._acks.put((client_id, data))
+
+    def _notify(self) -> None:
+        try:
+            self._notify_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            # Pipe already full (a nudge is pending) or closed.
+            pass
+
+    def _serve(self) -> None:
+        sel = selectors.DefaultSelector()
+        sel.register(self._listener, selectors.EVENT_READ, "accept")
+        sel.register(self._notify_r, selectors.EVENT_READ, "notify")
+        try:
+            while True:
+                for key, mask in sel.select():
+                    tag = key.data
+                    if tag == "accept":
+                        self._accept(sel)
+                    elif tag == "notify":
+                        try:
+                            while self._notify_r.recv(4096):
+                                pass
+                        except (BlockingIOError, OSError):
+                            pass
+                    else:
+                        if mask & selectors.EVENT_READ:
+                            self._read(sel, tag)
+                        if (
+                            mask & selectors.EVENT_WRITE
+                            and tag.client_id in self._clients
+                        ):
+                            self._write(sel, tag)
+
+                self._flush_acks(sel)
+                if self._closing:
+                    return
+        finally:
+            for client in list(self._clients.values()):
+                self._drop(sel, client)
+            sel.close()
+            self._listener.close()
+            if self._path is not None and _is_socket_file(self._path):
+                os.unlink(self._path)
+
+    def _accept(self, sel: selectors.BaseSelector) -> None:
+        while True:
+            try:
+                sock, _ = self._listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            sock.setblocking(False)
+            self._next_client_id += 1
+            client = _Client(self._next_client_id, sock)
+            self._clients[client.client_id] = client
+            self._set_events(sel, client, selectors.EVENT_READ)
+
+    def _read(self, sel: selectors.BaseSelector, client: _Client) -> None:
+        try:
+            data = client.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._drop(sel, client)
+            return
+
+        buf = client.inbuf
+        if not data:
+            # Half-close: stop reading, answer what was sent, then close.
+            client.eof = True
+            if buf.strip():
+                self._queue(client, buf)
+            client.inbuf = bytearray()
+            self._write(sel, client)
+            self._wake()
+            return
+
+        buf += data
+        limit = self._max_line_bytes
+        if b"\n" not in data:
+            if len(buf) > limit:
+                self._overflow(sel, client)
+            return
+
+        *lines, rest = buf.split(b"\n")
+        client.inbuf = bytearray(rest)
+        for raw in lines:
+            if len(raw) > limit:
+                self._commands.put((client.client_id, _LINE_TOO_LONG))
+                client.pending += 1
+            elif raw.strip():
+                self._queue(client, raw)
+        if len(rest) > limit:
+            self._overflow(sel, client)
+            return
+        self._wake()
+
+    def _queue(self, client: _Client, raw: bytes) -> None:
+        cmd = raw.decode("utf-8", errors="replace").strip()
+        self._commands.put((client.client_id, cmd))
+        client.pending += 1
+
+    def _overflow(self, sel: selectors.BaseSelector, client: _Client) -> None:
+        # Unterminated line past the limit: the rest of the stream cannot be
+        # framed, so answer it in order and stop reading.
+        self._commands.put((client.client_id, _LINE_TOO_LONG))
+        client.pending += 1
+        client.inbuf = bytearray()
+        client.eof = True
+        self._write(sel, client)
+        self._wake()
+
+    def _wake(self) -> None:
+        signal_wakeup(self._wakeup)
+
+    def _flush_acks(self, sel: selectors.BaseSelector) -> None:
+        touched = set()
+        while True:
+            try:
+                client_id, data = self._acks.get_nowait()
+            except queue.Empty:
+                break
+            client = self._clients.get(client_id)
+            if client is None:
+                # Client went away before its ack; nothing to deliver.
+                continue
+            client.outbuf += data
+            client.pending -= 1
+            touched.add(client_id)
+
+        for client_id in touched:
+            client = self._clients.get(client_id)
+            if client is not None:
+                self._write(sel, client)
+
+    def _write(self, sel: selectors.BaseSelector, client: _Client) -> None:
+        if client.outbuf:
+            try:
+                sent = client.sock.send(client.outbuf)
+                del client.outbuf[:sent]
+            except (BlockingIOError, InterruptedError):
+                pass
+            except OSError:
+                self._drop(sel, client)
+                return
+
+        if client.eof and not client.outbuf and client.pending <= 0:
+            self._drop(sel, client)
+            return
+
+        events = 0 if client.eof else selectors.EVENT_READ
+        if client.outbuf:
+            events |= selectors.EVENT_WRITE
+        self._set_events(sel, client, events)
+
+    def _set_events(
+        self, sel: selectors.BaseSelector, client: _Client, events: int
+    ) -> None:
+        # A half-closed client waiting for replies is parked unregistered.
+        if events == client.events:
+            return
+        try:
+            if not events:
+                sel.unregister(client.sock)
+            elif not client.events:
+                sel.register(client.sock, events, client)
+            else:
+                sel.modify(client.sock, events, client)
+        except (KeyError, ValueError):
+            pass
+        client.events = events
+
+    def _drop(self, sel: selectors.BaseSelector, client: _Client) -> None:
+        self._clients.pop(client.client_id, None)
+        self._set_events(sel, client, 0)
+        client.sock.close()
+
+
+def _is_socket_file(path: str) -> bool:
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
@@ -0,0 +1,381 @@
+# lillycore/runtime/supervisor.py
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+from lillycore.runtime.command_ingress import (
+    CommandHandler,
+    CommandIngress,
+    WakeupCallback,
+)
+from lillycore.runtime.error_envelopes import wrap_exception
+from lillycore.runtime.heartbeat import RuntimeStopRequested
+
+# Control message sent down a worker's command queue to stop it.
+_STOP = None
+
+
+def _default_shard_key(command: str) -> str:
+    return command
+
+
+class _QueueIngress(CommandIngress):
+    """
+    Worker-side ingress: commands arrive on a multiprocessing queue.
+
+    A daemon thread blocks on the queue and hands commands to poll() through a
+    local queue (same shape as TerminalIngressAdapter), signalling the loop's
+    wakeup seam so routed commands are dispatched on arrival.
+    """
+
+    def __init__(self, on_command: CommandHandler, source: Any):
+        self._on_command = on_command
+        self._source = source
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._wakeup: Optional[WakeupCallback] = None
+        self._started = False
+
+    def set_wakeup(self, callback: WakeupCallback) -> None:
+        self._wakeup = callback
+
+    def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        threading.Thread(
+            target=self._reader_thread, name="supervisor-ingress", daemon=True
+        ).start()
+
+    def poll(self) -> None:
+        if not self._started:
+            self.start()
+
+        while True:
+            try:
+                cmd = self._q.get_nowait()
+            except queue.Empty:
+                return
+            if cmd is _STOP:
+                raise RuntimeStopRequested()
+            self._on_command(cmd)
+
+    def _reader_thread(self) -> None:
+        while True:
+            try:
+                cmd = self._source.get()
+            except (EOFError, OSError):
+                cmd = _STOP
+            self._q.put(cmd)
+            if self._wakeup is not None:
+                self._wakeup()
+            if cmd is _STOP:
+                return
+
+
+class _ForwardingLogger:
+    """
+    Worker-side logger: forwards lifecycle/envelope/log events to the
+    supervisor's event queue. Envelopes are sent as their repr (opaque and
+    not guaranteed picklable).
+    """
+
+    def __init__(self, shard: int, events: Any):
+        self._shard = shard
+        self._events = events
+
+    def _send(self, event: str, fields: Dict[str, Any]) -> None:
+        try:
+            self._events.put((self._shard, event, fields))
+        except Exception:
+            # Logging MUST NOT break runtime control flow in Phase 1.
+            pass
+
+    def lifecycle_start(self, **fields: Any) -> None:
+        self._send("runtime.lifecycle.start", fields)
+
+    def lifecycle_stop(self, **fields: Any) -> None:
+        self._send("runtime.lifecycle.stop", fields)
+
+    def envelope(self, envelope_obj: Any, **fields: Any) -> None:
+        fields["envelope"] = repr(envelope_obj)
+        self._send("runtime.envelope.received", fields)
+
+    def info(self, msg: str, *args: Any) -> None:
+        self._send("runtime.worker.info", {"msg": msg % args if args else msg})
+
+    def warning(self, msg: str, *args: Any) -> None:
+        self._send("runtime.worker.warning", {"msg": msg % args if args else msg})
+
+    def error(self, msg: str, exc_info: Any = None) -> None:
+        self._send("runtime.worker.error", {"msg": msg, "exc": repr(exc_info)})
+
+
+def _worker_main(
+    shard: int,
+    handler: CommandHandler,
+    settings: Any,
+    tick_interval_sec: float,
+    commands: Any,
+    events: Any,
+    envelope_buffer_factory: Optional[Callable[[], Any]] = None,
+) -> None:
+    # Local import: keeps the supervisor importable without pulling the runner
+    # into processes that never start workers.
+    from lillycore.runtime.interactive_runner import run_interactive
+
+    logger = _ForwardingLogger(shard, events)
+    loop = run_interactive(
+        settings_loader=lambda: settings,
+        logger=logger,
+        ingress_adapter=_QueueIngress(handler, commands),
+        envelope_factory=wrap_exception,
+        envelope_sink=None,
+        envelope_buffer=(
+            envelope_buffer_factory() if envelope_buffer_factory is not None else None
+        ),
+        tick_interval_sec=tick_interval_sec,
+    )
+    try:
+        loop.run()
+    except KeyboardInterrupt:
+        # The supervisor owns shutdown; Ctrl-C in the terminal reaches the whole
+        # process group, so just stop quietly.
+        pass
+
+
+class _Worker:
+    __slots__ = ("shard", "process", "commands", "backlog", "restarts", "restart_at")
+
+    def __init__(self, shard: int):
+        self.shard = shard
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        # Command queue of the current process (replaced on every spawn).
+        self.commands: Any = None
+        # Commands routed while no process is running.
+        self.backlog: List[str] = []
+        self.restarts = 0
+        self.restart_at: Optional[float] = None
+
+    def running(self) -> bool:
+        proc = self.process
+        return self.restart_at is None and proc is not None and proc.is_alive()
+
+
+class RuntimeSupervisor:
+    """
+    Runs N runtime worker processes, each with its own HeartbeatLoop and
+    settings, and routes commands to them by shard key.
+
+    - route(command) picks a worker by crc32(shard_key(command)) % N, so the
+      same key always lands on the same worker (per-key ordering holds).
+    - poll() forwards worker lifecycle/envelope/log events to one logger
+      (RuntimeLogger-style: info(event, **fields)) tagged with `shard`, and
+      restarts crashed workers with exponential backoff up to max_restarts.
+      Commands routed while a worker is down are held by the supervisor and
+      handed to its replacement. A worker that exits cleanly (exit code 0,
+      e.g. a routed stop) is not restarted.
+    - every worker process gets a fresh command queue: a crashed worker can
+      leave its queue's reader lock held, so the old queue is abandoned (a
+      command routed as the worker dies can be lost with it).
+    - envelope_buffer_factory, if given, is called in each worker process and
+      its result passed to run_interactive(envelope_buffer=...), so commands
+      that query recent envelopes see that worker's own history.
+
+    handler and settings must be picklable when the multiprocessing start
+    method is "spawn" (module-level function, plain data/dataclass).
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        handler: CommandHandler,
+        *,
+        logger: Any = None,
+        settings_for: Optional[Callable[[int], Any]] = None,
+        tick_interval_sec: float = 0.5,
+        shard_key: Callable[[str], str] = _default_shard_key,
+        max_restarts: int = 5,
+        restart_backoff_sec: float = 0.5,
+        mp_context: Optional[Any] = None,
+        envelope_buffer_factory: Optional[Callable[[], Any]] = None,
+    ):
+        if num_workers < 1:
+            raise ValueError("num_workers must be >= 1")
+
+        if logger is None:
+            from lillycore.runtime.runtime_logger import RuntimeLogger
+
+            logger = RuntimeLogger()
+
+        self._ctx = mp_context or multiprocessing.get_context()
+        self._handler = handler
+        self._logger = logger
+        self._settings_for = settings_for or (lambda shard: {})
+        self._tick_interval_sec = tick_interval_sec
+        self._shard_key = shard_key
+        self._max_restarts = max_restarts
+        self._restart_backoff_sec = restart_backoff_sec
+        self._envelope_buffer_factory = envelope_buffer_factory
+
+        self._events = self._ctx.Queue()
+        self._workers: List[_Worker] = [_Worker(i) for i in range(num_workers)]
+        self._stopping = False
+
+    # ---- control surface -------------------------------------------------
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._workers)
+
+    def start(self) -> None:
+        for worker in self._workers:
+            self._spawn(worker)
+
+    def shard_for(self, command: str) -> int:
+        key = self._shard_key(command)
+        return zlib.crc32(key.encode("utf-8")) % len(self._workers)
+
+    def route(self, command: str) -> int:
+        """
+        Queue a command for its shard's worker; returns the shard index.
+        """
+        shard = self.shard_for(command)
+        worker = self._workers[shard]
+        if worker.running():
+            worker.commands.put(command)
+        else:
+            worker.backlog.append(command)
+        return shard
+
+    def poll(self) -> None:
+        """
+        Non-blocking: forward worker events and supervise worker processes.
+        Intended to run every tick of the supervisor's own loop.
+        """
+        self._drain_events()
+        if not self._stopping:
+            self._supervise()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopping = True
+        for worker in self._workers:
+            if worker.process is not None and worker.process.is_alive():
+                worker.commands.put(_STOP)
+
+        deadline = time.monotonic() + timeout
+        for worker in self._workers:
+            proc = worker.process
+            if proc is None:
+                continue
+            proc.join(max(0.0, deadline - time.monotonic()))
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(1.0)
+
+        self._drain_events()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": [
+                {
+                    "shard": w.shard,
+                    "pid": w.process.pid if w.process is not None else None,
+                    "alive": bool(w.process is not None and w.process.is_alive()),
+                    "restarts": w.restarts,
+                    "backlog": len(w.backlog),
+                }
+                for w in self._workers
+            ]
+        }
+
+    # ---- internal --------------------------------------------------------
+
+    def _spawn(self, worker: _Worker) -> None:
+        old = worker.commands
+        if old is not None:
+            # Never read again; don't let its feeder thread block exit.
+            old.cancel_join_thread()
+            old.close()
+        worker.commands = self._ctx.Queue()
+        for command in worker.backlog:
+            worker.commands.put(command)
+        worker.backlog.clear()
+
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                worker.shard,
+                self._handler,
+                self._settings_for(worker.shard),
+                self._tick_interval_sec,
+                worker.commands,
+                self._events,
+                self._envelope_buffer_factory,
+            ),
+            name=f"lillycore-worker-{worker.shard}",
+            daemon=True,
+        )
+        proc.start()
+        worker.process = proc
+        worker.restart_at = None
+        self._emit("runtime.supervisor.worker_start", shard=worker.shard, pid=proc.pid)
+
+    def _supervise(self) -> None:
+        now = time.monotonic()
+        for worker in self._workers:
+            proc = worker.process
+            if proc is None or proc.is_alive():
+                continue
+
+            if worker.restart_at is None:
+                self._emit(
+                    "runtime.supervisor.worker_exit",
+                    shard=worker.shard,
+                    pid=proc.pid,
+                    exitcode=proc.exitcode,
+                )
+                if proc.exitcode == 0:
+                    # Clean exit (stop requested): not a crash, not restarted.
+                    worker.process = None
+                    continue
+                if worker.restarts >= self._max_restarts:
+                    self._emit(
+                        "runtime.supervisor.worker_abandoned",
+                        shard=worker.shard,
+                        restarts=worker.restarts,
+                    )
+                    worker.process = None
+                    continue
+                worker.restart_at = now + self._restart_backoff_sec * (
+                    2**worker.restarts
+                )
+
+            if now >= worker.restart_at:
+                worker.restarts += 1
+                self._spawn(worker)
+
+    def _drain_events(self) -> None:
+        while True:
+            try:
+                shard, event, fields = self._events.get_nowait()
+            except queue.Empty:
+                return
+            except (EOFError, OSError):
+                return
+            self._emit(event, shard=shard, **fields)
+
+    def _emit(self, event: str, **fields: Any) -> None:
+        try:
+            if event == "runtime.envelope.received" or event.endswith(".error"):
+                self._logger.error(event, **fields)
+            else:
+                self._logger.info(event, **fields)
+        except Exception:
+            # Logging MUST NOT break runtime control flow in Phase 1.
+            pass
@@ -2,37 +2,86 @@
 
 from __future__ import annotations
 
+import os
 import queue
 import sys
 import threading
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from lillycore.runtime.command_ingress import CommandHandler, CommandIngress
-from lillycore.runtime.heartbeat import RuntimeStopRequested
+from lillycore.runtime.bounded_queue import (
+    POLICY_BLOCK,
+    BoundedQueue,
+    OverflowCallback,
+)
+from lillycore.runtime.command_ingress import (
+    CommandBatchHandler,
+    CommandHandler,
+    QueuedCommandIngress,
+)
 
+# Non-TTY fast path: bytes per os.read() on the stdin fd.
+_READ_CHUNK = 1 << 16
 
-class TerminalIngressAdapter(CommandIngress):
+
+class TerminalIngressAdapter(QueuedCommandIngress):
     """
     Phase 1 ingress adapter: interactive terminal input.
 
     Design:
     - Background thread blocks on stdin.readline()
     - poll() drains a queue (non-blocking) and emits commands to handler
+    - optional wakeup callback (set_wakeup) fires after each queued line so the
+      loop dispatches it without waiting for the next tick
+
+    Dispatch (poll, stop commands, EOF) is QueuedCommandIngress.
+
+    Batching (optional):
+    - on_commands(list) receives all commands drained by one poll() in a single
+      call instead of one on_command call per line
+    - max_batch_size bounds how many lines one poll() drains, keeping a single
+      tick bounded under bursts; the rest stay queued for the next poll
+    - stop commands still take effect in order: commands before the stop are
+      dispatched, commands after it are not; EOF is delivered as the final
+      "EOF" item of the batch
+
+    Backpressure (optional):
+    - queue_capacity bounds the lines held between the reader thread and
+      poll() (0 = unbounded); overflow_policy picks what happens when full:
+      block (reader stops reading stdin), drop_newest, drop_oldest or reject
+      (counted; on_overflow is called for every overflow event)
+    - stats() reports queue depth and drop counters (see BoundedQueue.stats);
+      the heartbeat loop forwards it to the logger
+    - EOF is tracked outside the queue, so it is never dropped
+
+    Non-interactive input (stdin is not a TTY, or interactive=False):
+    - no prompts are written
+    - stdin's fd is read in large os.read() chunks, split into lines in bulk
+      and queued with one put_many() per chunk (one wakeup per chunk)
+    - interactive=None (default) detects this with isatty()
     """
 
     def __init__(
         self,
-        on_command: CommandHandler,
+        on_command: Optional[CommandHandler] = None,
         *,
         prompt: str = "> ",
         strip: bool = True,
+        on_commands: Optional[CommandBatchHandler] = None,
+        max_batch_size: Optional[int] = None,
+        queue_capacity: int = 0,
+        overflow_policy: str = POLICY_BLOCK,
+        on_overflow: Optional[OverflowCallback] = None,
+        interactive: Optional[bool] = None,
     ):
-        self._on_command = on_command
+        super().__init__(
+            on_command,
+            on_commands,
+            BoundedQueue(queue_capacity, overflow_policy, on_overflow=on_overflow),
+            max_batch_size,
+        )
         self._prompt = prompt
         self._strip = strip
-
-        self._q: queue.SimpleQueue[Optional[str]] = queue.SimpleQueue()
-        self._started = False
+        self._interactive = interactive
         self._lock = threading.Lock()
 
     def start(self) -> None:
@@ -46,40 +95,20 @@ class TerminalIngressAdapter(CommandIngress):
             )
             t.start()
 
-    def poll(self) -> None:
-        # Ensure thread exists, but keep tick path non-blocking.
-        if not self._started:
-            self.start()
-
-        while True:
-            try:
-                line = self._q.get_nowait()
-            except Exception:
-                return
-
-            if line is None:
-                # EOF
-                self._on_command("EOF")
-                return
-
-            cmd = line
-            if self._strip:
-                cmd = cmd.strip()
-
-            if not cmd:
-                continue
-
-            # Phase 1 stop commands (P1.1.6):
-            # These are control signals, not errors.
-            if cmd in {"stop", "quit", "exit"}:
-                raise RuntimeStopRequested()
-
-            self._on_command(cmd)
+    def stats(self) -> Dict[str, Any]:
+        return self._q.stats()
 
     # ---- internal --------------------------------------------------------
 
+    def _command_of(self, line: str) -> str:
+        return line.strip() if self._strip else line
+
     def _reader_thread(self) -> None:
+        fd = self._bulk_fd()
         try:
+            if fd is not None:
+                self._read_bulk(fd)
+                return
             while True:
                 # Prompt without relying on input() (lets us control thread/EOF cleanly)
                 sys.stdout.write(self._prompt)
@@ -87,10 +116,64 @@ class TerminalIngressAdapter(CommandIngress):
 
                 line = sys.stdin.readline()
                 if line == "":
-                    self._q.put(None)
+                    self._put(None)
                     return
 
-                self._q.put(line)
+                self._put(line)
         except Exception:
             # In Phase 1, treat reader failure as EOF-ish; handler decides.
-            self._q.put(None)
+            self._put(None)
+
+    def _bulk_fd(self) -> Optional[int]:
+        """
+        stdin fd for the non-TTY fast path, or None for line-by-line reads.
+        """
+        if self._interactive:
+            return None
+        try:
+            if self._interactive is None and sys.stdin.isatty():
+                return None
+            fd = sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            # No real fd (e.g. StringIO): fall back to readline().
+            return None
+        return fd
+
+    def _read_bulk(self, fd: int) -> None:
+        keep_newline = not self._strip
+        tail = b""
+        while True:
+            chunk = os.read(fd, _READ_CHUNK)
+            if not chunk:
+                break
+            data = tail + chunk if tail else chunk
+            end = data.rfind(b"\n")
+            if end < 0:
+                tail = data
+                continue
+            tail = data[end + 1 :]
+            lines = data[:end].decode("utf-8", errors="replace").split("\n")
+            if keep_newline:
+                lines = [line + "\n" for line in lines]
+            self._put_many(lines)
+
+        if tail:
+            self._put_many([tail.decode("utf-8", errors="replace")])
+        self._put(None)
+
+    def _put_many(self, lines: List[str]) -> None:
+        # Overflowed lines are counted by the queue (see stats()).
+        if self._q.put_many(lines):
+            self._signal_wakeup()
+
+    def _put(self, line: Optional[str]) -> None:
+        if line is None:
+            self._mark_eof()
+            return
+        try:
+            if not self._q.put(line):
+                return
+        except queue.Full:
+            # reject: counted by the queue; the line is not delivered.
+            return
+        self._signal_wakeup()
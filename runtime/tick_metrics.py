@@ -0,0 +1,259 @@
+# lillycore/runtime/tick_metrics.py
+
+from __future__ import annotations
+
+import cProfile
+import inspect
+import io
+import json
+import pstats
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Log-linear (HDR-style) bucketing: values below _SUB are exact; above that,
+# every power-of-two range is split into _HALF linear sub-buckets, so the
+# relative error is bounded by 1/_HALF (~3%) at any magnitude.
+_SUB_BITS = 6
+_SUB = 1 << _SUB_BITS
+_HALF = _SUB >> 1
+_MAX_SHIFT = 64 - _SUB_BITS
+_BUCKETS = _SUB + _MAX_SHIFT * _HALF
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB:
+        return value if value > 0 else 0
+    shift = value.bit_length() - _SUB_BITS
+    if shift > _MAX_SHIFT:
+        return _BUCKETS - 1
+    return _SUB + (shift - 1) * _HALF + ((value >> shift) - _HALF)
+
+
+def _bucket_upper(index: int) -> int:
+    if index < _SUB:
+        return index
+    k = index - _SUB
+    shift = k // _HALF + 1
+    top = k % _HALF + _HALF
+    return ((top + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-linear latency histogram (nanoseconds).
+
+    record() is a handful of integer ops on a preallocated list; percentiles are
+    computed only when a snapshot is requested.
+    """
+
+    __slots__ = ("_counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self._counts: List[int] = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value_ns: int) -> None:
+        self._counts[_bucket_index(value_ns)] += 1
+        if self.count == 0 or value_ns < self.min:
+            self.min = value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+        self.count += 1
+        self.total += value_ns
+
+    def percentile(self, pct: float) -> int:
+        if self.count == 0:
+            return 0
+        target = max(1, int(round(self.count * pct / 100.0)))
+        seen = 0
+        for index, n in enumerate(self._counts):
+            if n:
+                seen += n
+                if seen >= target:
+                    return min(_bucket_upper(index), self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        if self.count == 0:
+            return {"count": 0}
+        us = 1000.0
+        return {
+            "count": self.count,
+            "min_us": self.min / us,
+            "mean_us": self.total / self.count / us,
+            "p50_us": self.percentile(50) / us,
+            "p90_us": self.percentile(90) / us,
+            "p99_us": self.percentile(99) / us,
+            "p999_us": self.percentile(99.9) / us,
+            "max_us": self.max / us,
+        }
+
+
+class TickMetrics:
+    """
+    Opt-in per-phase tick timing for HeartbeatLoop.
+
+    The loop instruments itself only when a TickMetrics is passed: hooks are
+    replaced by timed wrappers once at construction, so a loop without metrics
+    runs the exact same code as before (no per-tick checks).
+
+    Phases recorded: tick (whole tick), ingress.poll, logger.tick, on_tick,
+    envelope, pre_tick / tick_tasks / post_tick (pipeline phases).
+
+    profile_every_n_ticks > 0 wraps every Nth tick in cProfile; the aggregated
+    top functions are included in the snapshot. dump_path, if set, receives the
+    snapshot as JSON at shutdown (in addition to the logger finalize fields).
+    """
+
+    def __init__(
+        self,
+        *,
+        profile_every_n_ticks: int = 0,
+        profile_top_n: int = 25,
+        dump_path: Optional[str] = None,
+    ):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._profile_every = max(0, int(profile_every_n_ticks))
+        self._profile_top_n = profile_top_n
+        self._profile_stats: Optional[pstats.Stats] = None
+        self._profiled_ticks = 0
+        self.dump_path = dump_path
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = LatencyHistogram()
+        return hist
+
+    def timed(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap fn so each call records into histogram `name`.
+        Awaitable results are timed until they complete.
+        """
+        record = self.histogram(name).record
+        clock = time.perf_counter_ns
+
+        async def _finish(aw, started):
+            try:
+                return await aw
+            finally:
+                record(clock() - started)
+
+        def wrapper(*args, **kwargs):
+            started = clock()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                record(clock() - started)
+                raise
+            # Most hooks return None; skip the awaitable probe for them.
+            if result is not None and inspect.isawaitable(result):
+                return _finish(result, started)
+            record(clock() - started)
+            return result
+
+        return wrapper
+
+    def timed_phase(self, names: Dict[str, str], run_phase: Callable[..., Any]):
+        """
+        Wrap a pipeline run_phase(phase, on_error) callable, one histogram per phase.
+        """
+        wrapped = {phase: self.timed(name, run_phase) for phase, name in names.items()}
+
+        def wrapper(phase, on_error):
+            return wrapped[phase](phase, on_error)
+
+        return wrapper
+
+    def timed_tick(
+        self, run_tick: Callable[[], Any], tick_id: Callable[[], int]
+    ) -> Callable[[], Any]:
+        """
+        Wrap the loop's whole-tick runner; adds cProfile sampling when enabled.
+        """
+        timed = self.timed("tick", run_tick)
+        every = self._profile_every
+        if not every:
+            return timed
+
+        async def _finish_profiled(aw, profiler):
+            try:
+                return await aw
+            finally:
+                self._absorb(profiler)
+
+        def wrapper():
+            # tick_id() is the id of the last completed tick; this one is +1.
+            if (tick_id() + 1) % every:
+                return timed()
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                result = timed()
+            except BaseException:
+                self._absorb(profiler)
+                raise
+            if result is not None and inspect.isawaitable(result):
+                return _finish_profiled(result, profiler)
+            self._absorb(profiler)
+            return result
+
+        return wrapper
+
+    def snapshot(self) -> Dict[str, Any]:
+        snap: Dict[str, Any] = {
+            "phases": {name: h.snapshot() for name, h in self.histograms.items()}
+        }
+        if self._profile_every:
+            snap["profile"] = {
+                "every_n_ticks": self._profile_every,
+                "profiled_ticks": self._profiled_ticks,
+                "top": self._profile_top(),
+            }
+        return snap
+
+    def dump(self) -> Dict[str, Any]:
+        """
+        Snapshot for the shutdown hook; also written to dump_path if configured.
+        """
+        snap = self.snapshot()
+        if self.dump_path:
+            with open(self.dump_path, "w", encoding="utf-8") as f:
+                json.dump(snap, f, indent=2, sort_keys=True)
+        return snap
+
+    # ---- internal --------------------------------------------------------
+
+    def _absorb(self, profiler: cProfile.Profile) -> None:
+        profiler.disable()
+        self._profiled_ticks += 1
+        if self._profile_stats is None:
+            self._profile_stats = pstats.Stats(profiler, stream=io.StringIO())
+        else:
+            self._profile_stats.add(profiler)
+
+    def _profile_top(self) -> List[Dict[str, Any]]:
+        if self._profile_stats is None:
+            return []
+        rows = []
+        for (filename, lineno, func), (
+            cc,
+            nc,
+            tt,
+            ct,
+            _,
+        ) in self._profile_stats.stats.items():  # type: ignore[attr-defined]
+            rows.append(
+                {
+                    "function": f"{filename}:{lineno}({func})",
+                    "calls": nc,
+                    "primitive_calls": cc,
+                    "tottime_ms": tt * 1000.0,
+                    "cumtime_ms": ct * 1000.0,
+                }
+            )
+        rows.sort(key=lambda r: r["cumtime_ms"], reverse=True)
+        return rows[: self._profile_top_n]
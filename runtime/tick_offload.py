@@ -0,0 +1,295 @@
+# lillycore/runtime/tick_offload.py
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from lillycore.runtime.tick_pipeline import is_stop_request
+
+ErrorCallback = Callable[[BaseException, str], None]
+ResultCallback = Callable[..., None]
+
+
+class OffloadTimeout(TimeoutError):
+    """Raised (as an envelope) when offloaded work misses its deadline."""
+
+
+class OffloadTask:
+    """
+    Declared tick task executed in a worker process.
+
+    fn and args must be picklable (module-level function, plain data).
+    on_result(result, tick_id=...) runs on the heartbeat thread, where tick_id
+    is the tick that submitted the work.
+    """
+
+    __slots__ = (
+        "name",
+        "fn",
+        "args",
+        "every_n_ticks",
+        "deadline_sec",
+        "on_result",
+        "submitted",
+        "completed",
+        "failed",
+        "timed_out",
+        "skipped",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        every_n_ticks: int,
+        deadline_sec: Optional[float],
+        on_result: Optional[ResultCallback],
+    ):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.every_n_ticks = every_n_ticks
+        self.deadline_sec = deadline_sec
+        self.on_result = on_result
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.skipped = 0
+
+
+class _InFlight:
+    __slots__ = ("task", "future", "tick_id", "deadline")
+
+    def __init__(self, task, future, tick_id, deadline):
+        self.task = task
+        self.future = future
+        self.tick_id = tick_id
+        self.deadline = deadline
+
+
+class TickOffloader:
+    """
+    Process-pool offload for CPU-heavy tick work.
+
+    - Declared tasks are submitted on their due ticks (every_n_ticks).
+    - At most max_in_flight submissions are outstanding; when the window is
+      full, due submissions are skipped and counted (backpressure).
+    - Results are delivered on later ticks in submission order, so delivery
+      order is deterministic regardless of which worker finishes first.
+    - Worker exceptions and missed deadlines go to the loop's error callback
+      (envelope factory/sink seam).
+
+    The executor is created lazily on first submission.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        *,
+        max_in_flight: int = 8,
+        executor: Optional[concurrent.futures.Executor] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+
+        self._max_workers = max_workers
+        self._max_in_flight = max_in_flight
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._clock = clock
+
+        self._tasks: List[OffloadTask] = []
+        self._in_flight: Deque[_InFlight] = collections.deque()
+
+        # Futures whose deadline passed while already running in a worker:
+        # they still occupy a slot until the worker finishes.
+        self._abandoned: Set[concurrent.futures.Future] = set()
+
+    def declare(
+        self,
+        fn: Callable[..., Any],
+        *,
+        args: Tuple[Any, ...] = (),
+        every_n_ticks: int = 1,
+        deadline_sec: Optional[float] = None,
+        on_result: Optional[ResultCallback] = None,
+        name: Optional[str] = None,
+    ) -> OffloadTask:
+        if every_n_ticks < 1:
+            raise ValueError("every_n_ticks must be >= 1")
+
+        task = OffloadTask(
+            name or getattr(fn, "__name__", "offload"),
+            fn,
+            tuple(args),
+            every_n_ticks,
+            deadline_sec,
+            on_result,
+        )
+        self._tasks.append(task)
+        return task
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight) + len(self._abandoned)
+
+    def collect(self, on_error: ErrorCallback) -> None:
+        """
+        Deliver finished results (head of line first) and enforce deadlines.
+        """
+        if self._abandoned:
+            self._abandoned = {f for f in self._abandoned if not f.done()}
+
+        in_flight = self._in_flight
+        if not in_flight:
+            return
+
+        now = self._clock()
+        while in_flight:
+            item = in_flight[0]
+            future = item.future
+
+            if not future.done():
+                if item.deadline is None or now < item.deadline:
+                    # Head of line still running: later results wait so
+                    # delivery stays in submission order.
+                    return
+                in_flight.popleft()
+                item.task.timed_out += 1
+                if not future.cancel():
+                    self._abandoned.add(future)
+                on_error(
+                    OffloadTimeout(
+                        f"offloaded task '{item.task.name}' (tick {item.tick_id}) "
+                        f"missed its {item.task.deadline_sec}s deadline"
+                    ),
+                    f"runtime.offload.{item.task.name}",
+                )
+                continue
+
+            in_flight.popleft()
+            self._deliver(item, on_error)
+
+    def submit_due(
+        self, tick_id: int, on_error: Optional[ErrorCallback] = None
+    ) -> None:
+        """
+        Submit the tasks due on tick_id.
+
+        A failing submit is reported per task (runtime.offload.<name>) and the
+        other due tasks are still submitted. A broken pool (a worker died) is
+        reported once; an owned executor is then replaced, so later
+        submissions run on a fresh pool.
+        """
+        for task in self._tasks:
+            if tick_id % task.every_n_ticks:
+                continue
+            if self.in_flight >= self._max_in_flight:
+                task.skipped += 1
+                continue
+
+            deadline = (
+                self._clock() + task.deadline_sec
+                if task.deadline_sec is not None
+                else None
+            )
+            try:
+                future = self._get_executor().submit(task.fn, *task.args)
+            except Exception as exc:
+                if on_error is None:
+                    raise
+                task.skipped += 1
+                if isinstance(exc, concurrent.futures.BrokenExecutor):
+                    if self._replace_broken_executor():
+                        on_error(exc, "runtime.offload.executor")
+                        continue
+                on_error(exc, f"runtime.offload.{task.name}")
+                continue
+            task.submitted += 1
+            self._in_flight.append(_InFlight(task, future, tick_id, deadline))
+
+    def shutdown(self) -> None:
+        """
+        Cancel queued work and release the pool without waiting on workers.
+        """
+        for item in self._in_flight:
+            item.future.cancel()
+        self._in_flight.clear()
+        self._abandoned.clear()
+
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self._max_in_flight,
+            "tasks": [
+                {
+                    "name": t.name,
+                    "submitted": t.submitted,
+                    "completed": t.completed,
+                    "failed": t.failed,
+                    "timed_out": t.timed_out,
+                    "skipped": t.skipped,
+                }
+                for t in self._tasks
+            ],
+        }
+
+    # ---- internal --------------------------------------------------------
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._max_workers
+            )
+        return self._executor
+
+    def _replace_broken_executor(self) -> bool:
+        """
+        Drop a broken owned executor (the next submit creates a new one).
+        False for a caller-supplied executor, which is left alone.
+        """
+        if not self._owns_executor or self._executor is None:
+            return False
+        try:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            # Already broken; releasing it is best effort.
+            pass
+        self._executor = None
+        # Work abandoned on the dead pool no longer holds a slot.
+        self._abandoned.clear()
+        return True
+
+    def _deliver(self, item: _InFlight, on_error: ErrorCallback) -> None:
+        task = item.task
+        where = f"runtime.offload.{task.name}"
+
+        if item.future.cancelled():
+            return
+
+        exc = item.future.exception()
+        if exc is not None:
+            task.failed += 1
+            on_error(exc, where)
+            return
+
+        task.completed += 1
+        if task.on_result is None:
+            return
+
+        try:
+            task.on_result(item.future.result(), tick_id=item.tick_id)
+        except Exception as cb_exc:
+            if is_stop_request(cb_exc):
+                raise
+            on_error(cb_exc, f"{where}.on_result")
@@ -0,0 +1,210 @@
+# lillycore/runtime/tick_pipeline.py
+
+from __future__ import annotations
+
+import inspect
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+PHASE_PRE_TICK = "pre_tick"
+PHASE_TICK = "tick"
+PHASE_POST_TICK = "post_tick"
+
+PHASES: Tuple[str, ...] = (PHASE_PRE_TICK, PHASE_TICK, PHASE_POST_TICK)
+
+ErrorCallback = Callable[[BaseException, str], None]
+
+
+class TickTask:
+    """
+    Registered unit of per-tick work (handle returned by TickPipeline.register).
+    """
+
+    __slots__ = ("name", "fn", "phase", "priority", "runs", "deferred", "_seq")
+
+    def __init__(self, name: str, fn: Callable[[], Any], phase: str, priority: int):
+        self.name = name
+        self.fn = fn
+        self.phase = phase
+        self.priority = priority
+        self.runs = 0
+        self.deferred = 0
+        self._seq = 0
+
+
+class TickPipeline:
+    """
+    Phased per-tick task pipeline: pre_tick -> tick -> post_tick.
+
+    - Within a phase, tasks run by priority (higher first), then registration order.
+    - A phase may have a time budget (seconds). Once a phase has used its budget,
+      the remaining tasks of that phase are deferred (counted): the next tick
+      starts the phase at the first deferred task and wraps around, so every
+      task runs within a bounded number of ticks under sustained overload.
+    - A failing task is isolated: its exception goes to the error callback and
+      the phase continues. RuntimeStopRequested is control flow and propagates.
+    """
+
+    def __init__(
+        self,
+        phase_budgets: Optional[Mapping[str, float]] = None,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        budgets = dict(phase_budgets or {})
+        unknown = set(budgets) - set(PHASES)
+        if unknown:
+            raise ValueError(f"Unknown tick phases: {sorted(unknown)}")
+
+        self._budgets: Dict[str, Optional[float]] = {
+            phase: (float(budgets[phase]) if phase in budgets else None)
+            for phase in PHASES
+        }
+        self._clock = clock
+        self._seq = 0
+
+        # Sorted, immutable per-phase snapshots: the hot path only iterates.
+        self._tasks: Dict[str, Tuple[TickTask, ...]] = {phase: () for phase in PHASES}
+        # Offset of the first deferred task per phase (0 = start at the top).
+        self._resume: Dict[str, int] = {phase: 0 for phase in PHASES}
+        # phase -> has tasks; recomputed on (un)registration so the loop can
+        # skip empty phases without calling into the pipeline.
+        self.active: Dict[str, bool] = {phase: False for phase in PHASES}
+
+    def register(
+        self,
+        fn: Callable[[], Any],
+        *,
+        phase: str = PHASE_TICK,
+        priority: int = 0,
+        name: Optional[str] = None,
+    ) -> TickTask:
+        if phase not in self._tasks:
+            raise ValueError(f"Unknown tick phase: {phase}")
+
+        task = TickTask(name or getattr(fn, "__name__", "task"), fn, phase, priority)
+        self._seq += 1
+        task._seq = self._seq
+
+        tasks = list(self._tasks[phase])
+        tasks.append(task)
+        tasks.sort(key=lambda t: (-t.priority, t._seq))
+        self._store(phase, tuple(tasks))
+        return task
+
+    def unregister(self, task: TickTask) -> None:
+        self._store(
+            task.phase, tuple(t for t in self._tasks[task.phase] if t is not task)
+        )
+
+    def has_tasks(self, phase: str) -> bool:
+        return self.active[phase]
+
+    def run_phase(self, phase: str, on_error: ErrorCallback) -> None:
+        tasks = self._tasks[phase]
+        if not tasks:
+            return
+
+        budget = self._budgets[phase]
+        if budget is None:
+            for task in tasks:
+                task.runs += 1
+                try:
+                    task.fn()
+                except Exception as exc:
+                    if is_stop_request(exc):
+                        raise
+                    on_error(exc, f"runtime.{phase}.{task.name}")
+            return
+
+        clock = self._clock
+        started = clock()
+        start = self._resume[phase]
+        order = tasks[start:] + tasks[:start] if start else tasks
+        self._resume[phase] = 0
+
+        for i, task in enumerate(order):
+            if i and (clock() - started) >= budget:
+                self._defer(phase, order, i, start)
+                return
+            task.runs += 1
+            try:
+                task.fn()
+            except Exception as exc:
+                if is_stop_request(exc):
+                    raise
+                on_error(exc, f"runtime.{phase}.{task.name}")
+
+    async def run_phase_async(self, phase: str, on_error: ErrorCallback) -> None:
+        """
+        Same as run_phase, but awaits tasks that return awaitables.
+        """
+        tasks = self._tasks[phase]
+        if not tasks:
+            return
+
+        budget = self._budgets[phase]
+        clock = self._clock
+        started = clock() if budget is not None else 0.0
+        start = self._resume[phase]
+        order = tasks[start:] + tasks[:start] if start else tasks
+        self._resume[phase] = 0
+
+        for i, task in enumerate(order):
+            if budget is not None and i and (clock() - started) >= budget:
+                self._defer(phase, order, i, start)
+                return
+            task.runs += 1
+            try:
+                result = task.fn()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                if is_stop_request(exc):
+                    raise
+                on_error(exc, f"runtime.{phase}.{task.name}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            phase: {
+                "budget_ms": (
+                    self._budgets[phase] * 1000.0
+                    if self._budgets[phase] is not None
+                    else None
+                ),
+                "tasks": [
+                    {
+                        "name": t.name,
+                        "priority": t.priority,
+                        "runs": t.runs,
+                        "deferred": t.deferred,
+                    }
+                    for t in self._tasks[phase]
+                ],
+            }
+            for phase in PHASES
+        }
+
+    # ---- internal --------------------------------------------------------
+
+    def _store(self, phase: str, tasks: Tuple[TickTask, ...]) -> None:
+        self._tasks[phase] = tasks
+        self.active[phase] = bool(tasks)
+        # Positions shifted; restart the rotation from the top.
+        self._resume[phase] = 0
+
+    def _defer(
+        self, phase: str, order: Tuple[TickTask, ...], index: int, start: int
+    ) -> None:
+        for task in order[index:]:
+            task.deferred += 1
+        # order is tasks rotated by `start`; resume at the first skipped task.
+        self._resume[phase] = (start + index) % len(order)
+
+
+def is_stop_request(exc: BaseException) -> bool:
+    """True for RuntimeStopRequested (control flow, never enveloped)."""
+    # Local import: heartbeat imports this module.
+    from lillycore.runtime.heartbeat import RuntimeStopRequested
+
+    return isinstance(exc, RuntimeStopRequested)
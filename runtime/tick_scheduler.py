@@ -0,0 +1,136 @@
+# lillycore/runtime/tick_scheduler.py
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Overrun policies: what the scheduler does when a tick starts later than its
+# deadline by one or more whole intervals.
+# - catch_up: keep the original grid; missed ticks run back-to-back
+# - skip:     keep the original grid; missed ticks are dropped
+# - coalesce: missed ticks collapse into one; the grid re-anchors to "now"
+OVERRUN_CATCH_UP = "catch_up"
+OVERRUN_SKIP = "skip"
+OVERRUN_COALESCE = "coalesce"
+
+OVERRUN_POLICIES = frozenset({OVERRUN_CATCH_UP, OVERRUN_SKIP, OVERRUN_COALESCE})
+
+
+class TickScheduler:
+    """
+    Drift-compensated tick scheduler.
+
+    Deadlines are absolute monotonic timestamps (start + n * interval), so tick
+    work time does not accumulate into the period. The scheduler only computes
+    deadlines and timing numbers; the owning loop decides how to wait.
+
+    Timing numbers (per tick):
+    - lag: how late the tick started relative to its deadline
+    - jitter: smoothed deviation of the observed period from the interval
+      (RFC 3550 style estimator, gain 1/16)
+    """
+
+    def __init__(
+        self,
+        interval_sec: float,
+        *,
+        policy: str = OVERRUN_CATCH_UP,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        interval_sec = float(interval_sec)
+        if interval_sec <= 0:
+            raise ValueError("interval_sec must be > 0")
+        if policy not in OVERRUN_POLICIES:
+            raise ValueError(f"Unsupported overrun policy: {policy}")
+
+        self._interval = interval_sec
+        self._policy = policy
+        self._clock = clock
+
+        self._deadline: Optional[float] = None
+        self._last_start: Optional[float] = None
+
+        self._lag = 0.0
+        self._max_lag = 0.0
+        self._jitter = 0.0
+        self._missed_ticks = 0
+        self._overruns = 0
+
+    @property
+    def interval_sec(self) -> float:
+        return self._interval
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    @property
+    def lag_sec(self) -> float:
+        return self._lag
+
+    @property
+    def jitter_sec(self) -> float:
+        return self._jitter
+
+    def start(self, now: Optional[float] = None) -> None:
+        """Anchor the tick grid; the first tick is due immediately."""
+        self._deadline = self._clock() if now is None else now
+        self._last_start = None
+
+    def remaining(self, now: Optional[float] = None) -> float:
+        """Seconds until the next tick is due (<= 0 means due now)."""
+        if self._deadline is None:
+            self.start(now)
+        if now is None:
+            now = self._clock()
+        return self._deadline - now
+
+    def begin_tick(self, now: Optional[float] = None) -> None:
+        """
+        Record that a tick is starting and advance the deadline per policy.
+        """
+        if self._deadline is None:
+            self.start(now)
+        if now is None:
+            now = self._clock()
+
+        deadline = self._deadline
+        interval = self._interval
+
+        lag = now - deadline
+        if lag < 0.0:
+            lag = 0.0
+        self._lag = lag
+        if lag > self._max_lag:
+            self._max_lag = lag
+
+        if self._last_start is not None:
+            deviation = abs((now - self._last_start) - interval)
+            self._jitter += (deviation - self._jitter) / 16.0
+        self._last_start = now
+
+        nxt = deadline + interval
+        if nxt <= now:
+            # Overrun: at least one whole interval has been missed.
+            self._overruns += 1
+            if self._policy == OVERRUN_SKIP:
+                missed = int((now - deadline) // interval)
+                self._missed_ticks += missed
+                nxt = deadline + (missed + 1) * interval
+            elif self._policy == OVERRUN_COALESCE:
+                self._missed_ticks += int((now - deadline) // interval)
+                nxt = now + interval
+            # OVERRUN_CATCH_UP: keep nxt; the loop runs the backlog without waiting.
+        self._deadline = nxt
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "interval_ms": self._interval * 1000.0,
+            "policy": self._policy,
+            "lag_ms": self._lag * 1000.0,
+            "max_lag_ms": self._max_lag * 1000.0,
+            "jitter_ms": self._jitter * 1000.0,
+            "missed_ticks": self._missed_ticks,
+            "overruns": self._overruns,
+        }
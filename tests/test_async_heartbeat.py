@@ -0,0 +1,94 @@
+# lillycore/tests/test_async_heartbeat.py
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from lillycore.runtime.async_heartbeat import AsyncHeartbeatLoop
+from lillycore.runtime.error_envelopes import wrap_exception
+from lillycore.runtime.heartbeat import HeartbeatLoop, RuntimeStopRequested
+from lillycore.runtime.interactive_runner import run_interactive
+from lillycore.runtime.runtime_system_settings import (
+    default_runtime_system_settings,
+)
+
+
+class _Logger:
+    def info(self, *args, **kwargs):
+        pass
+
+
+def _runner(settings, **kwargs):
+    return run_interactive(
+        settings_loader=lambda: settings,
+        logger=_Logger(),
+        ingress_adapter=None,
+        envelope_factory=wrap_exception,
+        envelope_sink=None,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("settings", [{}, default_runtime_system_settings()])
+def test_async_loop_is_opt_in(settings):
+    assert type(_runner(settings)) is HeartbeatLoop
+
+
+def test_async_enabled_setting_selects_async_loop():
+    assert isinstance(_runner({"async_enabled": True}), AsyncHeartbeatLoop)
+
+
+def test_coroutine_hooks_sinks_and_spawned_tasks():
+    events = []
+    envelopes = []
+    loop = None
+
+    async def on_tick():
+        await asyncio.sleep(0)
+        events.append(loop.tick_id)
+        if loop.tick_id == 1:
+            loop.spawn(failing(), where="runtime.task.job")
+        if loop.tick_id == 3:
+            loop.request_stop()
+
+    async def failing():
+        await asyncio.sleep(0)
+        raise ValueError("job failed")
+
+    async def on_stop():
+        await asyncio.sleep(0)
+        events.append("stopped")
+
+    async def sink(env):
+        await asyncio.sleep(0)
+        envelopes.append(env.where)
+
+    loop = AsyncHeartbeatLoop(
+        on_tick=on_tick,
+        on_stop=on_stop,
+        envelope_factory=wrap_exception,
+        envelope_sink=sink,
+        tick_interval_sec=0.001,
+    )
+    loop.run()
+    assert events == [1, 2, 3, "stopped"]
+    assert envelopes == ["runtime.task.job"]
+
+
+def test_async_ingress_poll_and_stop():
+    class _AsyncIngress:
+        polls = 0
+
+        async def poll(self):
+            self.polls += 1
+            if self.polls == 3:
+                raise RuntimeStopRequested()
+
+    ingress = _AsyncIngress()
+    loop = AsyncHeartbeatLoop(ingress=ingress, tick_interval_sec=0.001)
+    asyncio.run(loop.run_async())
+    assert ingress.polls == 3
+    assert loop.tick_id == 2
+    assert loop.event_loop is None
@@ -0,0 +1,132 @@
+# lillycore/tests/test_bounded_queue.py
+
+from __future__ import annotations
+
+import queue
+import threading
+
+import pytest
+
+from lillycore.runtime.bounded_queue import (
+    POLICY_BLOCK,
+    POLICY_DROP_NEWEST,
+    POLICY_DROP_OLDEST,
+    POLICY_REJECT,
+    BoundedQueue,
+)
+from lillycore.runtime.heartbeat import HeartbeatLoop, RuntimeStopRequested
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        BoundedQueue(1, "spill")
+
+
+def test_drop_oldest_evicts_head():
+    evicted = []
+    q = BoundedQueue(2, POLICY_DROP_OLDEST, on_overflow=lambda p, i: evicted.append(i))
+    assert q.put(1) and q.put(2) and q.put(3)
+    assert q.drain() == [2, 3]
+    assert evicted == [1]
+    assert q.stats()["dropped_oldest"] == 1
+
+
+def test_drop_newest_discards_incoming():
+    q = BoundedQueue(2, POLICY_DROP_NEWEST)
+    assert q.put(1) and q.put(2)
+    assert q.put(3) is False
+    assert q.drain() == [1, 2]
+    assert q.stats()["dropped_newest"] == 1
+
+
+def test_reject_raises_full_and_put_many_skips():
+    q = BoundedQueue(2, POLICY_REJECT)
+    q.put(1)
+    q.put(2)
+    with pytest.raises(queue.Full):
+        q.put(3)
+    assert q.put_many([4, 5]) == 0
+    assert q.stats()["rejected"] == 3
+    assert q.drain() == [1, 2]
+
+
+def test_block_times_out_and_waits_for_room():
+    q = BoundedQueue(1, POLICY_BLOCK)
+    q.put("a")
+    assert q.put("b", timeout=0.01) is False
+
+    t = threading.Timer(0.05, q.get_nowait)
+    t.start()
+    assert q.put("c", timeout=5.0) is True
+    t.join()
+    assert q.drain() == ["c"]
+    assert q.stats()["blocked"] == 2
+
+
+def test_unbounded_put_many_and_bounded_drain():
+    q = BoundedQueue()
+    assert q.put_many(range(5)) == 5
+    assert q.drain(2) == [0, 1]
+    assert len(q) == 3
+    assert q.stats()["max_depth"] == 5
+
+
+def test_requeue_restores_order_at_head_past_capacity():
+    q = BoundedQueue(3, POLICY_REJECT)
+    q.put_many(["a", "b", "c"])
+    taken = q.drain(2)
+    q.put("d")
+    q.requeue(taken)
+    assert len(q) == 4  # already admitted: capacity does not apply
+    assert q.drain() == ["a", "b", "c", "d"]
+    stats = q.stats()
+    assert stats["enqueued"] == 4
+    assert stats["dequeued"] == 4
+
+
+def test_close_refuses_puts_and_wakes_get():
+    q = BoundedQueue(1)
+    q.close()
+    assert q.put("x") is False
+    with pytest.raises(queue.Empty):
+        q.get(timeout=1.0)
+
+
+class _StatsIngress:
+    def __init__(self):
+        self.queue = BoundedQueue(4)
+
+    def poll(self):
+        raise RuntimeStopRequested()
+
+    def stats(self):
+        return self.queue.stats()
+
+
+def test_plain_finalize_hook_still_called_with_queue_stats_provider():
+    calls = []
+
+    class _PlainLogger:
+        def flush(self):
+            calls.append("flush")
+
+    envelopes = []
+    HeartbeatLoop(
+        logger=_PlainLogger(),
+        ingress=_StatsIngress(),
+        envelope_factory=lambda exc, where: where,
+        envelope_sink=envelopes.append,
+    ).run()
+    assert calls == ["flush"]
+    assert envelopes == []
+
+
+def test_kwargs_finalize_hook_receives_queue_stats():
+    finalized = []
+
+    class _Logger:
+        def finalize(self, **fields):
+            finalized.append(fields)
+
+    HeartbeatLoop(logger=_Logger(), ingress=_StatsIngress()).run()
+    assert finalized[0]["ingress"]["capacity"] == 4
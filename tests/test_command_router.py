@@ -0,0 +1,84 @@
+# lillycore/tests/test_command_router.py
+
+from __future__ import annotations
+
+import pytest
+
+from lillycore.runtime.command_router import (
+    AmbiguousCommand,
+    CommandRouter,
+    UnknownCommand,
+)
+
+
+def _router(**kwargs):
+    calls = []
+    router = CommandRouter(**kwargs)
+    router.register("status", lambda c: calls.append(("status", c.args)))
+    router.register("stats", lambda c: calls.append(("stats", c.args)))
+    router.register("say", lambda c: calls.append(("say", c.rest)), aliases=["echo"])
+    return router, calls
+
+
+def test_verbs_aliases_case_and_whitespace():
+    router, calls = _router()
+    router("STATUS  a b")
+    router("echo\thello   world")
+    assert calls == [("status", ("a", "b")), ("say", "hello   world")]
+
+
+def test_unique_prefix_resolves_and_ambiguous_raises():
+    router, calls = _router()
+    router("sa hi")
+    assert calls == [("say", "hi")]
+    with pytest.raises(AmbiguousCommand) as info:
+        router("stat")
+    assert info.value.candidates == ["stats", "status"]
+
+
+def test_unknown_goes_to_default_or_raises():
+    router, _ = _router(prefix_matching=False)
+    with pytest.raises(UnknownCommand):
+        router("sa hi")
+
+    seen = []
+    router, _ = _router(default=seen.append)
+    router("nope x")
+    assert [(p.verb, p.word, p.args) for p in seen] == [("", "nope", ("x",))]
+    assert router.stats()["unknown"] == 1
+
+
+def test_argument_less_route_only_matches_bare_verb():
+    seen = []
+    router = CommandRouter(default=lambda p: seen.append(p.raw))
+    router.register("boom", lambda c: seen.append("BOOM"), takes_args=False)
+    router("boom extra")
+    router("boom")
+    assert seen == ["boom extra", "BOOM"]
+    assert router.parse("boom extra").verb == ""
+    assert router.stats()["unknown"] == 1
+
+
+def test_stats_count_calls_errors_and_latency():
+    router = CommandRouter()
+
+    def fail(cmd):
+        raise ValueError("x")
+
+    router.register("fail", fail)
+    with pytest.raises(ValueError):
+        router("fail")
+    verb = router.stats()["verbs"]["fail"]
+    assert (verb["calls"], verb["errors"]) == (1, 1)
+    assert verb["latency"]["count"] == 1
+
+
+def test_reregister_and_unregister_refresh_prefix_cache():
+    router, calls = _router()
+    router("sa x")  # caches "sa" -> say
+    router.unregister("say")
+    router.register("sail", lambda c: calls.append(("sail", c.args)))
+    router("sa y")
+    assert calls[-1] == ("sail", ("y",))
+    with pytest.raises(ValueError):
+        router.register("other", lambda c: None, aliases=["sail"])
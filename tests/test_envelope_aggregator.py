@@ -0,0 +1,91 @@
+# lillycore/tests/test_envelope_aggregator.py
+
+from __future__ import annotations
+
+from lillycore.runtime.clock import VirtualClock
+from lillycore.runtime.envelope_aggregator import EnvelopeAggregator
+from lillycore.runtime.error_envelopes import wrap_exception
+from lillycore.runtime.interactive_runner import run_interactive
+
+
+def _envelope(where="runtime.tick", exc_type=ValueError):
+    try:
+        raise exc_type("boom")
+    except Exception as exc:
+        return wrap_exception(exc, where=where)
+
+
+def _aggregator(clock, interval=10.0, **kwargs):
+    sink, summaries = [], []
+    aggregator = EnvelopeAggregator(
+        sink.append,
+        summary_interval_sec=interval,
+        on_summary=summaries.append,
+        clock=clock.monotonic,
+        **kwargs,
+    )
+    return aggregator, sink, summaries
+
+
+def test_repeats_are_suppressed_then_summarized():
+    clock = VirtualClock()
+    aggregator, sink, summaries = _aggregator(clock)
+    for _ in range(5):
+        aggregator(_envelope())
+    aggregator(_envelope(where="runtime.ingress"))
+
+    assert [env.where for env in sink] == ["runtime.tick", "runtime.ingress"]
+    assert aggregator.flush_due() == 0
+
+    clock.advance(10.0)
+    assert aggregator.flush_due() == 1
+    (summary,) = summaries
+    assert summary["where"] == "runtime.tick"
+    assert summary["exc_type"] == "ValueError"
+    assert (summary["count"], summary["suppressed"]) == (5, 4)
+    assert aggregator.stats()["suppressed"] == 4
+
+
+def test_idle_fingerprint_is_forgotten_and_emitted_again():
+    clock = VirtualClock()
+    aggregator, sink, _ = _aggregator(clock)
+    aggregator(_envelope())
+    aggregator.flush()  # marks idle
+    aggregator.flush()  # forgets it
+    aggregator(_envelope())
+    assert len(sink) == 2
+
+
+def test_eviction_summarizes_least_recently_seen():
+    clock = VirtualClock()
+    aggregator, sink, summaries = _aggregator(clock, max_fingerprints=1)
+    aggregator(_envelope(exc_type=KeyError))
+    aggregator(_envelope(exc_type=KeyError))
+    aggregator(_envelope(exc_type=TypeError))
+    assert [s["exc_type"] for s in summaries] == ["KeyError"]
+    assert aggregator.stats()["evicted"] == 1
+
+
+def test_runner_logs_every_envelope_by_default():
+    class _Ingress:
+        def poll(self):
+            raise ValueError("poll failed")
+
+    sink = []
+
+    class _Logger:
+        def info(self, *args, **kwargs):
+            pass
+
+    loop = run_interactive(
+        settings_loader=lambda: {},
+        logger=_Logger(),
+        ingress_adapter=_Ingress(),
+        envelope_factory=wrap_exception,
+        envelope_sink=sink.append,
+        tick_interval_sec=0.001,
+        max_ticks=3,
+        envelope_dispatch=False,
+    )
+    loop.run()
+    assert len(sink) == 3
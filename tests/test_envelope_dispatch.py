@@ -0,0 +1,183 @@
+# lillycore/tests/test_envelope_dispatch.py
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from lillycore.runtime.envelope_dispatcher import EnvelopeDispatcher
+from lillycore.runtime.error_envelopes import wrap_exception
+from lillycore.runtime.heartbeat import HeartbeatLoop, RuntimeStopRequested
+from lillycore.runtime.interactive_runner import run_interactive
+
+
+class _Logger:
+    def __init__(self):
+        self.events = []
+
+    def info(self, *args, **kwargs):
+        pass
+
+    def envelope(self, envelope_obj, **fields):
+        self.events.append(("envelope", envelope_obj.where))
+
+    def finalize(self, **fields):
+        self.events.append(("finalize", fields))
+
+
+class _StopIngress:
+    def poll(self):
+        raise RuntimeStopRequested()
+
+
+def _run(async_mode, sink=None):
+    logger = _Logger()
+    loop = run_interactive(
+        settings_loader=lambda: {},
+        logger=logger,
+        ingress_adapter=_StopIngress(),
+        envelope_factory=wrap_exception,
+        envelope_sink=sink,
+        tick_interval_sec=0.01,
+        async_mode=async_mode,
+        envelope_dispatch=True,
+        envelope_summary_interval_sec=0,
+    )
+    loop.run()
+    return logger
+
+
+@pytest.mark.parametrize("async_mode", [False, True])
+def test_forced_shutdown_error_is_delivered_before_finalize(monkeypatch, async_mode):
+    monkeypatch.setenv("FORCE_SHUTDOWN_ERROR", "1")
+    seen = []
+    logger = _run(async_mode, sink=lambda env: seen.append(env.where))
+
+    assert seen == ["runtime.shutdown.on_stop"]
+    assert logger.events[0] == ("envelope", "runtime.shutdown.on_stop")
+    kind, fields = logger.events[-1]
+    assert kind == "finalize"
+    dispatch = fields["envelope_dispatch"]
+    assert dispatch["closed"] is True
+    for lane in dispatch["sinks"].values():
+        assert lane["delivered"] == 1
+        assert lane["queue"]["depth"] == 0
+
+
+def test_async_sink_runs_on_the_loop_event_loop():
+    threads = []
+
+    async def sink(env):
+        await asyncio.sleep(0)
+        threads.append(threading.current_thread())
+
+    class _ErrorThenStop:
+        polls = 0
+
+        def poll(self):
+            self.polls += 1
+            if self.polls == 1:
+                raise ValueError("boom")
+            raise RuntimeStopRequested()
+
+    loop = run_interactive(
+        settings_loader=lambda: {},
+        logger=_Logger(),
+        ingress_adapter=_ErrorThenStop(),
+        envelope_factory=wrap_exception,
+        envelope_sink=sink,
+        tick_interval_sec=0.01,
+        async_mode=True,
+        envelope_dispatch=True,
+        envelope_summary_interval_sec=0,
+    )
+    loop.run()
+    assert threads == [threading.main_thread()]
+
+
+def test_shutdown_hooks_run_after_failing_on_stop():
+    order = []
+    envelopes = []
+
+    def on_stop():
+        order.append("on_stop")
+        raise RuntimeError("on_stop failed")
+
+    def hook():
+        order.append("hook")
+        raise ValueError("hook failed")
+
+    loop = HeartbeatLoop(
+        on_stop=on_stop,
+        ingress=_StopIngress(),
+        envelope_factory=wrap_exception,
+        envelope_sink=envelopes.append,
+    )
+    loop.register_shutdown(hook, name="hook")
+    loop.register_shutdown(lambda: order.append("second"), name="second")
+    loop.run()
+
+    assert order == ["on_stop", "hook", "second"]
+    assert [env.where for env in envelopes] == [
+        "runtime.shutdown.on_stop",
+        "runtime.shutdown.hook",
+    ]
+
+
+def test_dispatcher_isolates_failing_and_slow_sinks():
+    delivered = []
+    gate = threading.Event()
+
+    def failing(env):
+        raise OSError("disk full")
+
+    def slow(env):
+        gate.wait(5.0)
+
+    dispatcher = EnvelopeDispatcher(sink_timeout_sec=0.05)
+    dispatcher.add_sink("good", delivered.append)
+    dispatcher.add_sink("bad", failing)
+    dispatcher.add_sink("slow", slow)
+    for n in range(3):
+        dispatcher(n)
+        time.sleep(0.1)
+    gate.set()
+    assert dispatcher.close(5.0)
+
+    sinks = dispatcher.stats()["sinks"]
+    assert delivered == [0, 1, 2]
+    assert sinks["bad"]["errors"] == 3
+    assert sinks["bad"]["last_error"] == "OSError: disk full"
+    assert sinks["slow"]["stalls"] == 1
+    assert sinks["slow"]["skipped"] >= 1
+
+    # After close() delivery is synchronous on the caller's thread.
+    dispatcher(3)
+    assert delivered[-1] == 3
+
+
+def test_sinks_run_synchronously_by_default():
+    threads = []
+
+    class _ErrorThenStop:
+        polls = 0
+
+        def poll(self):
+            self.polls += 1
+            if self.polls == 1:
+                raise ValueError("boom")
+            raise RuntimeStopRequested()
+
+    loop = run_interactive(
+        settings_loader=lambda: {},
+        logger=_Logger(),
+        ingress_adapter=_ErrorThenStop(),
+        envelope_factory=wrap_exception,
+        envelope_sink=lambda env: threads.append(threading.current_thread()),
+        tick_interval_sec=0.01,
+    )
+    loop.run()
+    assert threads == [threading.current_thread()]
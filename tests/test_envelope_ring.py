@@ -0,0 +1,72 @@
+# lillycore/tests/test_envelope_ring.py
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from lillycore.runtime.envelope_ring import EnvelopeRingBuffer
+
+
+def _env(n, where="runtime.tick", severity="error", exc_type=ValueError):
+    return SimpleNamespace(
+        n=n, where=where, severity=severity, exc_type=exc_type, ts=float(n)
+    )
+
+
+def _ns(envelopes):
+    return [e.n for e in envelopes]
+
+
+@pytest.fixture
+def ring():
+    ring = EnvelopeRingBuffer(capacity=8)
+    for n in range(6):
+        ring(_env(n, where="runtime.tick" if n % 2 else "runtime.ingress"))
+    ring(_env(6, severity="warning", exc_type=KeyError))
+    return ring
+
+
+def test_query_is_newest_first_with_limit(ring):
+    assert _ns(ring.query()) == [6, 5, 4, 3, 2, 1, 0]
+    assert _ns(ring.latest(2)) == [6, 5]
+    assert ring.query(limit=0) == []
+
+
+def test_query_filters_combine(ring):
+    assert _ns(ring.query(where="runtime.ingress")) == [4, 2, 0]
+    assert _ns(ring.query(where="runtime.tick", severity="error")) == [5, 3, 1]
+    assert _ns(ring.query(exc_type=KeyError)) == [6]
+    assert _ns(ring.query(exc_type="ValueError", where="runtime.ingress")) == [4, 2, 0]
+    assert ring.query(where="runtime.nowhere") == []
+
+
+def test_query_time_window(ring):
+    assert _ns(ring.query(since=2.0, until=4.0)) == [4, 3, 2]
+    assert _ns(ring.query(where="runtime.tick", since=2.0)) == [6, 5, 3]
+
+
+def test_between_is_oldest_first(ring):
+    assert _ns(ring.between(1.0, 3.5)) == [1, 2, 3]
+    assert ring.between(10.0, 20.0) == []
+
+
+def test_overwrite_unlinks_oldest_slots():
+    ring = EnvelopeRingBuffer(capacity=3)
+    for n in range(5):
+        ring(_env(n, where=f"w{n % 2}"))
+    assert len(ring) == 3
+    assert _ns(ring.query()) == [4, 3, 2]
+    assert _ns(ring.query(where="w0")) == [4, 2]
+    assert _ns(ring.between(0.0, 10.0)) == [2, 3, 4]
+    stats = ring.stats()
+    assert stats["recorded"] == 5
+    assert stats["overwritten"] == 2
+
+
+def test_timestamps_clamped_non_decreasing():
+    ring = EnvelopeRingBuffer(capacity=4)
+    ring(_env(5))
+    ring(_env(3))  # wall clock stepped back
+    assert _ns(ring.between(5.0, 5.0)) == [5, 3]
@@ -0,0 +1,62 @@
+# lillycore/tests/test_error_envelopes.py
+
+from __future__ import annotations
+
+import gc
+import weakref
+
+from lillycore.runtime.error_envelopes import wrap_exception
+
+
+class _Payload:
+    pass
+
+
+def _fail(payload):
+    raise ValueError("bad input")
+
+
+def _wrapped():
+    payload = _Payload()
+    ref = weakref.ref(payload)
+    try:
+        _fail(payload)
+    except ValueError as exc:
+        envelope = wrap_exception(exc, where="runtime.tick")
+    return envelope, ref
+
+
+def test_envelope_does_not_keep_failing_frames_alive():
+    envelope, ref = _wrapped()
+    gc.collect()
+    # The payload was a local of the failing frames.
+    assert ref() is None
+    assert [fs.name for fs in envelope.frames][-2:] == ["_wrapped", "_fail"]
+
+
+def test_traceback_is_rendered_on_access_and_cached():
+    envelope, _ = _wrapped()
+    assert envelope._rendered is None
+
+    text = envelope.traceback
+    assert text.startswith("Traceback (most recent call last):")
+    assert 'raise ValueError("bad input")' in text
+    assert text.rstrip().endswith("ValueError: bad input")
+    assert envelope.traceback is text
+
+
+def test_repr_is_a_one_line_summary():
+    envelope, _ = _wrapped()
+    assert repr(envelope) == (
+        "ErrorEnvelope(_exc=ValueError('bad input'), _where='runtime.tick', "
+        "_severity='error')"
+    )
+    assert envelope._rendered is None
+
+
+def test_exception_without_traceback():
+    envelope = wrap_exception(KeyError("k"), severity="warn")
+    assert envelope.severity == "warn"
+    assert envelope.exc_type is KeyError
+    assert len(envelope.frames) == 0
+    assert envelope.traceback == "KeyError: 'k'\n"
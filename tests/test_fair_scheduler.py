@@ -0,0 +1,175 @@
+# lillycore/tests/test_fair_scheduler.py
+
+from __future__ import annotations
+
+import collections
+import socket
+import time
+
+import pytest
+
+from lillycore.runtime.error_envelopes import wrap_exception
+from lillycore.runtime.fair_scheduler import FairShareScheduler
+from lillycore.runtime.heartbeat import RuntimeStopRequested
+from lillycore.runtime.interactive_runner import run_interactive
+from lillycore.runtime.socket_ingress import SocketIngressAdapter
+
+
+def _submit(scheduler, session, n):
+    for i in range(n):
+        scheduler.submit(session, f"{session}{i}")
+
+
+def test_sessions_interleave_round_robin():
+    seen = []
+    scheduler = FairShareScheduler(seen.append)
+    _submit(scheduler, "a", 3)
+    _submit(scheduler, "b", 3)
+    assert scheduler.run_tick() == 6
+    assert seen == ["a0", "b0", "a1", "b1", "a2", "b2"]
+
+
+def test_weights_scale_share_per_round():
+    seen = []
+    scheduler = FairShareScheduler(seen.append, weights={"a": 2}, max_per_tick=6)
+    _submit(scheduler, "a", 10)
+    _submit(scheduler, "b", 10)
+    scheduler.run_tick()
+    assert collections.Counter(cmd[0] for cmd in seen) == {"a": 4, "b": 2}
+
+
+def test_flood_does_not_starve_small_session():
+    seen = []
+    scheduler = FairShareScheduler(seen.append, max_per_tick=4)
+    _submit(scheduler, "flood", 100)
+    _submit(scheduler, "small", 2)
+    scheduler.run_tick()
+    assert "small0" in seen and "small1" in seen
+
+
+def test_cut_off_session_resumes_next_tick():
+    seen = []
+    scheduler = FairShareScheduler(seen.append, max_per_tick=3)
+    for session in ("a", "b", "c", "d"):
+        _submit(scheduler, session, 5)
+    scheduler.run_tick()
+    scheduler.run_tick()
+    first, second = seen[:3], seen[3:]
+    assert [cmd[0] for cmd in first] == ["a", "b", "c"]
+    assert second[0][0] == "d"
+
+
+def test_quota_caps_a_session_per_tick():
+    seen = []
+    scheduler = FairShareScheduler(seen.append, quantum=10, session_quotas={"a": 2})
+    _submit(scheduler, "a", 5)
+    _submit(scheduler, "b", 5)
+    scheduler.run_tick()
+    assert collections.Counter(cmd[0] for cmd in seen) == {"a": 2, "b": 5}
+    scheduler.run_tick()
+    assert collections.Counter(cmd[0] for cmd in seen) == {"a": 4, "b": 5}
+
+
+def test_handler_error_is_reported_per_session():
+    reported = []
+
+    def handler(cmd):
+        if cmd == "a0":
+            raise ValueError(cmd)
+
+    scheduler = FairShareScheduler(handler)
+    scheduler.set_error_reporter(lambda exc, where: reported.append(where))
+    _submit(scheduler, "a", 2)
+    _submit(scheduler, "b", 1)
+    assert scheduler.run_tick() == 3
+    assert reported == ["runtime.session.a"]
+    sessions = scheduler.stats()["sessions"]
+    assert sessions["a"]["errors"] == 1
+    assert sessions["a"]["dispatched"] == 2
+
+
+def test_stop_keeps_remaining_commands_queued():
+    def handler(cmd):
+        if cmd == "a1":
+            raise RuntimeStopRequested()
+
+    scheduler = FairShareScheduler(handler, quantum=10)
+    _submit(scheduler, "a", 4)
+    with pytest.raises(RuntimeStopRequested):
+        scheduler.run_tick()
+    assert scheduler.stats()["sessions"]["a"]["depth"] == 2
+
+
+def test_socket_connections_are_separate_sessions():
+    scheduler = FairShareScheduler(lambda cmd: None)
+    adapter = SocketIngressAdapter(scheduler.tagged(lambda: adapter.current_session))
+    adapter.start()
+    try:
+        with socket.create_connection(adapter.address) as first:
+            first.sendall(b"a\nb\n")
+            first.settimeout(5.0)
+            with socket.create_connection(adapter.address) as second:
+                second.sendall(b"c\n")
+                second.settimeout(5.0)
+                deadline = time.monotonic() + 5.0
+                while (
+                    sum(s["depth"] for s in scheduler.stats()["sessions"].values()) < 3
+                ):
+                    assert time.monotonic() < deadline, "commands not queued"
+                    adapter.poll()
+                    time.sleep(0.005)
+                assert second.recv(64) == b"ok\n"
+            assert first.recv(64) == b"ok\nok\n"
+    finally:
+        adapter.stop()
+
+    sessions = scheduler.stats()["sessions"]
+    assert {name: s["depth"] for name, s in sessions.items()} == {
+        "socket:1": 2,
+        "socket:2": 1,
+    }
+
+
+class _Logger:
+    def __init__(self):
+        self.finalized = None
+
+    def info(self, *args, **kwargs):
+        pass
+
+    def finalize(self, **fields):
+        self.finalized = fields
+
+
+def test_run_interactive_dispatches_sessions_each_tick():
+    seen = []
+    scheduler = FairShareScheduler(seen.append, default_quota=1)
+    terminal = scheduler.for_session("terminal")
+    polls = []
+
+    class _Ingress:
+        def poll(self):
+            polls.append(len(seen))
+            if len(polls) == 1:
+                for cmd in ("t0", "t1", "t2"):
+                    terminal(cmd)
+                scheduler.submit("socket:0", "s0")
+            elif len(polls) == 4:
+                raise RuntimeStopRequested()
+
+    logger = _Logger()
+    run_interactive(
+        settings_loader=lambda: {},
+        logger=logger,
+        ingress_adapter=_Ingress(),
+        envelope_factory=wrap_exception,
+        envelope_sink=None,
+        tick_interval_sec=0.001,
+        session_scheduler=scheduler,
+    ).run()
+
+    # One command per session per tick, interleaved across sessions.
+    assert seen == ["t0", "s0", "t1", "t2"]
+    fair_share = logger.finalized["fair_share"]
+    assert fair_share["active"] == 0
+    assert fair_share["sessions"]["terminal"]["dispatched"] == 3
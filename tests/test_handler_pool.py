@@ -0,0 +1,116 @@
+# lillycore/tests/test_handler_pool.py
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+
+import pytest
+
+from lillycore.runtime.handler_pool import HandlerPool, OffThreadIngress
+from lillycore.runtime.heartbeat import HeartbeatLoop, RuntimeStopRequested
+
+
+class _Inner:
+    """Inner ingress feeding a fixed list of commands to its handler."""
+
+    def __init__(self, on_command, commands):
+        self.on_command = on_command
+        self.commands = list(commands)
+
+    def poll(self):
+        while self.commands:
+            self.on_command(self.commands.pop(0))
+
+
+def _poll_until(ingress, done, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not done():
+        assert time.monotonic() < deadline, "timed out"
+        ingress.poll()
+        time.sleep(0.005)
+
+
+def _handler(cmd):
+    if cmd == "boom":
+        raise ValueError(cmd)
+    if cmd == "stop":
+        raise RuntimeStopRequested()
+    return cmd.upper()
+
+
+def test_results_and_errors_come_back_on_the_polling_thread():
+    results, reported, threads = [], [], []
+
+    def on_result(cmd, result):
+        threads.append(threading.current_thread())
+        results.append((cmd, result))
+
+    pool = HandlerPool(_handler, max_workers=1)
+    ingress = OffThreadIngress(
+        _Inner(pool, ["a", "boom", "b"]), pool, on_result=on_result
+    )
+    ingress.set_error_reporter(lambda exc, where: reported.append((repr(exc), where)))
+    try:
+        _poll_until(ingress, lambda: len(results) + len(reported) == 3)
+    finally:
+        ingress.stop()
+
+    assert results == [("a", "A"), ("b", "B")]
+    assert reported == [("ValueError('boom')", "runtime.ingress.handler")]
+    assert set(threads) == {threading.current_thread()}
+    assert pool.stats()["failed"] == 1
+
+
+def test_failing_on_result_is_reported_and_others_still_delivered():
+    delivered, reported = [], []
+
+    def on_result(cmd, result):
+        if cmd == "a":
+            raise KeyError(cmd)
+        delivered.append(cmd)
+
+    pool = HandlerPool(_handler, max_workers=1)
+    ingress = OffThreadIngress(_Inner(pool, ["a", "b"]), pool, on_result=on_result)
+    ingress.set_error_reporter(lambda exc, where: reported.append(where))
+    try:
+        _poll_until(ingress, lambda: delivered)
+    finally:
+        ingress.stop()
+    assert reported == ["runtime.ingress.on_result"]
+    assert delivered == ["b"]
+
+
+def test_stop_from_a_handler_stops_the_loop():
+    pool = HandlerPool(_handler, max_workers=2)
+    ingress = OffThreadIngress(_Inner(pool, ["a", "stop"]), pool)
+    loop = HeartbeatLoop(ingress=ingress, tick_interval_sec=0.01)
+    started = time.monotonic()
+    loop.run()
+    assert time.monotonic() - started < 5.0
+
+
+def test_reject_policy_surfaces_queue_full():
+    gate = threading.Event()
+    pool = HandlerPool(lambda cmd: gate.wait(5.0), max_workers=1, max_pending=1)
+    try:
+        pool("first")  # picked up by the worker
+        deadline = time.monotonic() + 5.0
+        while pool.stats()["running"] == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+        pool("second")  # waits in the queue
+        with pytest.raises(queue.Full):
+            pool("third")
+    finally:
+        gate.set()
+        pool.shutdown(1.0)
+
+
+def test_report_error_without_sink_or_logger_raises_original():
+    loop = HeartbeatLoop(tick_interval_sec=0.01)
+    error = ValueError("x")
+    with pytest.raises(ValueError) as info:
+        loop.report_error(error, where="w")
+    assert info.value is error
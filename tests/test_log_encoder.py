@@ -0,0 +1,78 @@
+# lillycore/tests/test_log_encoder.py
+
+from __future__ import annotations
+
+import json
+import math
+from datetime import datetime, timezone
+
+import pytest
+
+from lillycore.runtime.log_encoder import RecordEncoder
+
+
+def _expected(level, event, fields, ts):
+    record = {
+        "ts": datetime.fromtimestamp(ts, timezone.utc).isoformat(),
+        "level": level.upper(),
+        "event": event,
+        "fields": fields,
+    }
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {},
+        {"tick_id": 7, "ok": True, "missing": None},
+        {"ratio": 0.1, "big": 10**30, "nan": math.nan, "inf": -math.inf},
+        {"msg": 'quote " and \\ and \n and ünïcode'},
+        {"nested": {"a": [1, 2.5, "x"], "b": {"c": None}}, "tags": ["p", "q"]},
+    ],
+)
+def test_matches_json_dumps(fields):
+    encoder = RecordEncoder()
+    ts = 1_700_000_000.123456
+    assert encoder.encode("info", "runtime.tick", fields, ts) == _expected(
+        "info", "runtime.tick", fields, ts
+    )
+
+
+@pytest.mark.parametrize(
+    "ts", [0.0, 1_700_000_000.0, 1_700_000_000.000001, 1_700_000_000.9999996, -1.5]
+)
+def test_timestamp_matches_isoformat(ts):
+    assert RecordEncoder().timestamp(ts) == (
+        datetime.fromtimestamp(ts, timezone.utc).isoformat()
+    )
+
+
+def test_timestamp_cache_across_records():
+    encoder = RecordEncoder()
+    for ts in (100.0011, 100.0012, 100.0021, 100.0011):
+        assert encoder.timestamp(ts) == (
+            datetime.fromtimestamp(ts, timezone.utc).isoformat()
+        )
+
+
+def test_unencodable_leaf_becomes_repr_wrapper():
+    class Opaque:
+        def __repr__(self):
+            return "<opaque>"
+
+    line = RecordEncoder().encode(
+        "error", "runtime.envelope", {"env": Opaque(), "items": [1, Opaque()]}, 0.0
+    )
+    fields = json.loads(line)["fields"]
+    wrapper = {"__repr__": "<opaque>", "__type__": "Opaque"}
+    assert fields == {"env": wrapper, "items": [1, wrapper]}
+
+
+def test_rejected_container_is_wrapped_whole():
+    cyclic = []
+    cyclic.append(cyclic)
+    line = RecordEncoder().encode("warn", "x", {"cycle": cyclic, "n": 1}, 0.0)
+    fields = json.loads(line)["fields"]
+    assert fields["cycle"]["__type__"] == "list"
+    assert fields["n"] == 1
@@ -0,0 +1,92 @@
+# lillycore/tests/test_log_writer.py
+
+from __future__ import annotations
+
+import json
+import threading
+
+from lillycore.runtime.log_writer import BufferedLogWriter
+from lillycore.runtime.runtime_logger import LoggingConfig, RuntimeLogger
+
+
+class _Stream:
+    def __init__(self, gate=None):
+        self.chunks = []
+        self.flushes = 0
+        self.gate = gate
+
+    def write(self, data):
+        if self.gate is not None:
+            self.gate.wait(5.0)
+        self.chunks.append(data)
+
+    def flush(self):
+        self.flushes += 1
+
+    def getvalue(self):
+        return "".join(self.chunks)
+
+
+class _BrokenStream:
+    def write(self, data):
+        raise OSError("disk full")
+
+    def flush(self):
+        raise OSError("disk full")
+
+
+def test_lines_are_written_in_order_and_batched():
+    gate = threading.Event()
+    stream = _Stream(gate)
+    writer = BufferedLogWriter(stream, flush_interval_sec=10.0)
+    lines = [f"line {i}\n" for i in range(200)]
+    for line in lines:
+        writer.write(line)
+    # The writer thread is held in its first write(); the rest queue up.
+    gate.set()
+
+    assert writer.drain(5.0) is True
+    assert stream.getvalue() == "".join(lines)
+    assert len(stream.chunks) < len(lines)
+    assert stream.flushes == 1
+    writer.close(5.0)
+
+
+def test_flush_after_flush_bytes():
+    stream = _Stream()
+    writer = BufferedLogWriter(stream, flush_bytes=4, flush_interval_sec=10.0)
+    writer.write("12345\n")
+    writer.drain(5.0)
+    assert writer.stats()["flushes"] == 1
+    writer.close(5.0)
+
+
+def test_writes_after_close_go_straight_to_the_stream():
+    stream = _Stream()
+    writer = BufferedLogWriter(stream)
+    writer.write("queued\n")
+    assert writer.close(5.0) is True
+    writer.write("direct\n")
+    assert stream.getvalue() == "queued\ndirect\n"
+
+
+def test_stream_errors_are_counted_not_raised():
+    writer = BufferedLogWriter(_BrokenStream())
+    writer.write("lost\n")
+    writer.close(5.0)
+    stats = writer.stats()
+    assert stats["errors"] >= 1
+    assert stats["last_error"] == "OSError: disk full"
+
+
+def test_logger_finalize_drains_the_async_writer():
+    stream = _Stream()
+    logger = RuntimeLogger(LoggingConfig(async_writer=True), stream)
+    for i in range(100):
+        logger.info("event", i=i)
+    logger.finalize(ticks=100)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [r["fields"]["i"] for r in records[:-1]] == list(range(100))
+    assert records[-1]["event"] == "runtime.logging.finalize"
+    assert logger.writer_stats()["queue"]["depth"] == 0
@@ -0,0 +1,94 @@
+# lillycore/tests/test_multiplex_ingress.py
+
+from __future__ import annotations
+
+import collections
+
+import pytest
+
+from lillycore.runtime.heartbeat import RuntimeStopRequested
+from lillycore.runtime.multiplex_ingress import MultiplexIngress
+
+
+class _ListSource:
+    """Bounded ingress over a list of commands."""
+
+    def __init__(self, name, commands, log):
+        self.name = name
+        self.commands = collections.deque(commands)
+        self.log = log
+
+    def pending(self):
+        return len(self.commands)
+
+    def poll(self):
+        self.poll_bounded(None)
+
+    def poll_bounded(self, limit):
+        taken = 0
+        while self.commands and (limit is None or taken < limit):
+            cmd = self.commands.popleft()
+            if cmd == "stop":
+                raise RuntimeStopRequested()
+            if cmd == "boom":
+                raise ValueError("boom")
+            self.log.append((self.name, cmd))
+            taken += 1
+        return taken
+
+
+def _counts(log):
+    return collections.Counter(name for name, _ in log)
+
+
+def test_budget_split_by_weight():
+    log = []
+    mux = MultiplexIngress(budget_per_poll=30)
+    mux.add_source("heavy", _ListSource("heavy", range(100), log), weight=2)
+    mux.add_source("light", _ListSource("light", range(100), log))
+    mux.poll()
+    assert _counts(log) == {"heavy": 20, "light": 10}
+
+
+def test_unused_budget_goes_to_busy_sources():
+    log = []
+    mux = MultiplexIngress(budget_per_poll=10)
+    mux.add_source("a", _ListSource("a", range(2), log))
+    mux.add_source("b", _ListSource("b", range(100), log))
+    mux.poll()
+    assert _counts(log) == {"a": 2, "b": 8}
+
+
+def test_small_budget_rotates_over_busy_sources():
+    log = []
+    mux = MultiplexIngress(budget_per_poll=2)
+    for name in ("a", "b", "c"):
+        mux.add_source(name, _ListSource(name, range(1000), log))
+    for _ in range(300):
+        mux.poll()
+    counts = _counts(log)
+    assert sum(counts.values()) == 600
+    assert max(counts.values()) - min(counts.values()) <= 1
+
+
+def test_control_source_is_polled_first_and_unbudgeted():
+    log = []
+    mux = MultiplexIngress(budget_per_poll=1)
+    mux.add_source("bulk", _ListSource("bulk", range(10), log))
+    mux.add_source("ctl", _ListSource("ctl", ["x", "y", "stop"], log), control=True)
+    with pytest.raises(RuntimeStopRequested):
+        mux.poll()
+    assert log == [("ctl", "x"), ("ctl", "y")]
+
+
+def test_source_error_is_reported_and_others_still_polled():
+    log = []
+    reported = []
+    mux = MultiplexIngress()
+    mux.set_error_reporter(lambda exc, where: reported.append((type(exc), where)))
+    mux.add_source("bad", _ListSource("bad", ["boom"], log))
+    mux.add_source("good", _ListSource("good", ["ok"], log))
+    mux.poll()
+    assert reported == [(ValueError, "runtime.ingress.bad")]
+    assert log == [("good", "ok")]
+    assert mux.stats()["sources"]["bad"]["errors"] == 1
@@ -0,0 +1,116 @@
+# lillycore/tests/test_replay_ingress.py
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from lillycore.runtime.bounded_queue import BoundedQueue
+from lillycore.runtime.command_ingress import QueuedCommandIngress
+from lillycore.runtime.heartbeat import RuntimeStopRequested
+from lillycore.runtime.replay_ingress import ReplayIngressAdapter
+
+
+def _drain(adapter, got, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not got or got[-1] != "EOF":
+        assert time.monotonic() < deadline, "timed out"
+        adapter.poll()
+        time.sleep(0.001)
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_text_replay_in_order_then_eof(tmp_path, use_mmap):
+    path = tmp_path / "cmds.txt"
+    path.write_text("".join(f"cmd{i}\n" for i in range(2000)) + "\n  \n")
+    got = []
+    adapter = ReplayIngressAdapter(str(path), got.append, use_mmap=use_mmap)
+    _drain(adapter, got)
+    assert got == [f"cmd{i}" for i in range(2000)] + ["EOF"]
+    stats = adapter.stats()
+    assert stats["delivered"] == 2000
+    assert stats["complete"] is True
+
+
+def test_jsonl_skips_malformed_lines(tmp_path):
+    path = tmp_path / "cmds.jsonl"
+    lines = [
+        json.dumps({"command": "a", "ts": 1.0}),
+        "{not json",
+        json.dumps("b"),
+        json.dumps({"other": 1}),
+        json.dumps({"command": " c "}),
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    got = []
+    adapter = ReplayIngressAdapter(str(path), on_commands=got.extend)
+    _drain(adapter, got)
+    assert got == ["a", "b", "c", "EOF"]
+    stats = adapter.stats()
+    assert stats["skipped"] == 2
+    assert stats["bad_lines"] == [2, 4]
+
+
+def test_scaled_mode_follows_recorded_timestamps(tmp_path):
+    path = tmp_path / "cmds.jsonl"
+    path.write_text(
+        "\n".join(json.dumps({"command": c, "ts": t}) for c, t in [("a", 0), ("b", 2)])
+    )
+    got = []
+    adapter = ReplayIngressAdapter(str(path), got.append, mode="scaled", speed=20.0)
+    started = time.monotonic()
+    _drain(adapter, got)
+    assert got == ["a", "b", "EOF"]
+    assert time.monotonic() - started >= 0.09
+
+
+class _ListIngress(QueuedCommandIngress):
+    def start(self):
+        self._started = True
+
+
+def test_queued_ingress_requires_start():
+    class _NoStart(QueuedCommandIngress):
+        pass
+
+    with pytest.raises(TypeError):
+        _NoStart(print, None, BoundedQueue(), None)
+
+
+def test_stop_keeps_later_lines_queued():
+    got = []
+    q = BoundedQueue()
+    ingress = _ListIngress(got.append, None, q, None)
+    q.put_many(["a", "stop", "b"])
+    with pytest.raises(RuntimeStopRequested):
+        ingress.poll()
+    ingress.poll()
+    assert got == ["a", "b"]
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_failing_handler_keeps_later_lines_queued(batched):
+    got = []
+
+    def handle(cmds):
+        if "bad" in cmds:
+            raise ValueError("bad")
+        got.extend(cmds)
+
+    q = BoundedQueue()
+    if batched:
+        ingress = _ListIngress(None, handle, q, None)
+    else:
+        ingress = _ListIngress(lambda cmd: handle([cmd]), None, q, None)
+
+    q.put_many(["a", "bad", "stop", "c"])
+    # Batched: the stop splits the batch; the failing batch keeps the stop queued.
+    with pytest.raises(ValueError):
+        ingress.poll()
+    with pytest.raises(RuntimeStopRequested):
+        ingress.poll()
+    ingress.poll()
+    assert got == (["c"] if batched else ["a", "c"])
+    assert ingress.pending() == 0
@@ -0,0 +1,78 @@
+# lillycore/tests/test_runtime_logger.py
+
+from __future__ import annotations
+
+import io
+import json
+
+from lillycore.runtime.runtime_logger import LoggingConfig, RuntimeLogger
+
+
+def _logger(level="INFO", **config):
+    stream = io.StringIO()
+    logger = RuntimeLogger(LoggingConfig(level=level, **config), stream)
+    return logger, stream
+
+
+def _records(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_level_gate_follows_config():
+    logger, stream = _logger("WARN")
+    assert not logger.is_enabled("INFO")
+    assert logger.is_enabled("warning")
+    assert logger.is_enabled("ERROR")
+
+    logger.info("skipped")
+    logger.warn("kept")
+    assert [r["event"] for r in _records(stream)] == ["kept"]
+
+    logger.configure_from_settings({"runtime_logging": {"level": "debug"}})
+    assert logger.is_enabled("DEBUG")
+
+
+def test_lazy_fields_are_only_evaluated_when_emitted():
+    logger, stream = _logger("INFO")
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return {"depth": 3}
+
+    logger.debug("gated", stats=expensive)
+    assert calls == []
+
+    logger.info("emitted", stats=expensive, kind=dict)
+    assert calls == [1]
+    fields = _records(stream)[0]["fields"]
+    assert fields["stats"] == {"depth": 3}
+    # Classes are values, not lazy fields.
+    assert fields["kind"]["__repr__"] == "<class 'dict'>"
+
+
+def test_failing_lazy_field_becomes_an_error_value():
+    logger, stream = _logger()
+
+    def failing():
+        raise RuntimeError("stats unavailable")
+
+    logger.info("event", stats=failing, ok=1)
+    fields = _records(stream)[0]["fields"]
+    assert fields["stats"] == {"__error__": "RuntimeError: stats unavailable"}
+    assert fields["ok"] == 1
+
+
+def test_tick_providers_are_evaluated_only_for_emitted_heartbeats():
+    logger, stream = _logger(heartbeat_enabled=True, heartbeat_every_n_ticks=5)
+    calls = []
+
+    def provider():
+        calls.append(1)
+        return {"depth": 0}
+
+    for tick_id in range(1, 11):
+        logger.tick(tick_id, ingress=provider)
+
+    assert len(calls) == 2
+    assert [r["fields"]["tick_id"] for r in _records(stream)] == [5, 10]
@@ -0,0 +1,94 @@
+# lillycore/tests/test_socket_ingress.py
+
+from __future__ import annotations
+
+import socket
+import time
+
+import pytest
+
+from lillycore.runtime.heartbeat import RuntimeStopRequested
+from lillycore.runtime.socket_ingress import SocketIngressAdapter
+
+
+def _serve_until(adapter, done, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not done():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for the adapter")
+        adapter.poll()
+        time.sleep(0.005)
+
+
+def _read_all(sock, adapter, timeout=5.0):
+    sock.settimeout(0.05)
+    data = b""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        adapter.poll()
+        try:
+            chunk = sock.recv(4096)
+        except socket.timeout:
+            continue
+        if not chunk:
+            return data
+        data += chunk
+    raise AssertionError(f"connection not closed; got {data!r}")
+
+
+@pytest.fixture
+def adapter():
+    received = []
+    adapter = SocketIngressAdapter(received.append)
+    adapter.received = received
+    adapter.start()
+    yield adapter
+    adapter.stop()
+
+
+def test_half_close_gets_every_reply_then_eof(adapter):
+    with socket.create_connection(adapter.address) as sock:
+        # The last line is unterminated: still a command once the peer half-closes.
+        sock.sendall(b"first\nsecond\nlast")
+        sock.shutdown(socket.SHUT_WR)
+        replies = _read_all(sock, adapter)
+
+    assert adapter.received == ["first", "second", "last"]
+    assert replies == b"ok\nok\nok\n"
+
+
+def test_stop_command_is_acknowledged(adapter):
+    with socket.create_connection(adapter.address) as sock:
+        sock.sendall(b"stop\n")
+        with pytest.raises(RuntimeStopRequested):
+            _serve_until(adapter, lambda: False)
+        sock.settimeout(5.0)
+        assert sock.recv(64) == b"ok stopping\n"
+
+
+def test_line_too_long_keeps_reply_order():
+    received = []
+    adapter = SocketIngressAdapter(received.append, max_line_bytes=8)
+    adapter.start()
+    try:
+        with socket.create_connection(adapter.address) as sock:
+            sock.sendall(b"a\n" + b"x" * 20 + b"\nb\n")
+            sock.shutdown(socket.SHUT_WR)
+            replies = _read_all(sock, adapter)
+    finally:
+        adapter.stop()
+
+    assert received == ["a", "b"]
+    assert replies == b"ok\nerror LineTooLong\nok\n"
+
+
+def test_path_refuses_to_replace_a_regular_file(tmp_path):
+    path = tmp_path / "ingress.sock"
+    path.write_text("not a socket")
+    adapter = SocketIngressAdapter(lambda cmd: None, path=str(path))
+    try:
+        with pytest.raises(FileExistsError):
+            adapter.start()
+    finally:
+        adapter.stop()
+    assert path.read_text() == "not a socket"
@@ -0,0 +1,96 @@
+# lillycore/tests/test_supervisor.py
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from lillycore.runtime.supervisor import RuntimeSupervisor
+
+
+def _handler(cmd):
+    if cmd == "boom":
+        raise ValueError("forced error")
+    if cmd == "crash":
+        os._exit(3)
+
+
+class _Logger:
+    def __init__(self):
+        self.events = []
+
+    def info(self, event, **fields):
+        self.events.append((event, fields))
+
+    def error(self, event, **fields):
+        self.events.append((event, fields))
+
+    def seen(self, event):
+        return [fields for name, fields in self.events if name == event]
+
+
+def _supervisor(num_workers, **kwargs):
+    logger = _Logger()
+    supervisor = RuntimeSupervisor(
+        num_workers,
+        _handler,
+        logger=logger,
+        tick_interval_sec=0.01,
+        mp_context=multiprocessing.get_context("fork"),
+        **kwargs,
+    )
+    return supervisor, logger
+
+
+def _poll_until(supervisor, done, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not done():
+        assert time.monotonic() < deadline, "timed out waiting for workers"
+        supervisor.poll()
+        time.sleep(0.01)
+
+
+def test_shard_key_routes_consistently():
+    supervisor, _ = _supervisor(4, shard_key=lambda cmd: cmd.split()[0])
+    assert supervisor.shard_for("user:1 a") == supervisor.shard_for("user:1 b")
+    shards = {supervisor.shard_for(f"user:{i}") for i in range(100)}
+    assert shards == {0, 1, 2, 3}
+
+
+def test_invalid_worker_count():
+    with pytest.raises(ValueError):
+        RuntimeSupervisor(0, _handler)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_worker_envelopes_are_forwarded_and_crashes_restart():
+    supervisor, logger = _supervisor(
+        2, max_restarts=1, restart_backoff_sec=0.2, shard_key=lambda cmd: "key"
+    )
+    envelopes = lambda: logger.seen("runtime.envelope.received")  # noqa: E731
+    supervisor.start()
+    try:
+        shard = supervisor.route("boom")
+        _poll_until(supervisor, lambda: len(envelopes()) == 1)
+        assert envelopes()[0]["shard"] == shard
+
+        supervisor.route("crash")
+        _poll_until(supervisor, lambda: logger.seen("runtime.supervisor.worker_exit"))
+        exits = logger.seen("runtime.supervisor.worker_exit")
+        assert [(e["shard"], e["exitcode"]) for e in exits] == [(shard, 3)]
+
+        # Routed while the worker is down: handed to its replacement.
+        supervisor.route("boom")
+        assert supervisor.stats()["workers"][shard]["backlog"] == 1
+        _poll_until(supervisor, lambda: len(envelopes()) == 2)
+        worker = supervisor.stats()["workers"][shard]
+        assert (worker["restarts"], worker["backlog"]) == (1, 0)
+    finally:
+        supervisor.stop(timeout=5.0)
+
+    assert not any(w["alive"] for w in supervisor.stats()["workers"])
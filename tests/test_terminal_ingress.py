@@ -0,0 +1,122 @@
+# lillycore/tests/test_terminal_ingress.py
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from lillycore.runtime.heartbeat import RuntimeStopRequested
+from lillycore.runtime.terminal_ingress import TerminalIngressAdapter
+
+
+def _adapter(monkeypatch, text, **kwargs):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(text))
+    adapter = TerminalIngressAdapter(interactive=True, **kwargs)
+    adapter.start()
+    return adapter
+
+
+def _ready(adapter, n, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while adapter.pending() < n:
+        assert time.monotonic() < deadline, "input not queued"
+        time.sleep(0.001)
+
+
+def _pipe_stdin(monkeypatch, data):
+    """Non-TTY stdin backed by a pipe; data is written from a thread."""
+    read_fd, write_fd = os.pipe()
+
+    def feed():
+        with os.fdopen(write_fd, "wb") as w:
+            w.write(data)
+
+    threading.Thread(target=feed, daemon=True).start()
+    stdin = os.fdopen(read_fd, "r")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    return stdin
+
+
+def _poll_until_eof(adapter, got, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while "EOF" not in got:
+        assert time.monotonic() < deadline, "EOF not delivered"
+        adapter.poll()
+        time.sleep(0.001)
+
+
+def test_piped_stdin_is_read_in_bulk_without_prompts(monkeypatch, capsys):
+    # More than one read chunk, with the last line unterminated.
+    lines = [f"cmd {i:06d}" for i in range(20_000)]
+    stdin = _pipe_stdin(monkeypatch, "\n".join(lines).encode())
+    got = []
+    wakeups = []
+    adapter = TerminalIngressAdapter(on_command=got.append)
+    adapter.set_wakeup(lambda: wakeups.append(1))
+    try:
+        _poll_until_eof(adapter, got)
+    finally:
+        stdin.close()
+
+    assert got == lines + ["EOF"]
+    assert capsys.readouterr().out == ""
+    # One wakeup per chunk (plus EOF), not one per line.
+    assert len(wakeups) < 100
+
+
+def test_interactive_reads_lines_and_prompts(monkeypatch, capsys):
+    got = []
+    adapter = _adapter(monkeypatch, "  hello \nworld\n", on_command=got.append)
+    _poll_until_eof(adapter, got)
+
+    assert got == ["hello", "world", "EOF"]
+    assert capsys.readouterr().out == "> > > "
+
+
+def test_batches_are_bounded_per_poll(monkeypatch):
+    batches = []
+    adapter = _adapter(
+        monkeypatch, "a\nb\nc\n", on_commands=batches.append, max_batch_size=2
+    )
+    _ready(adapter, 4)
+    adapter.poll()
+    adapter.poll()
+
+    assert batches == [["a", "b"], ["c", "EOF"]]
+
+
+def test_stop_dispatches_the_batch_before_it(monkeypatch):
+    batches = []
+    adapter = _adapter(monkeypatch, "a\nb\nstop\nc\n", on_commands=batches.append)
+    _ready(adapter, 5)
+    with pytest.raises(RuntimeStopRequested):
+        adapter.poll()
+
+    assert batches == [["a", "b"]]
+    # The line after the stop stays queued.
+    assert adapter.stats()["depth"] == 1
+
+
+def test_failing_batch_counts_as_delivered_and_keeps_the_rest(monkeypatch):
+    def failing(batch):
+        raise ValueError("handler failed")
+
+    adapter = _adapter(monkeypatch, "a\nb\nstop\n", on_commands=failing)
+    _ready(adapter, 4)
+    with pytest.raises(ValueError):
+        adapter.poll()
+    # The stop after the failed batch is still queued.
+    with pytest.raises(RuntimeStopRequested):
+        adapter.poll()
+
+
+def test_needs_a_handler():
+    with pytest.raises(ValueError):
+        TerminalIngressAdapter()
+    with pytest.raises(ValueError):
+        TerminalIngressAdapter(on_command=print, max_batch_size=0)
@@ -0,0 +1,85 @@
+# lillycore/tests/test_tick_metrics.py
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from lillycore.runtime.heartbeat import HeartbeatLoop
+from lillycore.runtime.tick_metrics import LatencyHistogram, TickMetrics
+from lillycore.runtime.tick_pipeline import PHASE_POST_TICK
+
+
+def test_histogram_percentiles_are_within_bucket_error():
+    hist = LatencyHistogram()
+    for value in range(1, 10_001):
+        hist.record(value * 1000)
+
+    assert hist.count == 10_000
+    assert (hist.min, hist.max) == (1000, 10_000_000)
+    for pct in (50, 90, 99):
+        exact = pct * 100 * 1000
+        assert hist.percentile(pct) == pytest.approx(exact, rel=1 / 32)
+    assert hist.percentile(100) == hist.max
+
+
+def test_empty_histogram_snapshot():
+    assert LatencyHistogram().snapshot() == {"count": 0}
+    assert LatencyHistogram().percentile(50) == 0
+
+
+def test_timed_records_failures_and_awaitables():
+    metrics = TickMetrics()
+
+    def failing():
+        raise ValueError("hook failed")
+
+    with pytest.raises(ValueError):
+        metrics.timed("hook", failing)()
+
+    async def coro():
+        await asyncio.sleep(0)
+        return "done"
+
+    assert asyncio.run(metrics.timed("hook", coro)()) == "done"
+    assert metrics.histograms["hook"].count == 2
+
+
+class _Logger:
+    def __init__(self):
+        self.finalized = None
+
+    def finalize(self, **fields):
+        self.finalized = fields
+
+
+def test_loop_records_phases_and_dumps_at_shutdown(tmp_path):
+    dump_path = tmp_path / "metrics.json"
+    metrics = TickMetrics(profile_every_n_ticks=2, dump_path=str(dump_path))
+    logger = _Logger()
+    loop = None
+
+    def post_tick():
+        if loop.tick_id == 4:
+            loop.request_stop()
+
+    loop = HeartbeatLoop(on_tick=lambda: None, logger=logger, metrics=metrics)
+    loop.register_task(post_tick, phase=PHASE_POST_TICK)
+    loop.run()
+
+    snap = logger.finalized["tick_metrics"]
+    assert snap["phases"]["tick"]["count"] == 4
+    assert snap["phases"]["on_tick"]["count"] == 4
+    assert snap["phases"]["post_tick"]["count"] == 4
+    assert snap["profile"]["profiled_ticks"] == 2
+    assert snap["profile"]["top"]
+    assert json.loads(dump_path.read_text()) == json.loads(json.dumps(snap))
+
+
+def test_loop_without_metrics_has_no_snapshot():
+    loop = HeartbeatLoop(on_tick=lambda: None)
+    loop.request_stop()
+    loop.run()
+    assert loop.metrics_snapshot() is None
@@ -0,0 +1,119 @@
+# lillycore/tests/test_tick_offload.py
+
+from __future__ import annotations
+
+import concurrent.futures
+import time
+
+from lillycore.runtime.heartbeat import HeartbeatLoop
+from lillycore.runtime.tick_offload import OffloadTimeout, TickOffloader
+
+
+class _ManualExecutor(concurrent.futures.Executor):
+    """Futures the test completes by hand, in any order."""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+        self.futures.append(future)
+        return future
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _square(x):
+    return x * x
+
+
+def _errors():
+    errors = []
+    return errors, lambda exc, where: errors.append((type(exc), where))
+
+
+def test_results_are_delivered_in_submission_order():
+    executor = _ManualExecutor()
+    offloader = TickOffloader(executor=executor)
+    results = []
+    offloader.declare(
+        _square, on_result=lambda result, tick_id: results.append((tick_id, result))
+    )
+    errors, on_error = _errors()
+    offloader.submit_due(1, on_error)
+    offloader.submit_due(2, on_error)
+
+    executor.futures[1].set_result("second")
+    offloader.collect(on_error)
+    assert results == []
+
+    executor.futures[0].set_result("first")
+    offloader.collect(on_error)
+    assert results == [(1, "first"), (2, "second")]
+    assert errors == []
+
+
+def test_full_window_skips_due_submissions():
+    executor = _ManualExecutor()
+    offloader = TickOffloader(executor=executor, max_in_flight=2)
+    task = offloader.declare(_square, every_n_ticks=1)
+    for tick_id in range(1, 5):
+        offloader.submit_due(tick_id)
+    assert (task.submitted, task.skipped) == (2, 2)
+    assert offloader.in_flight == 2
+
+
+def test_every_n_ticks():
+    executor = _ManualExecutor()
+    offloader = TickOffloader(executor=executor)
+    task = offloader.declare(_square, every_n_ticks=3)
+    for tick_id in range(1, 7):
+        offloader.submit_due(tick_id)
+    assert task.submitted == 2
+
+
+def test_failures_and_missed_deadlines_are_reported():
+    executor = _ManualExecutor()
+    clock = _FakeClock()
+    offloader = TickOffloader(executor=executor, clock=clock)
+    task = offloader.declare(_square, deadline_sec=1.0, name="crunch")
+    errors, on_error = _errors()
+
+    offloader.submit_due(1, on_error)
+    executor.futures[0].set_exception(ValueError("worker failed"))
+    offloader.collect(on_error)
+
+    offloader.submit_due(2, on_error)
+    clock.now = 2.0
+    offloader.collect(on_error)
+
+    assert errors == [
+        (ValueError, "runtime.offload.crunch"),
+        (OffloadTimeout, "runtime.offload.crunch"),
+    ]
+    assert (task.failed, task.timed_out) == (1, 1)
+    # The running future could not be cancelled: it keeps its slot.
+    assert offloader.in_flight == 1
+
+
+def test_loop_runs_offloaded_work_in_a_worker_process():
+    results = []
+    loop = None
+
+    def on_result(result, tick_id):
+        results.append((tick_id, result))
+        loop.request_stop()
+
+    loop = HeartbeatLoop(on_tick=lambda: time.sleep(0.005))
+    loop.offload_task(_square, args=(3,), every_n_ticks=1, on_result=on_result)
+    loop.run()
+
+    assert results[0] == (1, 9)
+    assert loop.offload_stats()["in_flight"] == 0
@@ -0,0 +1,120 @@
+# lillycore/tests/test_tick_pipeline.py
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from lillycore.runtime.heartbeat import HeartbeatLoop, RuntimeStopRequested
+from lillycore.runtime.tick_pipeline import (
+    PHASE_POST_TICK,
+    PHASE_PRE_TICK,
+    PHASE_TICK,
+    TickPipeline,
+)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _no_errors(exc, where):
+    raise AssertionError(f"unexpected error at {where}: {exc!r}")
+
+
+def test_priority_then_registration_order():
+    pipeline = TickPipeline()
+    ran = []
+    pipeline.register(lambda: ran.append("low"), priority=-1)
+    pipeline.register(lambda: ran.append("first"))
+    pipeline.register(lambda: ran.append("high"), priority=5)
+    pipeline.register(lambda: ran.append("second"))
+    pipeline.run_phase(PHASE_TICK, _no_errors)
+    assert ran == ["high", "first", "second", "low"]
+
+
+def test_budget_defers_and_resumes_at_first_skipped_task():
+    clock = _FakeClock()
+    pipeline = TickPipeline({PHASE_TICK: 1.0}, clock=clock)
+    ran = []
+
+    def task(name):
+        def fn():
+            ran.append(name)
+            clock.now += 0.6
+
+        return fn
+
+    tasks = [pipeline.register(task(name), name=name) for name in "abc"]
+    pipeline.run_phase(PHASE_TICK, _no_errors)
+    assert ran == ["a", "b"]
+    ran.clear()
+    pipeline.run_phase(PHASE_TICK, _no_errors)
+    assert ran == ["c", "a"]
+    assert [t.deferred for t in tasks] == [0, 1, 1]
+
+
+def test_failing_task_is_isolated_and_stop_propagates():
+    pipeline = TickPipeline()
+    errors = []
+    ran = []
+
+    def failing():
+        raise ValueError("task failed")
+
+    pipeline.register(failing, name="bad")
+    pipeline.register(lambda: ran.append("after"))
+    pipeline.run_phase(PHASE_TICK, lambda exc, where: errors.append(where))
+    assert errors == ["runtime.tick.bad"]
+    assert ran == ["after"]
+
+    def stop():
+        raise RuntimeStopRequested()
+
+    pipeline.register(stop, priority=1)
+    with pytest.raises(RuntimeStopRequested):
+        pipeline.run_phase(PHASE_TICK, _no_errors)
+
+
+def test_async_phase_awaits_coroutine_tasks():
+    pipeline = TickPipeline()
+    ran = []
+
+    async def coro():
+        await asyncio.sleep(0)
+        ran.append("coro")
+
+    pipeline.register(coro)
+    pipeline.register(lambda: ran.append("plain"))
+    asyncio.run(pipeline.run_phase_async(PHASE_TICK, _no_errors))
+    assert ran == ["coro", "plain"]
+
+
+def test_unknown_phases_are_rejected():
+    with pytest.raises(ValueError):
+        TickPipeline({"later": 1.0})
+    with pytest.raises(ValueError):
+        TickPipeline().register(lambda: None, phase="later")
+
+
+def test_loop_runs_phases_around_on_tick():
+    ran = []
+    loop = None
+
+    def on_tick():
+        ran.append(PHASE_TICK)
+
+    def post_tick():
+        ran.append(PHASE_POST_TICK)
+        loop.request_stop()
+
+    loop = HeartbeatLoop(on_tick=on_tick)
+    loop.register_task(lambda: ran.append(PHASE_PRE_TICK), phase=PHASE_PRE_TICK)
+    loop.register_task(post_tick, phase=PHASE_POST_TICK)
+    loop.run()
+    assert ran == [PHASE_PRE_TICK, PHASE_TICK, PHASE_POST_TICK]
@@ -0,0 +1,88 @@
+# lillycore/tests/test_tick_scheduler.py
+
+from __future__ import annotations
+
+import pytest
+
+from lillycore.runtime.clock import VirtualClock
+from lillycore.runtime.heartbeat import HeartbeatLoop
+from lillycore.runtime.tick_scheduler import (
+    OVERRUN_CATCH_UP,
+    OVERRUN_COALESCE,
+    OVERRUN_SKIP,
+    TickScheduler,
+)
+
+
+def _scheduler(policy):
+    scheduler = TickScheduler(1.0, policy=policy, clock=lambda: 0.0)
+    scheduler.start(now=0.0)
+    scheduler.begin_tick(now=0.0)
+    return scheduler
+
+
+def test_deadlines_stay_on_the_grid_despite_tick_work():
+    scheduler = _scheduler(OVERRUN_CATCH_UP)
+    # A tick that starts 0.25s late is not carried into the next period.
+    assert scheduler.remaining(now=0.75) == pytest.approx(0.25)
+    scheduler.begin_tick(now=1.25)
+    assert scheduler.lag_sec == pytest.approx(0.25)
+    assert scheduler.remaining(now=1.5) == pytest.approx(0.5)
+
+
+def test_catch_up_runs_missed_ticks_back_to_back():
+    scheduler = _scheduler(OVERRUN_CATCH_UP)
+    scheduler.begin_tick(now=3.5)
+    assert scheduler.remaining(now=3.5) <= 0
+    scheduler.begin_tick(now=3.5)
+    assert scheduler.remaining(now=3.5) <= 0
+    assert scheduler.stats()["missed_ticks"] == 0
+
+
+def test_skip_drops_missed_ticks_and_keeps_the_grid():
+    scheduler = _scheduler(OVERRUN_SKIP)
+    scheduler.begin_tick(now=3.5)
+    assert scheduler.remaining(now=3.5) == pytest.approx(0.5)
+    stats = scheduler.stats()
+    assert stats["missed_ticks"] == 2
+    assert stats["overruns"] == 1
+
+
+def test_coalesce_reanchors_the_grid_to_now():
+    scheduler = _scheduler(OVERRUN_COALESCE)
+    scheduler.begin_tick(now=3.5)
+    assert scheduler.remaining(now=3.5) == pytest.approx(1.0)
+    assert scheduler.stats()["missed_ticks"] == 2
+
+
+def test_jitter_tracks_period_deviation():
+    scheduler = _scheduler(OVERRUN_CATCH_UP)
+    scheduler.begin_tick(now=1.0)
+    assert scheduler.jitter_sec == 0.0
+    scheduler.begin_tick(now=2.16)
+    assert scheduler.jitter_sec == pytest.approx(0.16 / 16)
+
+
+def test_invalid_arguments_are_rejected():
+    with pytest.raises(ValueError):
+        TickScheduler(0)
+    with pytest.raises(ValueError):
+        TickScheduler(1.0, policy="later")
+
+
+def test_loop_ticks_on_the_interval_grid():
+    clock = VirtualClock()
+    starts = []
+
+    def on_tick():
+        starts.append(clock.monotonic())
+        # Tick work costs 30% of the interval.
+        clock.advance(0.003)
+        if len(starts) == 5:
+            loop.request_stop("done")
+
+    loop = HeartbeatLoop(on_tick=on_tick, tick_interval_sec=0.01, clock=clock)
+    loop.run()
+
+    assert starts == pytest.approx([0.0, 0.01, 0.02, 0.03, 0.04])
+    assert loop.timing_stats()["max_lag_ms"] == pytest.approx(0.0, abs=1e-6)
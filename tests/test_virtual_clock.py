@@ -0,0 +1,73 @@
+# lillycore/tests/test_virtual_clock.py
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+
+from lillycore.runtime.clock import VirtualClock
+from lillycore.runtime.error_envelopes import wrap_exception
+from lillycore.runtime.interactive_runner import run_interactive
+from lillycore.runtime.runtime_logger import RuntimeLogger
+
+
+def test_idle_wait_advances_virtual_time_instantly():
+    clock = VirtualClock(start_epoch=1_000.0)
+    event = threading.Event()
+    started = time.monotonic()
+    assert clock.wait(event, 3600.0) is False
+    assert time.monotonic() - started < 1.0
+    assert clock.monotonic() == 3600.0
+    assert clock.time() == 4600.0
+
+    event.set()
+    assert clock.wait(event, 5.0) is True
+    assert clock.monotonic() == 3600.0
+
+
+def test_envelopes_are_stamped_by_the_runtime_clock():
+    clock = VirtualClock(start_epoch=50.0)
+    clock.advance(2.5)
+    assert wrap_exception(ValueError("x"), clock=clock).ts == 52.5
+    assert wrap_exception(ValueError("x"), clock=7).ts == 7.0
+
+
+def _fast_forward_run(ticks):
+    clock = VirtualClock(start_epoch=1_700_000_000.0)
+    stream = io.StringIO()
+    logger = RuntimeLogger(stream=stream, clock=clock)
+    settings = {
+        "runtime_logging": {
+            "heartbeat_enabled": True,
+            "heartbeat_every_n_ticks": 100,
+            "include_tick_timing": True,
+        }
+    }
+    run_interactive(
+        settings_loader=lambda: settings,
+        logger=logger,
+        ingress_adapter=None,
+        envelope_factory=wrap_exception,
+        envelope_sink=None,
+        tick_interval_sec=1.0,
+        max_ticks=ticks,
+        clock=clock,
+    ).run()
+    return clock, [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_fast_forward_runs_are_reproducible():
+    started = time.monotonic()
+    clock, first = _fast_forward_run(1_000)
+    _, second = _fast_forward_run(1_000)
+
+    # 1,000 one-second ticks in (much) less than a second of wall time each.
+    assert time.monotonic() - started < 10.0
+    assert clock.monotonic() == 999.0
+    assert first == second
+
+    heartbeats = [r for r in first if r["event"] == "runtime.heartbeat.tick"]
+    assert len(heartbeats) == 10
+    assert heartbeats[1]["fields"]["tick_dt_seconds"] == 100.0
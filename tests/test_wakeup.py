@@ -0,0 +1,68 @@
+# lillycore/tests/test_wakeup.py
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from lillycore.runtime.async_heartbeat import AsyncHeartbeatLoop
+from lillycore.runtime.command_ingress import signal_wakeup
+from lillycore.runtime.heartbeat import HeartbeatLoop, RuntimeStopRequested
+
+
+class _WakeableIngress:
+    """Delivers one command from another thread, then asks the loop to stop."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.ready = threading.Event()
+        self.polled_at = []
+        self._wakeup = None
+
+    def set_wakeup(self, callback):
+        self._wakeup = callback
+
+    def start(self):
+        def arrive():
+            time.sleep(self.delay)
+            self.ready.set()
+            self._wakeup()
+
+        threading.Thread(target=arrive, daemon=True).start()
+
+    def poll(self):
+        if self.ready.is_set():
+            self.polled_at.append(time.monotonic())
+            raise RuntimeStopRequested()
+
+
+@pytest.mark.parametrize("loop_cls", [HeartbeatLoop, AsyncHeartbeatLoop])
+def test_input_is_dispatched_without_waiting_for_the_tick(loop_cls):
+    ingress = _WakeableIngress(delay=0.05)
+    loop = loop_cls(ingress=ingress, tick_interval_sec=10.0)
+    ingress.start()
+    started = time.monotonic()
+    loop.run()
+
+    # A 10s tick interval: only the wakeup explains a prompt poll.
+    assert ingress.polled_at
+    assert ingress.polled_at[0] - started < 2.0
+    assert loop.tick_id == 1
+
+
+def test_request_stop_from_another_thread_ends_the_idle_wait():
+    loop = HeartbeatLoop(tick_interval_sec=10.0)
+    threading.Timer(0.05, loop.request_stop).start()
+    started = time.monotonic()
+    loop.run()
+    assert time.monotonic() - started < 2.0
+
+
+def test_signal_wakeup_never_raises():
+    def failing():
+        raise OSError("pipe closed")
+
+    signal_wakeup(None)
+    signal_wakeup(failing)